@@ -1,5 +1,10 @@
 # custom_type_handlers.py
 
+import sys
+import json
+import array
+import base64
+
 import customtkinter as ctk
 
 from GuiFramework.utilities.config.custom_type_handler_base import CustomTypeHandlerBase
@@ -113,3 +118,79 @@ class TupleTypeHandler(CustomTypeHandlerBase):
     def validate_serialization(self) -> None:
         """Validate the serialization of the test value."""
         super().validate_serialization()
+
+
+class JsonTypeHandler(CustomTypeHandlerBase):
+    """Stores dicts, lists or tuples as compact JSON, keeping the item types and any nesting.
+
+    JSON has no tuples, nested tuples come back as lists.
+    """
+
+    def __init__(self, type_: type = dict):
+        if type_ not in (dict, list, tuple):
+            raise TypeError(f"JsonTypeHandler handles dict, list or tuple, got {type_.__name__}.")
+        self.type_ = type_
+
+    def serialize(self, value) -> str:
+        """Convert the container to JSON."""
+        self.validate_type(value, self.type_, self.type_.__name__)
+        # The ConfigParser interpolates %, which JSON only has inside strings where \u0025 is equivalent
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).replace("%", "\\u0025")
+
+    def deserialize(self, value: str):
+        """Convert JSON to the container."""
+        self.validate_type(value, str, "string")
+        container = json.loads(value)
+        return container if type(container) is self.type_ else self.type_(container)
+
+    def get_type(self) -> type:
+        """Return the Python type this handler is responsible for."""
+        return self.type_
+
+    def get_test_value(self):
+        """Provides a default test value suitable for testing the serialize and deserialize methods."""
+        nested = [1, 2.5, "100%", None, {"enabled": True}]
+        return {"items": nested} if self.type_ is dict else self.type_(nested)
+
+    def validate_serialization(self) -> None:
+        """Validate the serialization of the test value."""
+        super().validate_serialization()
+
+
+class ArrayTypeHandler(CustomTypeHandlerBase):
+    """Stores array.array values as their typecode and little-endian bytes in base64.
+
+    Homogeneous numeric lists kept as arrays take a fraction of the space of their text form and
+    decode in one call. Typecodes whose item size depends on the platform, like "l", only load
+    where the size is the same.
+    """
+
+    def serialize(self, value: array.array) -> str:
+        """Convert the array to "typecode:base64"."""
+        self.validate_type(value, array.array, "array")
+        if sys.byteorder == "big":
+            value = array.array(value.typecode, value)
+            value.byteswap()
+        return f"{value.typecode}:{base64.b64encode(value.tobytes()).decode('ascii')}"
+
+    def deserialize(self, value: str) -> array.array:
+        """Convert "typecode:base64" to an array."""
+        self.validate_type(value, str, "string")
+        typecode, _, data = value.partition(":")
+        result = array.array(typecode)
+        result.frombytes(base64.b64decode(data, validate=True))  # Raises ValueError for partial items
+        if sys.byteorder == "big":
+            result.byteswap()
+        return result
+
+    def get_type(self) -> type:
+        """Return the Python type this handler is responsible for."""
+        return array.array
+
+    def get_test_value(self):
+        """Provides a default test value suitable for testing the serialize and deserialize methods."""
+        return array.array("d", [1.5, -2.0, 3.25])
+
+    def validate_serialization(self) -> None:
+        """Validate the serialization of the test value."""
+        super().validate_serialization()
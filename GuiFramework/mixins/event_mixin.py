@@ -13,6 +13,8 @@ def create_event_type_id() -> str:
 
 
 class EventMixin:
+    __slots__ = ()  # Lets slotted subclasses go without an instance dict
+
     def __init__(self):
         """Initialize the event mixin with default values."""
         self._subscribers: Dict[str, Set[Callable]] = defaultdict(set)
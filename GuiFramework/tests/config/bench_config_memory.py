@@ -0,0 +1,88 @@
+# GuiFramework/tests/config/bench_config_memory.py
+
+import gc
+import tracemalloc
+
+from threading import RLock
+from dataclasses import dataclass
+from collections import defaultdict
+from typing import Any, Callable, List
+
+from GuiFramework.utilities.config import ConfigKey
+from GuiFramework.utilities.config.config_types import ConfigVariable
+
+
+@dataclass(frozen=True)
+class _LegacyConfigKey:
+    """The ConfigKey as it was before it got slots."""
+    name: str
+    section: str = "Default"
+    type_: Any = None
+    save_to_file: bool = False
+    auto_save: bool = True
+    config_name: str = "Default"
+
+
+class _LegacyConfigVariable:
+    """The allocations a ConfigVariable made before: an instance dict, a subscriber table and a lock."""
+
+    def __init__(self, config_key: _LegacyConfigKey, value: Any, default_value: Any) -> None:
+        self._config_key = config_key
+        self._value = value
+        self._default_value = default_value
+        self._type_handler = int
+        self._subscribers = defaultdict(set)
+        self._lock = RLock()
+
+
+class BenchConfigMemory:
+    """Measures the memory held by keys and variables, without and with one subscriber on every tenth variable."""
+
+    def __init__(self, variable_count: int = 50000) -> None:
+        self.variable_count = variable_count
+
+    def _create(self, key_type: type, variable_type: type) -> List[Any]:
+        return [variable_type(key_type(f"option_{index}", f"section_{index % 100}", int, True), index, 0) for index in range(self.variable_count)]
+
+    @staticmethod
+    def _measure(build: Callable[[], Any]) -> int:
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+        del kept
+        return used
+
+    def run(self) -> None:
+        def callback(*args, **kwargs) -> None:
+            pass
+
+        def subscribed(key_type: type, variable_type: type) -> List[Any]:
+            variables = self._create(key_type, variable_type)
+            for variable in variables[::10]:
+                if isinstance(variable, ConfigVariable):
+                    variable.subscribe("value_changed", callback)
+                else:
+                    with variable._lock:
+                        variable._subscribers["value_changed"].add(callback)
+            return variables
+
+        print(f"{self.variable_count} variables")
+        print(f"{'layout':>10} {'subscribers':>12} {'total':>10} {'per variable':>14}")
+        for name, key_type, variable_type in (("legacy", _LegacyConfigKey, _LegacyConfigVariable), ("slotted", ConfigKey, ConfigVariable)):
+            for with_subscribers in (False, True):
+                build = (lambda: subscribed(key_type, variable_type)) if with_subscribers else (lambda: self._create(key_type, variable_type))
+                used = self._measure(build)
+                print(f"{name:>10} {('1 in 10' if with_subscribers else 'none'):>12} {used / 2 ** 20:>8.1f}MB {used / self.variable_count:>12.0f} B")
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchConfigMemory().run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,104 @@
+# GuiFramework/tests/config/bench_config_reads.py
+
+import sys
+import time
+import tempfile
+import threading
+
+from typing import Callable, List, Optional
+
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey
+from GuiFramework.utilities.config.internal._config_file_handler import _ConfigFileHandler
+
+
+class BenchConfigReads:
+    """Measures worker threads reading settings while the UI thread saves one setting after another.
+
+    The reads run once through the snapshots and once holding the handler lock around every read, as
+    the read path did before. Every save renders the custom INI under the lock, which locked reads
+    have to wait for.
+    """
+
+    def __init__(self, reader_count: int = 4, section_count: int = 50, options_per_section: int = 200, duration: float = 2.0,
+                 base_directory: Optional[str] = None) -> None:
+        """Pass base_directory to run on a specific file system instead of the temp directory."""
+        self.reader_count = reader_count
+        self.section_count = section_count
+        self.options_per_section = options_per_section
+        self.duration = duration
+        self.reads_per_pause = 100
+        self.base_directory = base_directory
+
+    def _read_loop(self, read: Callable[[int], object], stop: threading.Event, latencies: List[List[float]], index: int) -> None:
+        samples, option = [], 0
+        while not stop.is_set():
+            for _ in range(self.reads_per_pause):
+                start = time.perf_counter()
+                read(option)
+                samples.append(time.perf_counter() - start)
+                option = (option + 7) % self.options_per_section
+            time.sleep(0)  # Workers do other things between reads
+        latencies[index] = samples
+
+    def _write_loop(self, stop: threading.Event, volume_key: ConfigKey, counts: List[int]) -> None:
+        value = 0
+        while not stop.is_set():
+            value += 1
+            ConfigHandler.set_variable_value(volume_key, value)
+        counts.append(value)
+
+    def _measure(self, read: Callable[[int], object], volume_key: Optional[ConfigKey]) -> tuple:
+        stop = threading.Event()
+        latencies: List[List[float]] = [[] for _ in range(self.reader_count)]
+        writes: List[int] = []
+        threads = [threading.Thread(target=self._read_loop, args=(read, stop, latencies, index)) for index in range(self.reader_count)]
+        if volume_key is not None:
+            threads.append(threading.Thread(target=self._write_loop, args=(stop, volume_key, writes)))
+        for thread in threads:
+            thread.start()
+        time.sleep(self.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        samples = sorted(sample for reader in latencies for sample in reader)
+        percentile = samples[int(len(samples) * 0.99)] if samples else 0.0
+        return len(samples) / self.duration, percentile, (writes[0] / self.duration if writes else 0.0)
+
+    def _run(self, root: str) -> None:
+        config_name = "bench_reads"
+        default_config = {
+            f"section_{index}": {f"option_{option}": f"value {option}" for option in range(self.options_per_section)}
+            for index in range(self.section_count)
+        }
+        default_config["audio"] = {"volume": "0"}
+        ConfigHandler.add_config(config_name, ConfigFileHandlerConfig(config_path=root, save_delay=None), default_config)
+        volume_key = ConfigKey("volume", "audio", int, True, True, config_name)
+        ConfigHandler.add_variable(volume_key, 0, 0)
+
+        def snapshot_read(option: int) -> object:
+            return ConfigFileHandler.get_setting(config_name, "section_3", f"option_{option}")
+
+        def locked_read(option: int) -> object:
+            with _ConfigFileHandler.lock:
+                return ConfigFileHandler.get_setting(config_name, "section_3", f"option_{option}")
+
+        print(f"{self.reader_count} readers, {self.section_count * self.options_per_section} settings")
+        print(f"{'reads':>10} {'writer':>7} {'reads/s':>12} {'p99 read':>12} {'writes/s':>10}")
+        for name, read in (("locked", locked_read), ("snapshot", snapshot_read)):
+            for writer in (False, True):
+                reads, p99, writes = self._measure(read, volume_key if writer else None)
+                print(f"{name:>10} {('yes' if writer else 'no'):>7} {reads:>12.0f} {p99 * 1e6:>10.1f}us {writes:>10.0f}")
+
+    def run(self) -> None:
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchConfigReads(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,70 @@
+# GuiFramework/tests/config/bench_config_registration.py
+
+import sys
+import time
+import tempfile
+
+from typing import Callable, List, Optional
+
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandlerConfig, ConfigKey, ConfigVariable
+
+
+class BenchConfigRegistration:
+    """Measures registering variables at startup one at a time and in bulk.
+
+    The keys save to file with auto save and no save delay, so every single registration writes
+    the custom INI while a bulk registration writes it once.
+    """
+
+    def __init__(self, variable_count: int = 2000, section_count: int = 20, base_directory: Optional[str] = None) -> None:
+        """Pass base_directory to run on a specific file system instead of the temp directory."""
+        self.variable_count = variable_count
+        self.section_count = section_count
+        self.base_directory = base_directory
+
+    @staticmethod
+    def _time(action: Callable[[], None]) -> float:
+        start = time.perf_counter()
+        action()
+        return time.perf_counter() - start
+
+    def _keys(self, config_name: str) -> List[ConfigKey]:
+        return [ConfigKey(f"option_{index}", f"section_{index % self.section_count}", int, True, True, config_name) for index in range(self.variable_count)]
+
+    def _run(self, root: str) -> None:
+        print(f"{self.variable_count} variables in {self.section_count} sections")
+        print(f"{'registration':>14} {'from file':>10} {'total':>10} {'per variable':>14}")
+        for init_from_file in (False, True):
+            for bulk in (False, True):
+                config_name = f"bench_registration_{int(init_from_file)}_{int(bulk)}"
+                handler_config = ConfigFileHandlerConfig(
+                    config_path=root,
+                    default_config_name=f"{config_name}_default.ini",
+                    custom_config_name=f"{config_name}_custom.ini",
+                    save_delay=None
+                )
+                ConfigHandler.add_config(config_name, handler_config, {"window": {"title": "Title"}})
+                keys = self._keys(config_name)
+                if init_from_file:
+                    # Half of the values are stored already, the others are saved as new defaults
+                    ConfigHandler.save_settings([(config_key, 1) for config_key in keys[::2]])
+                if bulk:
+                    elapsed = self._time(lambda: ConfigHandler.add_variables([(ConfigVariable(config_key, 0, 0), init_from_file) for config_key in keys]))
+                else:
+                    elapsed = self._time(lambda: [ConfigHandler.add_variable(config_key, 0, 0, init_from_file) for config_key in keys])
+                name = "bulk" if bulk else "single"
+                print(f"{name:>14} {('yes' if init_from_file else 'no'):>10} {elapsed * 1000:>8.0f}ms {elapsed / self.variable_count * 1e6:>12.1f}us")
+
+    def run(self) -> None:
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchConfigRegistration(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
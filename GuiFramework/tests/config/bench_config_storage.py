@@ -0,0 +1,66 @@
+# GuiFramework/tests/config/bench_config_storage.py
+
+import sys
+import time
+import tempfile
+
+from typing import Callable, Optional
+
+from GuiFramework.utilities.config import ConfigFileHandler, ConfigFileHandlerConfig
+
+
+class BenchConfigStorage:
+    """Compares the INI storage, the INI storage with a journal and the SQLite storage on loading a large
+    custom configuration and on saving single settings."""
+
+    def __init__(self, section_count: int = 100, options_per_section: int = 200, save_count: int = 200,
+                 base_directory: Optional[str] = None) -> None:
+        """Pass base_directory to run on a specific file system instead of the temp directory."""
+        self.section_count = section_count
+        self.options_per_section = options_per_section
+        self.save_count = save_count
+        self.base_directory = base_directory
+
+    @staticmethod
+    def _time(function: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    def _default_config(self) -> dict:
+        return {
+            f"section_{index}": {f"option_{option}": f"value {option}" for option in range(self.options_per_section)}
+            for index in range(self.section_count)
+        }
+
+    def _save_settings(self, config_name: str) -> None:
+        for index in range(self.save_count):
+            ConfigFileHandler.save_setting(config_name, f"section_{index % self.section_count}", "option_0", f"saved {index}")
+
+    def _run(self, root: str) -> None:
+        default_config = self._default_config()
+        setting_count = self.section_count * self.options_per_section
+        print(f"{setting_count} settings, {self.save_count} saves")
+        print(f"{'storage':>12} {'create':>10} {'load':>10} {'per save':>10}")
+        for name, storage, journal in (("ini", "ini", False), ("ini+journal", "ini", True), ("sqlite", "sqlite", False)):
+            def handler_config() -> ConfigFileHandlerConfig:
+                return ConfigFileHandlerConfig(config_path=f"{root}/{name}", custom_config_name="custom.ini",
+                                               save_delay=None, storage=storage, journal=journal)
+            create_time = self._time(lambda: ConfigFileHandler.add_config(f"bench_{name}", handler_config(), default_config))
+            save_time = self._time(lambda: self._save_settings(f"bench_{name}")) / self.save_count
+            load_time = self._time(lambda: ConfigFileHandler.add_config(f"bench_{name}_load", handler_config(), default_config))
+            print(f"{name:>12} {create_time:>10.3f} {load_time:>10.3f} {save_time * 1000:>8.3f}ms")
+
+    def run(self) -> None:
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchConfigStorage(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
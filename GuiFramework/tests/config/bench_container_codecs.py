@@ -0,0 +1,57 @@
+# GuiFramework/tests/config/bench_container_codecs.py
+
+import time
+import array
+import random
+
+from typing import Any, Callable
+
+from GuiFramework.custom_type_handlers import ListTypeHandler, JsonTypeHandler, ArrayTypeHandler
+
+
+class BenchContainerCodecs:
+    """Measures the container type handlers on large numeric lists: stored size, encode and decode time, and if the values survive."""
+
+    def __init__(self, element_count: int = 100000, repeats: int = 5) -> None:
+        self.element_count = element_count
+        self.repeats = repeats
+
+    def _time(self, action: Callable[[], Any]) -> float:
+        best = float("inf")
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            action()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def run(self) -> None:
+        generator = random.Random(0)
+        values = {
+            "ints": [generator.randrange(-10 ** 6, 10 ** 6) for _ in range(self.element_count)],
+            "floats": [generator.uniform(-1000.0, 1000.0) for _ in range(self.element_count)],
+        }
+        typecodes = {"ints": "i", "floats": "d"}
+        print(f"{self.element_count} elements, best of {self.repeats}")
+        print(f"{'values':>8} {'handler':>8} {'size':>10} {'encode':>10} {'decode':>10} {'lossless':>9}")
+        for kind, items in values.items():
+            codecs = (
+                ("list", ListTypeHandler(), items),
+                ("json", JsonTypeHandler(list), items),
+                ("array", ArrayTypeHandler(), array.array(typecodes[kind], items)),
+            )
+            for name, handler, value in codecs:
+                encoded = handler.serialize(value)
+                lossless = list(handler.deserialize(encoded)) == items
+                encode = self._time(lambda: handler.serialize(value))
+                decode = self._time(lambda: handler.deserialize(encoded))
+                print(f"{kind:>8} {name:>8} {len(encoded) / 1024:>8.0f}KB {encode * 1000:>8.1f}ms {decode * 1000:>8.1f}ms {('yes' if lossless else 'no'):>9}")
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchContainerCodecs().run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
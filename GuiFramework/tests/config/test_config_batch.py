@@ -0,0 +1,138 @@
+# GuiFramework/tests/config/test_config_batch.py
+
+from typing import Any, List
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandlerConfig, ConfigKey
+
+
+class TestConfigBatch:
+    """Test class for ConfigHandler.batch."""
+
+    def __init__(self) -> None:
+        """Initialize two configurations that write every auto save at once."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_batch_config"
+        self.other_config_name: str = "test_batch_other_config"
+        self.handler_configs = {}
+        for config_name in (self.config_name, self.other_config_name):
+            self.handler_configs[config_name] = ConfigFileHandlerConfig(
+                config_path=self.config_path,
+                default_config_name=f"{config_name}_default.ini",
+                custom_config_name=f"{config_name}_custom.ini",
+                save_delay=None
+            )
+            ConfigHandler.add_config(config_name, self.handler_configs[config_name], {"values": {"volume": "0", "title": "Title"}})
+        self.volume_key = ConfigKey("volume", "values", int, True, True, self.config_name)
+        self.title_key = ConfigKey("title", "values", str, True, True, self.config_name)
+        self.other_key = ConfigKey("volume", "values", int, True, True, self.other_config_name)
+        ConfigHandler.add_variable(self.volume_key, 0, 0)
+        ConfigHandler.add_variable(self.title_key, "Title", "Title")
+        ConfigHandler.add_variable(self.other_key, 0, 0)
+        self.notifications: List[Any] = []
+        for config_key in (self.volume_key, self.title_key, self.other_key):
+            ConfigHandler.get_variable(config_key).subscribe("value_changed", lambda event_type, new_value, name=config_key.name: self.notifications.append((name, new_value)))
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def file_contains(self, config_name: str, text: str) -> bool:
+        """Return True if the custom config file of config_name contains text."""
+        return text in FileOps.load_file(self.handler_configs[config_name].custom_config_path)
+
+    def test_deferred(self) -> None:
+        """Saves and notifications inside a batch are applied once when it ends."""
+        self.notifications.clear()
+        with ConfigHandler.batch():
+            for volume in range(1, 51):
+                ConfigHandler.set_variable_value(self.volume_key, volume)
+            ConfigHandler.set_variable_values([(self.title_key, "Batched"), (self.volume_key, 60)])
+            self.assert_equals([], self.notifications)
+            self.assert_equals(False, self.file_contains(self.config_name, "volume = 60"))
+            self.assert_equals(60, ConfigHandler.get_variable_value(self.volume_key))
+        self.assert_equals([("volume", 60), ("title", "Batched")], self.notifications)
+        self.assert_equals(True, self.file_contains(self.config_name, "volume = 60"))
+        self.assert_equals(True, self.file_contains(self.config_name, "title = Batched"))
+
+        # Values changed and set back within the batch do not notify
+        self.notifications.clear()
+        with ConfigHandler.batch():
+            ConfigHandler.set_variable_value(self.volume_key, 10)
+            ConfigHandler.set_variable_values([(self.title_key, "Changed"), (self.title_key, "Batched"), (self.volume_key, 65)])
+        self.assert_equals([("volume", 65)], self.notifications)
+
+    def test_scoped(self) -> None:
+        """A batch for one configuration leaves the other configurations alone."""
+        self.notifications.clear()
+        with ConfigHandler.batch(self.config_name):
+            ConfigHandler.set_variable_value(self.volume_key, 70)
+            ConfigHandler.set_variable_value(self.other_key, 80)
+            self.assert_equals([("volume", 80)], self.notifications)
+            self.assert_equals(True, self.file_contains(self.other_config_name, "volume = 80"))
+            self.assert_equals(False, self.file_contains(self.config_name, "volume = 70"))
+        self.assert_equals([("volume", 80), ("volume", 70)], self.notifications)
+
+    def test_nested(self) -> None:
+        """Nested batches are applied when the outermost one ends."""
+        self.notifications.clear()
+        with ConfigHandler.batch(self.config_name):
+            with ConfigHandler.batch(self.other_config_name):
+                ConfigHandler.set_variable_value(self.other_key, 90)
+            self.assert_equals([], self.notifications)
+        self.assert_equals([("volume", 90)], self.notifications)
+        self.assert_equals(True, self.file_contains(self.other_config_name, "volume = 90"))
+
+    def test_rollback(self) -> None:
+        """An exception leaving the batch restores values and settings and skips saves and notifications."""
+        self.notifications.clear()
+        try:
+            with ConfigHandler.batch():
+                ConfigHandler.set_variable_value(self.volume_key, 100)
+                ConfigHandler.set_variable_value(self.title_key, "Rolled back")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        self.assert_equals([], self.notifications)
+        self.assert_equals(70, ConfigHandler.get_variable_value(self.volume_key))
+        self.assert_equals("Batched", ConfigHandler.get_variable_value(self.title_key))
+        self.assert_equals("70", ConfigHandler.get_custom_config(self.config_name)["values"]["volume"])
+        self.assert_equals(False, self.file_contains(self.config_name, "Rolled back"))
+
+    def test_method(self) -> None:
+        """Run all batch tests and log results."""
+        for test in (self.test_deferred, self.test_scoped, self.test_nested, self.test_rollback):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigBatch()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
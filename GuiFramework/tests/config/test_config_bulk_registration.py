@@ -0,0 +1,120 @@
+# GuiFramework/tests/config/test_config_bulk_registration.py
+
+from typing import Any, List
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey, ConfigVariable
+from GuiFramework.utilities.config.exceptions import ConfigKeyAlreadyExists, ConfigKeyNotFound
+
+
+class TestConfigBulkRegistration:
+    """Test class for ConfigHandler.add_variables."""
+
+    def __init__(self) -> None:
+        """Initialize a configuration that writes every auto save at once."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_bulk_registration_config"
+        self.handler_config = ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name=f"{self.config_name}_default.ini",
+            custom_config_name=f"{self.config_name}_custom.ini",
+            save_delay=None
+        )
+        ConfigHandler.add_config(self.config_name, self.handler_config, {"window": {"width": "800", "title": "Title"}})
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def key(self, name: str, section: str = "values", type_: type = int, save_to_file: bool = True) -> ConfigKey:
+        return ConfigKey(name, section, type_, save_to_file, True, self.config_name)
+
+    def test_save_new_values(self) -> None:
+        """Values of keys that save to file are written together."""
+        keys = [self.key(f"option_{index}") for index in range(200)]
+        ConfigHandler.add_variables([ConfigVariable(config_key, index, 0) for index, config_key in enumerate(keys)])
+        self.assert_equals(199, ConfigHandler.get_variable_value(keys[199]))
+        content = FileOps.load_file(self.handler_config.custom_config_path)
+        self.assert_equals(True, "option_0 = 0" in content and "option_199 = 199" in content)
+        self.assert_equals("150", ConfigFileHandler.get_setting(self.config_name, "values", "option_150"))
+
+        # Keys that do not save to file leave it alone
+        ConfigHandler.add_variables([ConfigVariable(self.key("unsaved", save_to_file=False), 1, 0)])
+        self.assert_equals("NoDefaultValue", ConfigFileHandler.get_setting(self.config_name, "values", "unsaved"))
+
+    def test_init_from_file(self) -> None:
+        """Stored values replace the given ones and notify once, missing ones are saved."""
+        ConfigFileHandler.save_setting(self.config_name, "window", "height", "600")
+        width, height, depth = self.key("width", "window"), self.key("height", "window"), self.key("depth", "window")
+        notifications: List[Any] = []
+        height_variable = ConfigVariable(height, 480, 480)
+        height_variable.subscribe("value_changed", lambda event_type, new_value: notifications.append(new_value))
+        ConfigHandler.add_variables([(ConfigVariable(width, 1024, 1024), True), (height_variable, True), (ConfigVariable(depth, 32, 32), True)])
+        self.assert_equals([800, 600, 32], ConfigHandler.get_variable_values([width, height, depth]))
+        self.assert_equals([600], notifications)
+        self.assert_equals("32", ConfigFileHandler.get_setting(self.config_name, "window", "depth"))
+
+        # The single variant shares the path, a missing setting keeps the given value
+        ConfigHandler.add_variable(self.key("caption", "window", str, False), "Caption", "Caption", init_from_file=True)
+        self.assert_equals("Caption", ConfigHandler.get_variable_value(self.key("caption", "window", str, False)))
+
+    def test_unreadable_value(self) -> None:
+        """A stored value that does not deserialize keeps the given value and is not overwritten."""
+        ConfigFileHandler.save_setting(self.config_name, "broken", "count", "many")
+        count = self.key("count", "broken")
+        ConfigHandler.add_variables([(ConfigVariable(count, 3, 3), True)])
+        self.assert_equals(3, ConfigHandler.get_variable_value(count))
+        self.assert_equals("many", ConfigFileHandler.get_setting(self.config_name, "broken", "count"))
+
+    def test_all_or_none(self) -> None:
+        """A duplicate key registers none of the variables."""
+        fresh, duplicate = self.key("fresh"), self.key("option_0")
+        try:
+            ConfigHandler.add_variables([ConfigVariable(fresh, 1, 1), ConfigVariable(duplicate, 2, 2)])
+            self.assert_equals("ConfigKeyAlreadyExists", "no exception")
+        except ConfigKeyAlreadyExists:
+            self.success_count += 1
+        try:
+            ConfigHandler.get_variable(fresh)
+            self.assert_equals("ConfigKeyNotFound", "no exception")
+        except ConfigKeyNotFound:
+            self.success_count += 1
+        self.assert_equals(0, ConfigHandler.get_variable_value(duplicate))
+
+    def test_method(self) -> None:
+        """Run all bulk registration tests and log results."""
+        for test in (self.test_save_new_values, self.test_init_from_file, self.test_unreadable_value, self.test_all_or_none):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigBulkRegistration()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
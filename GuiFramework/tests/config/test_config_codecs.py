@@ -0,0 +1,163 @@
+# GuiFramework/tests/config/test_config_codecs.py
+
+from enum import IntEnum
+from typing import Any
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey, CustomTypeHandlerBase
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x, self.y = x, y
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and (other.x, other.y) == (self.x, self.y)
+
+
+class LabeledPoint(Point):
+    pass
+
+
+class Quality(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class PointTypeHandler(CustomTypeHandlerBase):
+    def serialize(self, value: Point) -> str:
+        """Convert a point to "x, y"."""
+        self.validate_type(value, Point, "Point")
+        return f"{value.x}, {value.y}"
+
+    def deserialize(self, value: str) -> Point:
+        """Convert "x, y" to a point."""
+        x, y = value.split(",")
+        return Point(int(x), int(y))
+
+    def get_type(self) -> type:
+        """Return the Python type this handler is responsible for."""
+        return Point
+
+    def get_test_value(self) -> Point:
+        """Provides a default test value suitable for testing the serialize and deserialize methods."""
+        return Point(1, 2)
+
+    def validate_serialization(self) -> None:
+        """Validate the serialization of the test value."""
+        super().validate_serialization()
+
+
+class LabeledPointTypeHandler(PointTypeHandler):
+    def deserialize(self, value: str) -> LabeledPoint:
+        """Convert "x, y" to a labeled point."""
+        point = super().deserialize(value)
+        return LabeledPoint(point.x, point.y)
+
+    def get_type(self) -> type:
+        """Return the Python type this handler is responsible for."""
+        return LabeledPoint
+
+    def get_test_value(self) -> LabeledPoint:
+        """Provides a default test value suitable for testing the serialize and deserialize methods."""
+        return LabeledPoint(1, 2)
+
+
+class TestConfigCodecs:
+    """Test class for the serialization of setting values."""
+
+    def __init__(self) -> None:
+        """Initialize a configuration with a type handler for points."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_codecs_config"
+        ConfigHandler.add_config(self.config_name, self.handler_config(self.config_name), {"flags": {"enabled": "False"}}, {Point: PointTypeHandler()})
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def handler_config(self, config_name: str) -> ConfigFileHandlerConfig:
+        return ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name=f"{config_name}_default.ini",
+            custom_config_name=f"{config_name}_custom.ini",
+            save_delay=None
+        )
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def key(self, name: str, type_: type, section: str = "values") -> ConfigKey:
+        return ConfigKey(name, section, type_, True, True, self.config_name)
+
+    def test_bool(self) -> None:
+        """Booleans accept the spellings of ConfigParser.getboolean and reject anything else."""
+        enabled = self.key("enabled", bool, "flags")
+        self.assert_equals(False, ConfigHandler.get_setting(enabled))
+        for text, expected in (("True", True), ("no", False), ("1", True), ("OFF", False), (" yes ", True)):
+            ConfigFileHandler.save_setting(self.config_name, "flags", "enabled", text)
+            self.assert_equals(expected, ConfigHandler.get_setting(enabled))
+        ConfigFileHandler.save_setting(self.config_name, "flags", "enabled", "maybe")
+        try:
+            ConfigHandler.get_setting(enabled)
+            self.assert_equals("ValueError", "no exception")
+        except ValueError:
+            self.success_count += 1
+
+        # A variable initialized from file keeps its value instead of turning "maybe" into True
+        ConfigHandler.add_variable(enabled, False, False, init_from_file=True)
+        self.assert_equals(False, ConfigHandler.get_variable_value(enabled))
+
+    def test_subclasses(self) -> None:
+        """Subclasses use the handler or basic type of their nearest base class."""
+        labeled = self.key("labeled", LabeledPoint)
+        ConfigHandler.save_setting(labeled, LabeledPoint(3, 4))
+        self.assert_equals("3, 4", ConfigFileHandler.get_setting(self.config_name, "values", "labeled"))
+        self.assert_equals(Point(3, 4), ConfigHandler.get_setting(labeled))
+
+        quality = self.key("quality", Quality)
+        ConfigHandler.add_variable(quality, Quality.HIGH, Quality.LOW)
+        self.assert_equals("2", ConfigFileHandler.get_setting(self.config_name, "values", "quality"))
+        self.assert_equals(Quality.HIGH, ConfigHandler.get_setting(quality))
+
+    def test_new_handlers(self) -> None:
+        """A handler added later replaces the one resolved from the base class."""
+        labeled = self.key("labeled", LabeledPoint)
+        other_config_name = f"{self.config_name}_other"
+        ConfigHandler.add_config(other_config_name, self.handler_config(other_config_name), {}, {LabeledPoint: LabeledPointTypeHandler()})
+        self.assert_equals(LabeledPoint(3, 4), ConfigHandler.get_setting(labeled))
+
+    def test_method(self) -> None:
+        """Run all codec tests and log results."""
+        for test in (self.test_bool, self.test_subclasses, self.test_new_handlers):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigCodecs()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
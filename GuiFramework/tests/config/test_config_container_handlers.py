@@ -0,0 +1,100 @@
+# GuiFramework/tests/config/test_config_container_handlers.py
+
+import array
+
+from typing import Any
+
+from GuiFramework.custom_type_handlers import JsonTypeHandler, ArrayTypeHandler
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey
+
+
+class TestConfigContainerHandlers:
+    """Test class for the JSON and array type handlers."""
+
+    def __init__(self) -> None:
+        """Initialize a configuration storing dicts as JSON and arrays in base64."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_container_handlers_config"
+        self.handler_config = self.create_handler_config()
+        ConfigHandler.add_config(self.config_name, self.handler_config, {}, {dict: JsonTypeHandler(), array.array: ArrayTypeHandler()})
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def create_handler_config(self) -> ConfigFileHandlerConfig:
+        return ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name=f"{self.config_name}_default.ini",
+            custom_config_name=f"{self.config_name}_custom.ini",
+            save_delay=None
+        )
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_json(self) -> None:
+        """Nested containers keep their item types, also with % in strings and across a reload."""
+        layout = {"panels": [{"name": "Files", "width": 250, "ratio": 0.25, "visible": True}], "title": "100% zoom", "icon": None}
+        layout_key = ConfigKey("layout", "window", dict, True, True, self.config_name)
+        ConfigHandler.add_variable(layout_key, layout, {})
+        self.assert_equals(layout, ConfigHandler.get_setting(layout_key))
+        reloaded = f"{self.config_name}_reloaded"
+        ConfigFileHandler.add_config(reloaded, self.create_handler_config())
+        self.assert_equals(JsonTypeHandler().serialize(layout), ConfigFileHandler.get_setting(reloaded, "window", "layout"))
+        ConfigHandler.add_variable(ConfigKey("layout", "window", dict, True, True, reloaded), {}, {}, init_from_file=True)
+        self.assert_equals(layout, ConfigHandler.get_variable_value(ConfigKey("layout", "window", dict, True, True, reloaded)))
+
+    def test_array(self) -> None:
+        """Arrays come back with their typecode and exact values."""
+        samples = array.array("d", [0.1 * index for index in range(1000)])
+        counts = array.array("i", [-5, 0, 2 ** 31 - 1])
+        for name, value in (("samples", samples), ("counts", counts)):
+            config_key = ConfigKey(name, "data", array.array, True, True, self.config_name)
+            ConfigHandler.save_setting(config_key, value)
+            self.assert_equals(value, ConfigHandler.get_setting(config_key))
+        self.assert_equals("i:", ConfigFileHandler.get_setting(self.config_name, "data", "counts")[:2])
+
+        # Data cut off in the middle of an item is rejected
+        ConfigFileHandler.save_setting(self.config_name, "data", "broken", "d:AAAA")
+        try:
+            ConfigHandler.get_setting(ConfigKey("broken", "data", array.array, True, True, self.config_name))
+            self.assert_equals("ValueError", "no exception")
+        except ValueError:
+            self.success_count += 1
+
+    def test_method(self) -> None:
+        """Run all container handler tests and log results."""
+        for test in (self.test_json, self.test_array):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigContainerHandlers()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,153 @@
+# GuiFramework/tests/config/test_config_journal.py
+
+import os
+import time
+
+from typing import Any, Optional, Tuple
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigFileHandler, ConfigFileHandlerConfig
+
+
+class TestConfigJournal:
+    """Test class for journaled custom configurations."""
+
+    def __init__(self) -> None:
+        """Initialize a journaled configuration that saves every change at once."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.default_config = {"window": {"title": "Test Application", "size": "1920, 1080"}}
+        self.config_name: str = "test_journal_config"
+        self.handler_config = self.create_handler_config()
+        ConfigFileHandler.add_config(self.config_name, self.handler_config, self.default_config)
+        self.reload_count: int = 0
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def create_handler_config(self, config_path: Optional[str] = None) -> ConfigFileHandlerConfig:
+        """Return a handler config for journaled files in config_path."""
+        return ConfigFileHandlerConfig(
+            config_path=config_path or self.config_path,
+            default_config_name="test_journal_default_config.ini",
+            custom_config_name="test_journal_custom_config.ini",
+            save_delay=None,
+            journal=True,
+            journal_compact_size=4096
+        )
+
+    def reload(self, handler_config: Optional[ConfigFileHandlerConfig] = None) -> Tuple[str, ConfigFileHandlerConfig]:
+        """Load a copy of the files into a new configuration, as a restarted application would."""
+        handler_config = handler_config or self.handler_config
+        self.reload_count += 1
+        config_name = f"{self.config_name}_reload{self.reload_count}"
+        reload_config = self.create_handler_config(FileOps.join_paths(self.config_path, f"reload{self.reload_count}"))
+        for source, destination in ((handler_config.default_config_path, reload_config.default_config_path),
+                                    (handler_config.custom_config_path, reload_config.custom_config_path),
+                                    (handler_config.journal_path, reload_config.journal_path)):
+            FileOps.copy_file(source, destination)
+        ConfigFileHandler.add_config(config_name, reload_config, self.default_config)
+        return config_name, reload_config
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_append_and_replay(self) -> None:
+        """Changes go to the journal instead of the INI and are replayed on load."""
+        ConfigFileHandler.save_setting(self.config_name, "window", "title", "Journaled")
+        ConfigFileHandler.save_setting(self.config_name, "extra", "value", "1")
+        ConfigFileHandler.reset_setting(self.config_name, "window", "size")
+        self.assert_equals(False, "Journaled" in FileOps.load_file(self.handler_config.custom_config_path))
+        self.assert_equals(3, len(FileOps.load_file(self.handler_config.journal_path).splitlines()))
+        reloaded, _ = self.reload()
+        self.assert_equals(ConfigFileHandler.get_custom_config(self.config_name), ConfigFileHandler.get_custom_config(reloaded))
+
+        ConfigFileHandler.reset_section(self.config_name, "extra")
+        ConfigFileHandler.reset_custom_config(self.config_name)
+        ConfigFileHandler.save_setting(self.config_name, "window", "size", "800, 600")
+        reloaded, _ = self.reload()
+        self.assert_equals({"window": {"title": "Test Application", "size": "800, 600"}}, ConfigFileHandler.get_custom_config(reloaded))
+
+    def test_torn_record(self) -> None:
+        """A record cut off by a crash is skipped and removed before the next append."""
+        _, crashed_config = self.reload()
+        with open(crashed_config.journal_path, "ab") as f:
+            f.write(b'["s","window","title","Tor')
+        reloaded, reload_config = self.reload(crashed_config)
+        self.assert_equals("800, 600", ConfigFileHandler.get_setting(reloaded, "window", "size"))
+        self.assert_equals(True, FileOps.load_file(reload_config.journal_path).endswith("\n"))
+        ConfigFileHandler.save_setting(reloaded, "window", "title", "After crash")
+        self.assert_equals("After crash", ConfigFileHandler.get_setting(self.reload(reload_config)[0], "window", "title"))
+
+    def test_compaction(self) -> None:
+        """A journal above journal_compact_size is folded into the INI in the background."""
+        for index in range(200):
+            ConfigFileHandler.save_setting(self.config_name, "bulk", f"key{index}", f"value{index}")
+        deadline = time.monotonic() + 5
+        while os.path.getsize(self.handler_config.journal_path) >= 4096 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assert_equals(True, os.path.getsize(self.handler_config.journal_path) < 4096)
+        self.assert_equals(True, "key100 = value100" in FileOps.load_file(self.handler_config.custom_config_path))
+        reloaded, _ = self.reload()
+        self.assert_equals("value199", ConfigFileHandler.get_setting(reloaded, "bulk", "key199"))
+
+        # An explicit save writes the INI and empties the journal
+        ConfigFileHandler.save_setting(self.config_name, "window", "title", "Saved")
+        ConfigFileHandler.save_custom_config_to_file(self.config_name)
+        self.assert_equals(0, os.path.getsize(self.handler_config.journal_path))
+        self.assert_equals("Saved", ConfigFileHandler.get_setting(self.reload()[0], "window", "title"))
+
+    def test_failed_write(self) -> None:
+        """A failed write of the INI raises, keeps the journal and leaves no temp file behind."""
+        reloaded, reload_config = self.reload()
+        ConfigFileHandler.save_setting(reloaded, "window", "title", "Kept")
+        journal_size = os.path.getsize(reload_config.journal_path)
+        os.remove(reload_config.custom_config_path)
+        os.mkdir(reload_config.custom_config_path)
+        try:
+            ConfigFileHandler.save_custom_config_to_file(reloaded)
+            self.assert_equals("ValueError", "no exception")
+        except ValueError:
+            self.success_count += 1
+        self.assert_equals(journal_size, os.path.getsize(reload_config.journal_path))
+        self.assert_equals([], [name for name in os.listdir(reload_config.config_path) if name.endswith(".tmp")])
+
+        os.rmdir(reload_config.custom_config_path)
+        ConfigFileHandler.save_custom_config_to_file(reloaded)
+        self.assert_equals(0, os.path.getsize(reload_config.journal_path))
+        self.assert_equals("Kept", ConfigFileHandler.get_setting(self.reload(reload_config)[0], "window", "title"))
+
+    def test_method(self) -> None:
+        """Run all journal tests and log results."""
+        for test in (self.test_append_and_replay, self.test_torn_record, self.test_compaction, self.test_failed_write):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigJournal()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
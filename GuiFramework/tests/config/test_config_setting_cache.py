@@ -0,0 +1,142 @@
+# GuiFramework/tests/config/test_config_setting_cache.py
+
+import os
+import configparser
+
+from typing import Any
+
+from GuiFramework.custom_type_handlers import JsonTypeHandler
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey
+
+
+class TestConfigSettingCache:
+    """Test class for the typed read cache of ConfigHandler.get_setting."""
+
+    def __init__(self) -> None:
+        """Initialize a configuration with settings in two sections."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_cache_config"
+        self.handler_config = ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name="test_cache_default_config.ini",
+            custom_config_name="test_cache_custom_config.ini",
+            save_delay=None
+        )
+        ConfigHandler.add_config(self.config_name, self.handler_config, {"audio": {"volume": "10", "muted": "0"}, "window": {"width": "800", "panels": "[1, 2, 3]"}}, {list: JsonTypeHandler(list)})
+        self.volume_key = ConfigKey("volume", "audio", int, True, True, self.config_name)
+        self.muted_key = ConfigKey("muted", "audio", int, True, True, self.config_name)
+        self.width_key = ConfigKey("width", "window", int, True, True, self.config_name)
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def read_all(self) -> None:
+        """Read every key once, filling the cache."""
+        for config_key in (self.volume_key, self.muted_key, self.width_key):
+            ConfigHandler.get_setting(config_key)
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_hits(self) -> None:
+        """Repeated reads are served from the cache with the deserialized type."""
+        ConfigHandler.clear_cache(reset_stats=True)
+        for _ in range(10):
+            self.assert_equals(10, ConfigHandler.get_setting(self.volume_key))
+        stats = ConfigHandler.cache_stats()
+        self.assert_equals((9, 1, 0.9), (stats["hits"], stats["misses"], stats["hit_rate"]))
+
+        # Values only found as fallback depend on the caller and are not cached
+        missing_key = ConfigKey("missing", "audio", int, True, True, self.config_name)
+        self.assert_equals(5, ConfigHandler.get_setting(missing_key, fallback_value=5))
+        self.assert_equals(7, ConfigHandler.get_setting(missing_key, fallback_value=7))
+        self.assert_equals(1, ConfigHandler.cache_stats()["size"])
+
+    def test_mutable_values(self) -> None:
+        """Mutable values are not shared, changing a returned list does not change the next read."""
+        panels_key = ConfigKey("panels", "window", list, True, True, self.config_name)
+        panels = ConfigHandler.get_setting(panels_key)
+        panels.append(99)
+        self.assert_equals([1, 2, 3], ConfigHandler.get_setting(panels_key))
+
+    def test_precise_invalidation(self) -> None:
+        """A change drops only the values of the changed option or section."""
+        ConfigHandler.clear_cache(reset_stats=True)
+        self.read_all()
+        ConfigHandler.save_setting(self.volume_key, 20)
+        self.assert_equals(20, ConfigHandler.get_setting(self.volume_key))
+        self.assert_equals(0, ConfigHandler.get_setting(self.muted_key))
+        self.assert_equals(800, ConfigHandler.get_setting(self.width_key))
+        stats = ConfigHandler.cache_stats()
+        self.assert_equals((2, 4), (stats["hits"], stats["misses"]))
+
+        # Changes through the file handler count too, option names are case insensitive
+        ConfigFileHandler.save_setting(self.config_name, "audio", "Volume", "30")
+        self.assert_equals(30, ConfigHandler.get_setting(self.volume_key))
+        ConfigHandler.reset_setting(self.volume_key)
+        self.assert_equals(10, ConfigHandler.get_setting(self.volume_key))
+
+        ConfigHandler.save_settings([(self.muted_key, 1), (self.width_key, 1024)])
+        self.assert_equals((1, 1024), (ConfigHandler.get_setting(self.muted_key), ConfigHandler.get_setting(self.width_key)))
+        ConfigHandler.clear_cache(reset_stats=True)
+        self.read_all()
+        ConfigHandler.reset_section(self.config_name, "audio")
+        self.assert_equals((0, 1024), (ConfigHandler.get_setting(self.muted_key), ConfigHandler.get_setting(self.width_key)))
+        stats = ConfigHandler.cache_stats()
+        self.assert_equals((1, 4), (stats["hits"], stats["misses"]))
+
+        ConfigHandler.reset_custom_config(self.config_name)
+        self.assert_equals(800, ConfigHandler.get_setting(self.width_key))
+
+    def test_reload(self) -> None:
+        """Reloading drops the values of the options changed in the file."""
+        ConfigHandler.clear_cache(reset_stats=True)
+        self.read_all()
+        parser = configparser.ConfigParser()
+        parser.read_dict({"audio": {"volume": "99", "muted": "0"}, "window": {"width": "800"}})
+        temp_path = self.handler_config.custom_config_path + ".external"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            parser.write(f)
+        os.replace(temp_path, self.handler_config.custom_config_path)
+        ConfigHandler.load_custom_config_from_file(self.config_name)
+        self.assert_equals(99, ConfigHandler.get_setting(self.volume_key))
+        self.assert_equals(800, ConfigHandler.get_setting(self.width_key))
+        stats = ConfigHandler.cache_stats()
+        self.assert_equals((1, 4), (stats["hits"], stats["misses"]))
+
+    def test_method(self) -> None:
+        """Run all setting cache tests and log results."""
+        for test in (self.test_hits, self.test_mutable_values, self.test_precise_invalidation, self.test_reload):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigSettingCache()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
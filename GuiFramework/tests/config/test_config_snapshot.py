@@ -0,0 +1,132 @@
+# GuiFramework/tests/config/test_config_snapshot.py
+
+import threading
+
+from typing import Any, List
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigFileHandler, ConfigFileHandlerConfig
+
+
+class TestConfigSnapshot:
+    """Test class for the lock-free reads of the ConfigFileHandler."""
+
+    def __init__(self) -> None:
+        """Initialize an INI and a lazily loaded SQLite configuration."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.default_config = {"window": {"title": "Title", "size": "800, 600"}, "paths": {"base": "/data"}}
+        self.config_name: str = "test_snapshot_config"
+        self.sqlite_config_name: str = "test_snapshot_sqlite_config"
+        for config_name, storage in ((self.config_name, "ini"), (self.sqlite_config_name, "sqlite")):
+            handler_config = ConfigFileHandlerConfig(
+                config_path=self.config_path,
+                default_config_name=f"{config_name}_default.ini",
+                custom_config_name=f"{config_name}_custom.ini",
+                save_delay=None,
+                storage=storage
+            )
+            ConfigFileHandler.add_config(config_name, handler_config, self.default_config)
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_reads_follow_writes(self) -> None:
+        """Every kind of change is visible to the next read, earlier results stay unchanged."""
+        before = ConfigFileHandler.get_custom_config(self.config_name)
+        ConfigFileHandler.save_setting(self.config_name, "window", "Title", "Saved")
+        self.assert_equals("Saved", ConfigFileHandler.get_setting(self.config_name, "window", "title"))
+        self.assert_equals("Title", before["window"]["title"])
+        self.assert_equals("Title", ConfigFileHandler.get_setting(self.config_name, "window", "title", force_default=True))
+        ConfigFileHandler.save_setting(self.config_name, "extra", "key", "value")
+        self.assert_equals("value", ConfigFileHandler.get_setting(self.config_name, "extra", "key"))
+        ConfigFileHandler.reset_section(self.config_name, "extra")
+        self.assert_equals("fallback", ConfigFileHandler.get_setting(self.config_name, "extra", "key", "fallback"))
+        ConfigFileHandler.reset_custom_config(self.config_name)
+        self.assert_equals("Title", ConfigFileHandler.get_setting(self.config_name, "window", "title"))
+
+        # Values with interpolation are resolved by the ConfigParser
+        ConfigFileHandler.save_setting(self.config_name, "paths", "cache", "%(base)s/cache")
+        self.assert_equals("/data/cache", ConfigFileHandler.get_setting(self.config_name, "paths", "cache"))
+
+    def test_config_copies(self) -> None:
+        """Changing a returned config does not change the published snapshot."""
+        for get_config in (ConfigFileHandler.get_custom_config, ConfigFileHandler.get_default_config):
+            config = get_config(self.config_name)
+            config["window"]["title"] = "Changed"
+            config["added"] = {}
+            self.assert_equals((False, False), ("Changed" in get_config(self.config_name)["window"].values(), "added" in get_config(self.config_name)))
+        self.assert_equals("Title", ConfigFileHandler.get_setting(self.config_name, "window", "title", force_default=True))
+
+    def test_lazy_sections(self) -> None:
+        """Sections a lazy storage has not loaded yet are read through the lock once."""
+        ConfigFileHandler.save_setting(self.sqlite_config_name, "plugins", "enabled", "a, b")
+        reloaded = f"{self.sqlite_config_name}_reloaded"
+        ConfigFileHandler.add_config(reloaded, ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name=f"{self.sqlite_config_name}_default.ini",
+            custom_config_name=f"{self.sqlite_config_name}_custom.ini",
+            storage="sqlite"
+        ), self.default_config)
+        self.assert_equals("a, b", ConfigFileHandler.get_setting(reloaded, "plugins", "enabled"))
+        self.assert_equals("NoDefaultValue", ConfigFileHandler.get_setting(reloaded, "missing", "key"))
+        self.assert_equals("Title", ConfigFileHandler.get_setting(reloaded, "window", "title"))
+        self.assert_equals(True, "plugins" in ConfigFileHandler.get_custom_config(reloaded))
+
+    def test_concurrent_reads(self) -> None:
+        """Readers on other threads only see values that were written."""
+        seen: List[str] = []
+        stop = threading.Event()
+
+        def read() -> None:
+            while not stop.is_set():
+                seen.append(ConfigFileHandler.get_setting(self.config_name, "window", "size"))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for index in range(200):
+            ConfigFileHandler.save_setting(self.config_name, "window", "size", f"{index}, {index}", auto_save=False)
+        stop.set()
+        for reader in readers:
+            reader.join()
+        self.assert_equals(True, set(seen) <= {"800, 600"} | {f"{index}, {index}" for index in range(200)})
+        self.assert_equals("199, 199", ConfigFileHandler.get_setting(self.config_name, "window", "size"))
+
+    def test_method(self) -> None:
+        """Run all snapshot tests and log results."""
+        for test in (self.test_reads_follow_writes, self.test_config_copies, self.test_lazy_sections, self.test_concurrent_reads):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigSnapshot()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
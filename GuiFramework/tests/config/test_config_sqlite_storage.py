@@ -0,0 +1,135 @@
+# GuiFramework/tests/config/test_config_sqlite_storage.py
+
+import sqlite3
+
+from typing import Any, Dict
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigFileHandler, ConfigFileHandlerConfig
+
+
+class TestConfigSqliteStorage:
+    """Test class for the SQLite storage and the migration from INI."""
+
+    def __init__(self) -> None:
+        """Initialize an INI configuration to migrate."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.default_config = {
+            "window": {"title": "Test Application", "size": "1920, 1080"},
+            "theme": {"mode": "dark"},
+        }
+        self.ini_config_name: str = "test_sqlite_ini_config"
+        self.config_name: str = "test_sqlite_config"
+        self.reload_count: int = 0
+        ConfigFileHandler.add_config(self.ini_config_name, self.create_handler_config("ini"), self.default_config)
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def create_handler_config(self, storage: str) -> ConfigFileHandlerConfig:
+        """Return a handler config for the shared test files."""
+        return ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name="test_sqlite_default_config.ini",
+            custom_config_name="test_sqlite_custom_config.ini",
+            save_delay=None,
+            storage=storage
+        )
+
+    def reload(self) -> str:
+        """Open the database as a new configuration, as a restarted application would."""
+        self.reload_count += 1
+        config_name = f"{self.config_name}_reload{self.reload_count}"
+        ConfigFileHandler.add_config(config_name, self.create_handler_config("sqlite"), self.default_config)
+        return config_name
+
+    def read_rows(self) -> Dict[str, Dict[str, str]]:
+        """Return the settings stored in the database."""
+        sections: Dict[str, Dict[str, str]] = {}
+        with sqlite3.connect(self.create_handler_config("sqlite").sqlite_path) as connection:
+            for section, option, value in connection.execute("SELECT section, option, value FROM settings"):
+                sections.setdefault(section, {})[option] = value
+        return sections
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_migration(self) -> None:
+        """migrate_storage copies every custom setting of the INI file into the database."""
+        ConfigFileHandler.save_setting(self.ini_config_name, "window", "title", "Migrated")
+        ConfigFileHandler.save_setting(self.ini_config_name, "plugins", "enabled", "a, b")
+        self.assert_equals(4, ConfigFileHandler.migrate_storage(self.create_handler_config("ini")))
+        ConfigFileHandler.add_config(self.config_name, self.create_handler_config("sqlite"), self.default_config)
+        self.assert_equals("Migrated", ConfigFileHandler.get_setting(self.config_name, "window", "title"))
+        self.assert_equals(ConfigFileHandler.get_custom_config(self.ini_config_name), ConfigFileHandler.get_custom_config(self.config_name))
+
+    def test_per_key_writes(self) -> None:
+        """Changes are written to their rows at once and survive a reload."""
+        ConfigFileHandler.save_setting(self.config_name, "window", "size", "800, 600")
+        self.assert_equals("800, 600", self.read_rows()["window"]["size"])
+        ConfigFileHandler.reset_setting(self.config_name, "plugins", "enabled")
+        self.assert_equals(False, "enabled" in self.read_rows().get("plugins", {}))
+        ConfigFileHandler.reset_section(self.config_name, "window")
+        self.assert_equals({"title": "Test Application", "size": "1920, 1080"}, self.read_rows()["window"])
+        with ConfigFileHandler.batch(self.config_name):
+            ConfigFileHandler.save_setting(self.config_name, "theme", "mode", "light")
+            ConfigFileHandler.save_setting(self.config_name, "theme", "accent", "blue")
+            self.assert_equals("dark", self.read_rows()["theme"]["mode"])
+        self.assert_equals({"mode": "light", "accent": "blue"}, self.read_rows()["theme"])
+        reloaded = self.reload()
+        self.assert_equals(ConfigFileHandler.get_custom_config(self.config_name), ConfigFileHandler.get_custom_config(reloaded))
+
+    def test_reset_and_create(self) -> None:
+        """A reset replaces all rows and a missing database is created from the defaults."""
+        ConfigFileHandler.reset_custom_config(self.config_name)
+        self.assert_equals({section: dict(options) for section, options in self.default_config.items()}, self.read_rows())
+
+        created_config = ConfigFileHandlerConfig(
+            config_path=FileOps.join_paths(self.config_path, "created"),
+            custom_config_name="created.ini",
+            storage="sqlite"
+        )
+        ConfigFileHandler.add_config(f"{self.config_name}_created", created_config, self.default_config)
+        self.assert_equals("dark", ConfigFileHandler.get_setting(f"{self.config_name}_created", "theme", "mode"))
+
+        try:
+            ConfigFileHandler.register_storage("broken", dict)
+            self.fail_count += 1
+        except ValueError:
+            self.success_count += 1
+
+    def test_method(self) -> None:
+        """Run all SQLite storage tests and log results."""
+        for test in (self.test_migration, self.test_per_key_writes, self.test_reset_and_create):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigSqliteStorage()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
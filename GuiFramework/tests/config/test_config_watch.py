@@ -0,0 +1,154 @@
+# GuiFramework/tests/config/test_config_watch.py
+
+import os
+import time
+import sqlite3
+import configparser
+
+from typing import Any, Callable, Dict, List
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigHandler, ConfigFileHandler, ConfigFileHandlerConfig, ConfigKey
+
+
+class TestConfigWatch:
+    """Test class for reloading configurations changed by other programs."""
+
+    def __init__(self) -> None:
+        """Initialize a watched INI configuration with variables and a SQLite configuration."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_watch_config"
+        self.handler_config = ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name="test_watch_default_config.ini",
+            custom_config_name="test_watch_custom_config.ini",
+            save_delay=None
+        )
+        ConfigHandler.add_config(self.config_name, self.handler_config, {"values": {"volume": "10", "title": "Title"}})
+        self.volume_key = ConfigKey("volume", "values", int, True, True, self.config_name)
+        self.title_key = ConfigKey("title", "values", str, True, True, self.config_name)
+        ConfigHandler.add_variable(self.volume_key, 10, 10, init_from_file=True)
+        ConfigHandler.add_variable(self.title_key, "Title", "Title", init_from_file=True)
+        self.notifications: List[Any] = []
+        for config_key in (self.volume_key, self.title_key):
+            ConfigHandler.get_variable(config_key).subscribe("value_changed", lambda event_type, new_value, name=config_key.name: self.notifications.append((name, new_value)))
+
+        self.sqlite_config_name: str = "test_watch_sqlite_config"
+        self.sqlite_handler_config = ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name="test_watch_sqlite_default_config.ini",
+            custom_config_name="test_watch_sqlite_custom_config.ini",
+            save_delay=None,
+            storage="sqlite"
+        )
+        ConfigFileHandler.add_config(self.sqlite_config_name, self.sqlite_handler_config, {"window": {"title": "Title", "size": "800, 600"}})
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def write_externally(self, sections: Dict[str, Dict[str, str]]) -> None:
+        """Replace the custom INI file the way another program would."""
+        parser = configparser.ConfigParser()
+        parser.read_dict(sections)
+        temp_path = self.handler_config.custom_config_path + ".external"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            parser.write(f)
+        os.replace(temp_path, self.handler_config.custom_config_path)
+
+    @staticmethod
+    def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+        """Wait until condition is true, returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.02)
+        return True
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_external_edit(self) -> None:
+        """Only the variables of changed options are updated, with one notification each."""
+        ConfigHandler.watch(self.config_name, interval=0.05)
+        self.notifications.clear()
+        self.write_externally({"values": {"volume": "42", "title": "Title"}, "extra": {"key": "value"}})
+        self.assert_equals(True, self.wait_for(lambda: self.notifications))
+        time.sleep(0.2)
+        self.assert_equals([("volume", 42)], self.notifications)
+        self.assert_equals(42, ConfigHandler.get_variable_value(self.volume_key))
+        self.assert_equals({"key": "value"}, ConfigHandler.get_custom_config(self.config_name)["extra"])
+
+        # An option removed from the file falls back to its default
+        self.notifications.clear()
+        self.write_externally({"values": {"title": "Edited"}})
+        self.assert_equals(True, self.wait_for(lambda: len(self.notifications) == 2))
+        self.assert_equals({("volume", 10), ("title", "Edited")}, set(self.notifications))
+        self.assert_equals(False, "extra" in ConfigHandler.get_custom_config(self.config_name))
+
+    def test_own_saves(self) -> None:
+        """Saves of this process are not reported as external changes."""
+        self.notifications.clear()
+        ConfigHandler.set_variable_value(self.volume_key, 55)
+        time.sleep(0.3)
+        self.assert_equals([("volume", 55)], self.notifications)
+        self.assert_equals(True, "volume = 55" in FileOps.load_file(self.handler_config.custom_config_path))
+
+    def test_load_custom_config_from_file(self) -> None:
+        """An explicit load notifies the variables whose values changed."""
+        ConfigHandler.unwatch(self.config_name)
+        self.notifications.clear()
+        self.write_externally({"values": {"volume": "55", "title": "Loaded"}})
+        time.sleep(0.2)
+        self.assert_equals([], self.notifications)
+        ConfigHandler.load_custom_config_from_file(self.config_name)
+        self.assert_equals([("title", "Loaded")], self.notifications)
+
+    def test_sqlite(self) -> None:
+        """Commits of another connection to the database are picked up."""
+        changes: List[Any] = []
+        ConfigFileHandler.watch(self.sqlite_config_name, interval=0.05, on_change=lambda config_name, changed: changes.append(changed))
+        ConfigFileHandler.save_setting(self.sqlite_config_name, "window", "size", "1024, 768")
+        with sqlite3.connect(self.sqlite_handler_config.sqlite_path) as connection:
+            connection.execute("UPDATE settings SET value = ? WHERE section = ? AND option = ?", ("External", "window", "title"))
+        self.assert_equals(True, self.wait_for(lambda: changes))
+        self.assert_equals([{("window", "title")}], changes)
+        self.assert_equals("External", ConfigFileHandler.get_setting(self.sqlite_config_name, "window", "title"))
+        self.assert_equals("1024, 768", ConfigFileHandler.get_setting(self.sqlite_config_name, "window", "size"))
+        ConfigFileHandler.unwatch(self.sqlite_config_name)
+
+    def test_method(self) -> None:
+        """Run all watch tests and log results."""
+        for test in (self.test_external_edit, self.test_own_saves, self.test_load_custom_config_from_file, self.test_sqlite):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigWatch()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
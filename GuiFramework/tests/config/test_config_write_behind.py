@@ -0,0 +1,134 @@
+# GuiFramework/tests/config/test_config_write_behind.py
+
+import os
+import time
+
+from typing import Any
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config import ConfigFileHandler, ConfigFileHandlerConfig
+
+
+class TestConfigWriteBehind:
+    """Test class for the coalesced auto saves of ConfigFileHandler."""
+
+    def __init__(self) -> None:
+        """Initialize a configuration with a short save delay."""
+        self.config_path: str = FileOps.resolve_development_path(__file__, "config", ".root")
+        FileOps.purge_directory(self.config_path)
+        self.config_name: str = "test_write_behind_config"
+        self.handler_config = ConfigFileHandlerConfig(
+            config_path=self.config_path,
+            default_config_name="test_write_behind_default_config.ini",
+            custom_config_name="test_write_behind_custom_config.ini",
+            save_delay=0.2,
+            max_save_delay=0.6
+        )
+        ConfigFileHandler.add_config(
+            config_name=self.config_name,
+            handler_config=self.handler_config,
+            default_config={"slider": {"value": "0"}}
+        )
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def file_contains(self, text: str) -> bool:
+        """Return True if the custom config file on disk contains text."""
+        return text in FileOps.load_file(self.handler_config.custom_config_path)
+
+    def test_coalescing(self) -> None:
+        """Many auto saves in a row stay in memory until the changes settle, then get written once."""
+        for value in range(100):
+            ConfigFileHandler.save_setting(self.config_name, "slider", "value", str(value))
+        self.assert_equals([self.config_name], ConfigFileHandler.pending())
+        self.assert_equals(False, self.file_contains("value = 99"))
+        self.assert_equals("99", ConfigFileHandler.get_setting(self.config_name, "slider", "value"))
+        time.sleep(0.5)
+        self.assert_equals([], ConfigFileHandler.pending())
+        self.assert_equals(True, self.file_contains("value = 99"))
+
+    def test_max_latency(self) -> None:
+        """A continuous stream of changes is still written once max_save_delay has passed."""
+        start = time.monotonic()
+        written_after = None
+        value = 0
+        while time.monotonic() - start < 1.5:
+            value += 1
+            ConfigFileHandler.save_setting(self.config_name, "slider", "value", f"stream{value}")
+            if written_after is None and self.file_contains("stream"):
+                written_after = time.monotonic() - start
+            time.sleep(0.05)
+        self.assert_equals(True, written_after is not None and written_after < 1.0)
+        ConfigFileHandler.flush(self.config_name)
+        self.assert_equals(True, self.file_contains(f"value = stream{value}"))
+
+    def test_flush(self) -> None:
+        """flush writes pending changes at once and explicit saves clear the pending state."""
+        ConfigFileHandler.save_setting(self.config_name, "slider", "value", "flushed")
+        ConfigFileHandler.flush()
+        self.assert_equals([], ConfigFileHandler.pending())
+        self.assert_equals(True, self.file_contains("value = flushed"))
+
+        ConfigFileHandler.save_setting(self.config_name, "slider", "value", "saved")
+        ConfigFileHandler.save_custom_config_to_file(self.config_name)
+        self.assert_equals([], ConfigFileHandler.pending())
+        self.assert_equals(True, self.file_contains("value = saved"))
+
+        # Changes without auto_save are not scheduled
+        ConfigFileHandler.save_setting(self.config_name, "slider", "value", "unsaved", auto_save=False)
+        self.assert_equals([], ConfigFileHandler.pending())
+
+    def test_failed_write(self) -> None:
+        """A timer write that fails stays pending and is retried until it succeeds."""
+        os.remove(self.handler_config.custom_config_path)
+        os.mkdir(self.handler_config.custom_config_path)
+        ConfigFileHandler.save_setting(self.config_name, "slider", "value", "retried")
+        time.sleep(0.5)
+        self.assert_equals([self.config_name], ConfigFileHandler.pending())
+
+        # The retry leaves pending before it writes, so wait for the file itself
+        os.rmdir(self.handler_config.custom_config_path)
+        deadline = time.monotonic() + 3
+        while not (os.path.isfile(self.handler_config.custom_config_path) and self.file_contains("value = retried")) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assert_equals(True, self.file_contains("value = retried"))
+        self.assert_equals([], ConfigFileHandler.pending())
+
+    def test_method(self) -> None:
+        """Run all write-behind tests and log results."""
+        for test in (self.test_coalescing, self.test_max_latency, self.test_flush, self.test_failed_write):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestConfigWriteBehind()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,80 @@
+# GuiFramework/tests/file_ops/bench_bulk_transfer.py
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from typing import Callable, Optional
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class BenchBulkTransfer:
+    """Compares a shutil.copy loop with FileOps.copy_many and a shutil.move loop with FileOps.move_many."""
+
+    def __init__(self, file_count: int = 200, file_size: int = 512 * 1024, base_directory: Optional[str] = None) -> None:
+        """Pass base_directory to run on a specific file system instead of the temp directory."""
+        self.file_count = file_count
+        self.file_size = file_size
+        self.base_directory = base_directory
+
+    def _build_sources(self, root: str) -> list:
+        """Create the source files, each filled with random bytes."""
+        directory = os.path.join(root, "source")
+        os.makedirs(directory)
+        sources = []
+        for index in range(self.file_count):
+            path = os.path.join(directory, f"file_{index}.bin")
+            with open(path, "wb") as file:
+                file.write(os.urandom(self.file_size))
+            sources.append(path)
+        return sources
+
+    @staticmethod
+    def _time(function: Callable[[], None]) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    def _run(self, root: str) -> None:
+        sources = self._build_sources(root)
+
+        def target(name: str) -> str:
+            directory = os.path.join(root, name)
+            os.makedirs(directory, exist_ok=True)
+            return directory
+
+        def move_back(directory: str) -> None:
+            for source in sources:
+                os.replace(os.path.join(directory, os.path.basename(source)), source)
+
+        cases = {
+            "shutil.copy loop": lambda: [shutil.copy(source, target("copy_loop")) for source in sources],
+            "copy_many, 1 worker": lambda: FileOps.copy_many([(source, target("copy_single")) for source in sources], workers=1),
+            "copy_many": lambda: FileOps.copy_many([(source, target("copy_many")) for source in sources]),
+            "shutil.move loop": lambda: [shutil.move(source, target("move_loop")) for source in sources],
+            "move_many": lambda: FileOps.move_many([(source, target("move_many")) for source in sources]),
+        }
+        total_megabytes = self.file_count * self.file_size / (1024 * 1024)
+        print(f"{'case':>20} {'seconds':>9} {'MB/s':>9}")
+        for name, function in cases.items():
+            elapsed = self._time(function)
+            print(f"{name:>20} {elapsed:>9.3f} {total_megabytes / elapsed:>9.1f}")
+            if name.startswith("shutil.move"):
+                move_back(os.path.join(root, "move_loop"))
+
+    def run(self) -> None:
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchBulkTransfer(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
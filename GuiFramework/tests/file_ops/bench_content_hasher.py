@@ -0,0 +1,77 @@
+# GuiFramework/tests/file_ops/bench_content_hasher.py
+
+import os
+import sys
+import time
+import hashlib
+import tempfile
+
+from typing import Callable, Optional
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class BenchContentHasher:
+    """Measures hashing throughput against file count and size: a hashlib loop, hash_many sequential,
+    hash_many parallel and hash_many with every fingerprint already cached."""
+
+    def __init__(self, shapes: tuple = ((1000, 4 * 1024), (200, 256 * 1024), (20, 8 * 1024 * 1024)), algorithm: str = "blake2b",
+                 base_directory: Optional[str] = None) -> None:
+        """shapes lists (file count, file size) pairs, pass base_directory to run on a specific file system."""
+        self.shapes = shapes
+        self.algorithm = algorithm
+        self.base_directory = base_directory
+
+    @staticmethod
+    def _build_files(directory: str, file_count: int, file_size: int) -> list:
+        paths = []
+        for index in range(file_count):
+            path = os.path.join(directory, f"file_{index}.bin")
+            with open(path, "wb") as file:
+                file.write(os.urandom(file_size))
+            paths.append(path)
+        return paths
+
+    def _hashlib_loop(self, paths: list) -> None:
+        for path in paths:
+            with open(path, "rb") as file:
+                hashlib.new(self.algorithm, file.read()).hexdigest()
+
+    @staticmethod
+    def _time(function: Callable[[], None]) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    def _run_shape(self, root: str, file_count: int, file_size: int) -> None:
+        directory = os.path.join(root, f"{file_count}x{file_size}")
+        os.makedirs(directory)
+        paths = self._build_files(directory, file_count, file_size)
+        FileOps.fingerprints.clear()
+        cases = {
+            "hashlib loop": lambda: self._hashlib_loop(paths),
+            "hash_many, 1 worker": lambda: FileOps.hash_many(paths, self.algorithm, workers=1, use_cache=False),
+            "hash_many": lambda: FileOps.hash_many(paths, self.algorithm, use_cache=False),
+            "hash_many, cold cache": lambda: FileOps.hash_many(paths, self.algorithm),
+            "hash_many, warm cache": lambda: FileOps.hash_many(paths, self.algorithm),
+        }
+        megabytes = file_count * file_size / (1024 * 1024)
+        for name, function in cases.items():
+            elapsed = self._time(function)
+            print(f"{file_count:>6} x {file_size // 1024:>5} KB {name:>22} {elapsed:>9.3f} {megabytes / elapsed:>10.1f} {file_count / elapsed:>10.0f}")
+
+    def run(self) -> None:
+        print(f"{'files':>6} x {'size':>8} {'case':>22} {'seconds':>9} {'MB/s':>10} {'files/s':>10}")
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            for file_count, file_size in self.shapes:
+                self._run_shape(root, file_count, file_size)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchContentHasher(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,84 @@
+# GuiFramework/tests/file_ops/bench_directory_sync.py
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from typing import Callable, Optional
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class BenchDirectorySync:
+    """Compares shutil.copytree with FileOps.sync_directory on a first copy, an unchanged tree and a tree
+    with one percent of its files changed."""
+
+    def __init__(self, directory_count: int = 100, files_per_directory: int = 50, file_size: int = 64 * 1024,
+                 base_directory: Optional[str] = None) -> None:
+        """Pass base_directory to run on a specific file system instead of the temp directory."""
+        self.directory_count = directory_count
+        self.files_per_directory = files_per_directory
+        self.file_size = file_size
+        self.base_directory = base_directory
+
+    def _build_tree(self, root: str) -> list:
+        paths = []
+        for index in range(self.directory_count):
+            directory = os.path.join(root, f"dir_{index}")
+            os.makedirs(directory)
+            for file_index in range(self.files_per_directory):
+                path = os.path.join(directory, f"file_{file_index}.bin")
+                with open(path, "wb") as file:
+                    file.write(os.urandom(self.file_size))
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def _time(function: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _copytree(source: str, destination: str) -> None:
+        shutil.rmtree(destination, ignore_errors=True)
+        shutil.copytree(source, destination)
+
+    def _touch_some(self, paths: list) -> None:
+        for path in paths[::100]:
+            with open(path, "ab") as file:
+                file.write(b"changed")
+
+    def _run(self, root: str) -> None:
+        source = os.path.join(root, "source")
+        paths = self._build_tree(source)
+        copytree_target = os.path.join(root, "copytree")
+        sync_target = os.path.join(root, "sync")
+        cases = (
+            ("first copy", lambda: None),
+            ("unchanged", lambda: None),
+            ("1% changed", lambda: self._touch_some(paths)),
+        )
+        print(f"{'case':>12} {'copytree':>10} {'sync':>10} {'sync, hash':>11}")
+        for name, prepare in cases:
+            prepare()
+            copytree_time = self._time(lambda: self._copytree(source, copytree_target))
+            sync_time = self._time(lambda: FileOps.sync_directory(source, sync_target, delete_extraneous=True))
+            hash_time = self._time(lambda: FileOps.sync_directory(source, sync_target, compare="hash", delete_extraneous=True))
+            print(f"{name:>12} {copytree_time:>10.3f} {sync_time:>10.3f} {hash_time:>11.3f}")
+
+    def run(self) -> None:
+        with tempfile.TemporaryDirectory(dir=self.base_directory) as root:
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchDirectorySync(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,96 @@
+# GuiFramework/tests/file_ops/bench_path_locks.py
+
+import os
+import sys
+import time
+import tempfile
+import threading
+
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class _GlobalLockManager:
+    """Stand-in for the former single class-wide RLock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def shared(self, *paths):
+        with self._lock:
+            yield
+
+    @contextmanager
+    def exclusive(self, *paths):
+        with self._lock:
+            yield
+
+    @contextmanager
+    def locked(self, shared=(), exclusive=()):
+        with self._lock:
+            yield
+
+
+class BenchPathLocks:
+    """Compares FileOps throughput under the global lock and the per-path locks."""
+
+    def __init__(self, thread_counts: List[int] = (1, 2, 4, 8), operations_per_thread: int = 200, payload_size: int = 64 * 1024, base_directory: Optional[str] = None) -> None:
+        """Point base_directory at a slow or network drive to reproduce I/O stalls."""
+        self.thread_counts = thread_counts
+        self.operations_per_thread = operations_per_thread
+        self.payload = "x" * payload_size
+        self.base_directory = base_directory
+
+    def _run_threads(self, directory: str, thread_count: int) -> float:
+        """Let every thread write and read back its own file, return operations per second."""
+        barrier = threading.Barrier(thread_count + 1)
+
+        def worker(index: int) -> None:
+            file_path = os.path.join(directory, f"file_{index}.txt")
+            barrier.wait()
+            for _ in range(self.operations_per_thread):
+                FileOps.write_file(file_path, self.payload)
+                FileOps.load_file(file_path)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        return (thread_count * self.operations_per_thread * 2) / elapsed
+
+    def _measure(self, lock_manager_factory: Callable) -> Dict[int, float]:
+        original_locks = FileOps.locks
+        FileOps.locks = lock_manager_factory()
+        try:
+            results = {}
+            for thread_count in self.thread_counts:
+                with tempfile.TemporaryDirectory(dir=self.base_directory) as directory:
+                    results[thread_count] = self._run_threads(directory, thread_count)
+            return results
+        finally:
+            FileOps.locks = original_locks
+
+    def run(self) -> None:
+        global_results = self._measure(_GlobalLockManager)
+        path_results = self._measure(type(FileOps.locks))
+        print(f"{'threads':>8} {'global lock ops/s':>18} {'path locks ops/s':>18} {'speedup':>8}")
+        for thread_count in self.thread_counts:
+            speedup = path_results[thread_count] / global_results[thread_count]
+            print(f"{thread_count:>8} {global_results[thread_count]:>18.0f} {path_results[thread_count]:>18.0f} {speedup:>7.2f}x")
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchPathLocks(base_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
@@ -0,0 +1,71 @@
+# GuiFramework/tests/file_ops/bench_tree_scanner.py
+
+import os
+import sys
+import time
+import fnmatch
+import tempfile
+
+from typing import Callable, Optional
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class BenchTreeScanner:
+    """Compares os.walk listings with FileOps.scan_tree on a generated tree.
+
+    The pruned cases skip the group_1* directories, which hold over half of the generated files.
+    """
+
+    def __init__(self, directory_count: int = 500, files_per_directory: int = 100, tree_directory: Optional[str] = None) -> None:
+        """Pass tree_directory to benchmark an existing tree instead of a generated one."""
+        self.directory_count = directory_count
+        self.files_per_directory = files_per_directory
+        self.tree_directory = tree_directory
+
+    def _build_tree(self, root: str) -> None:
+        """Create a tree of nested directories filled with empty files."""
+        for index in range(self.directory_count):
+            directory = os.path.join(root, f"group_{index % 20}", f"dir_{index}")
+            os.makedirs(directory, exist_ok=True)
+            for file_index in range(self.files_per_directory):
+                open(os.path.join(directory, f"file_{file_index}.txt"), "w").close()
+
+    @staticmethod
+    def _time(function: Callable[[], list]) -> tuple:
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, len(result)
+
+    def _run(self, root: str) -> None:
+        cases = {
+            "os.walk + fnmatch": lambda: [os.path.join(dp, f) for dp, dn, filenames in os.walk(root) for f in filenames if fnmatch.fnmatch(f, "*.txt")],
+            "scan_tree sequential": lambda: [entry.path for entry in FileOps.scan_tree(root, workers=1) if entry.is_file and fnmatch.fnmatch(entry.name, "*.txt")],
+            "scan_tree parallel": lambda: [entry.path for entry in FileOps.scan_tree(root) if entry.is_file and fnmatch.fnmatch(entry.name, "*.txt")],
+            "os.walk, filter after": lambda: [os.path.join(dp, f) for dp, dn, filenames in os.walk(root) for f in filenames if not os.path.relpath(dp, root).startswith("group_1")],
+            "scan_tree, pruned": lambda: [entry.path for entry in FileOps.scan_tree(root, exclude=["/group_1*/"]) if entry.is_file],
+            "os.walk + stat": lambda: [os.stat(os.path.join(dp, f)).st_size for dp, dn, filenames in os.walk(root) for f in filenames],
+            "scan_tree + stat": lambda: [entry.stat().st_size for entry in FileOps.scan_tree(root) if entry.is_file],
+        }
+        print(f"{'case':>22} {'seconds':>9} {'entries':>9}")
+        for name, function in cases.items():
+            elapsed, count = self._time(function)
+            print(f"{name:>22} {elapsed:>9.3f} {count:>9}")
+
+    def run(self) -> None:
+        if self.tree_directory:
+            self._run(self.tree_directory)
+            return
+        with tempfile.TemporaryDirectory() as root:
+            self._build_tree(root)
+            self._run(root)
+
+
+def main() -> None:
+    """Main function to run the benchmark."""
+    BenchTreeScanner(tree_directory=sys.argv[1] if len(sys.argv) > 1 else None).run()
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
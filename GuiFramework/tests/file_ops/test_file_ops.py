@@ -0,0 +1,496 @@
+# GuiFramework/tests/file_ops/test_file_ops.py
+
+import os
+import json
+import time
+import threading
+import asyncio
+import hashlib
+import tempfile
+
+from typing import Any
+from collections import OrderedDict
+
+from GuiFramework.utilities.file_ops import AsyncFileOps, FileOps, TkAsyncLoop, WriteDurability
+
+
+class _AfterQueue:
+    """Stands in for a Tk widget, collecting after() callbacks until they are pumped."""
+
+    def __init__(self) -> None:
+        self.callbacks = {}
+
+    def after(self, delay, callback):
+        after_id = f"after#{len(self.callbacks)}"
+        self.callbacks[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id) -> None:
+        self.callbacks.pop(after_id, None)
+
+    def pump(self, limit: int = 10000) -> None:
+        while self.callbacks and limit:
+            self.callbacks.pop(next(iter(self.callbacks)))()
+            limit -= 1
+
+
+class TestFileOps:
+    """Test class for FileOps functionality."""
+
+    def __init__(self) -> None:
+        """Initialize test directory."""
+        self._temp_directory = tempfile.TemporaryDirectory()
+        self.root: str = self._temp_directory.name
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def test_atomic_write(self) -> None:
+        """Atomic writes replace the target in one step and leave no temp files behind."""
+        file_path = FileOps.join_paths(self.root, "atomic", "settings.txt")
+        FileOps.write_file(file_path, "first", atomic=True)
+        self.assert_equals("first", FileOps.load_file(file_path))
+
+        FileOps.write_file(file_path, "second", atomic=True, durability=WriteDurability.FSYNC)
+        self.assert_equals("second", FileOps.load_file(file_path))
+
+        FileOps.write_file(file_path, ["-", "third"], append=True, atomic=True, durability=WriteDurability.FLUSH)
+        self.assert_equals("second-third", FileOps.load_file(file_path))
+
+        # Bytes are written unchanged, without newline translation
+        bytes_path = FileOps.join_paths(self.root, "bytes", "records.bin")
+        for append, atomic in ((False, True), (True, False), (True, True)):
+            self.assert_equals(True, FileOps.write_file(bytes_path, b"line\n", append=append, atomic=atomic))
+        with open(bytes_path, "rb") as file:
+            self.assert_equals(b"line\n" * 3, file.read())
+
+        json_path = FileOps.join_paths(self.root, "atomic", "data.json")
+        FileOps.write_json(json_path, {"key": "value"}, atomic=True)
+        self.assert_equals('{\n    "key": "value"\n}', FileOps.load_file(json_path))
+
+        self.assert_equals(["data.json", "settings.txt"], sorted(os.listdir(FileOps.join_paths(self.root, "atomic"))))
+
+        # Concurrent atomic appends each start from the result of the previous one
+        log_path = FileOps.join_paths(self.root, "atomic", "log.txt")
+        appenders = [threading.Thread(target=lambda: [FileOps.write_file(log_path, "x", append=True, atomic=True) for _ in range(50)]) for _ in range(8)]
+        for appender in appenders:
+            appender.start()
+        for appender in appenders:
+            appender.join()
+        self.assert_equals(400, len(FileOps.load_file(log_path)))
+
+    def test_streaming_readers(self) -> None:
+        """Streaming, mapped and tail readers return the same data as load_file."""
+        file_path = FileOps.join_paths(self.root, "stream", "log.txt")
+        lines = [f"line {i}" for i in range(1000)]
+        FileOps.write_file(file_path, "\n".join(lines) + "\n")
+
+        self.assert_equals(lines, list(FileOps.iter_lines(file_path)))
+        self.assert_equals(FileOps.load_file(file_path), "".join(FileOps.iter_chunks(file_path, size=100)))
+        self.assert_equals(100, max(len(chunk) for chunk in FileOps.iter_chunks(file_path, size=100, binary=True)))
+        self.assert_equals(lines[-3:], FileOps.tail_lines(file_path, 3, block_size=16))
+        self.assert_equals(lines, FileOps.tail_lines(file_path, 5000))
+
+        with FileOps.open_mapped(file_path) as mapped:
+            self.assert_equals(b"line 999\n", mapped[-9:])
+            self.assert_equals(len(FileOps.load_file(file_path)), len(mapped))
+
+        empty_path = FileOps.join_paths(self.root, "stream", "empty.txt")
+        FileOps.create_file(empty_path)
+        with FileOps.open_mapped(empty_path) as mapped:
+            self.assert_equals(0, len(mapped))
+        self.assert_equals([], list(FileOps.iter_lines(FileOps.join_paths(self.root, "stream", "missing.txt"))))
+
+    def test_scan_tree(self) -> None:
+        """scan_tree honours depth limits and pruning, sequentially and in parallel."""
+        root = FileOps.join_paths(self.root, "tree")
+        for directory in ("a", "a/b", "a/b/c", "skip", "skip/inner"):
+            FileOps.create_file(FileOps.join_paths(root, directory, "file.txt"))
+
+        sequential = sorted(entry.path for entry in FileOps.scan_tree(root, workers=1))
+        parallel = sorted(entry.path for entry in FileOps.scan_tree(root, workers=4))
+        self.assert_equals(sequential, parallel)
+        self.assert_equals(10, len(sequential))
+
+        self.assert_equals(["a", "skip"], sorted(entry.name for entry in FileOps.scan_tree(root, max_depth=0)))
+        self.assert_equals(2, max(entry.depth for entry in FileOps.scan_tree(root, max_depth=2, collect=True)))
+
+        pruned = FileOps.scan_tree(root, prune=lambda entry: entry.name == "skip", collect=True)
+        self.assert_equals(False, any("inner" in entry.path for entry in pruned))
+        self.assert_equals(0, sum(entry.stat().st_size for entry in pruned if entry.is_file))
+
+        self.assert_equals(5, len(FileOps.get_files_in_directory(root, "*.txt", include_nested=True)))
+        self.assert_equals(sorted(FileOps.join_paths(root, d) for d in ("a", "a/b", "a/b/c", "skip", "skip/inner")),
+                           sorted(FileOps.get_directories_in_directory(root, "*", include_nested=True)))
+
+        # Listings come back sorted by path although the nested scan runs in parallel
+        self.assert_equals(["a", "a/b", "a/b/c", "skip", "skip/inner"],
+                           [os.path.relpath(path, root).replace(os.sep, "/") for path in FileOps.get_directories_in_directory(root, include_nested=True)])
+
+    def test_patterns(self) -> None:
+        """Include and exclude globs filter listings and prune excluded directories."""
+        root = FileOps.join_paths(self.root, "patterns")
+        for file_path in ("main.py", "main.pyc", "src/util.py", "node_modules/lib/index.js", "build/out.py", "build/keep.py"):
+            FileOps.create_file(FileOps.join_paths(root, file_path))
+
+        names = lambda paths: sorted(os.path.relpath(path, root).replace(os.sep, "/") for path in paths)
+        self.assert_equals(["main.py", "src/util.py"], names(FileOps.get_files_in_directory(root, "*.py", include_nested=True, exclude=["build/"])))
+        self.assert_equals(["main.py", "main.pyc", "src/util.py"], names(FileOps.get_files_in_directory(root, include_nested=True, exclude=["node_modules/", "/build"])))
+        self.assert_equals(["build/keep.py"], names(FileOps.get_files_in_directory(root, ["build/**"], include_nested=True, exclude=["out.py"])))
+        self.assert_equals(["main.py"], names(FileOps.get_files_in_directory(root, ["*.py", "*.pyc"], exclude=["*.pyc"])))
+
+        visited = []
+        FileOps.scan_tree(root, exclude=["node_modules/"], prune=lambda entry: visited.append(entry.name), collect=True)
+        self.assert_equals(False, "node_modules" in visited)
+
+        matcher = FileOps.compile_patterns(exclude=["*.log", "!important.log"])
+        self.assert_equals((True, False), (matcher.is_excluded("debug.log"), matcher.is_excluded("logs/important.log")))
+
+    def test_bulk_transfer(self) -> None:
+        """copy_many and move_many transfer every job, report progress and collect errors per source."""
+        source_directory = FileOps.join_paths(self.root, "bulk", "source")
+        sources = [FileOps.join_paths(source_directory, f"file_{i}.bin") for i in range(20)]
+        for index, source in enumerate(sources):
+            FileOps.write_file(source, "x" * index * 1000)
+        FileOps.create_file(FileOps.join_paths(source_directory, "nested", "inner.txt"))
+
+        copy_directory = FileOps.join_paths(self.root, "bulk", "copy")
+        progress = []
+        jobs = [(source, copy_directory + os.sep) for source in sources] + [(FileOps.join_paths(self.root, "bulk", "missing.bin"), copy_directory)]
+        FileOps.create_directory(copy_directory)
+        report = FileOps.copy_many(jobs, workers=4, progress=progress.append)
+        self.assert_equals((20, 1, False), (len(report.succeeded), len(report.failed), report.ok))
+        self.assert_equals(sum(index * 1000 for index in range(20)), report.bytes_done)
+        self.assert_equals(list(range(1, 22)), [update.completed for update in progress])
+        self.assert_equals(FileOps.load_file(sources[7]), FileOps.load_file(FileOps.join_paths(copy_directory, "file_7.bin")))
+
+        tree_copy = FileOps.join_paths(self.root, "bulk", "tree_copy")
+        self.assert_equals(True, FileOps.copy_many([(FileOps.join_paths(source_directory, "nested"), tree_copy)]).ok)
+        self.assert_equals(True, FileOps.is_file(FileOps.join_paths(tree_copy, "inner.txt")))
+
+        move_directory = FileOps.join_paths(self.root, "bulk", "moved")
+        report = FileOps.move_many([(source, FileOps.join_paths(move_directory, os.path.basename(source))) for source in sources])
+        self.assert_equals(True, report.ok)
+        self.assert_equals((0, 20), (sum(map(os.path.exists, sources)), len(os.listdir(move_directory))))
+
+    def test_same_file_copy(self) -> None:
+        """Copying a file onto itself fails and leaves its content alone."""
+        source = FileOps.join_paths(self.root, "same", "file.txt")
+        FileOps.write_file(source, "content")
+        FileOps.copy_file(source, os.path.dirname(source))
+        self.assert_equals("content", FileOps.load_file(source))
+        report = FileOps.copy_many([(source, source)])
+        self.assert_equals((False, "SameFileError"), (report.ok, type(report.failed.get(source)).__name__))
+        self.assert_equals("content", FileOps.load_file(source))
+
+    def test_async_file_ops(self) -> None:
+        """AsyncFileOps runs FileOps calls off the calling thread and can be driven from a Tk after loop."""
+        file_path = FileOps.join_paths(self.root, "async", "data.json")
+
+        async def round_trip():
+            await AsyncFileOps.write_json(file_path, {"key": [1, 2, 3]})
+            data = await AsyncFileOps.load_json(file_path)
+            entries = await AsyncFileOps.scan_tree(FileOps.join_paths(self.root, "async"))
+            text = await AsyncFileOps.read_file(file_path, chunk_size=4)
+            return data, [entry.name for entry in entries], text
+
+        data, names, text = asyncio.run(round_trip())
+        self.assert_equals(({"key": [1, 2, 3]}, ["data.json"]), (data, names))
+        self.assert_equals(FileOps.load_file(file_path), text)
+
+        async def cancelled_copy():
+            task = asyncio.ensure_future(AsyncFileOps.copy_many([(file_path, FileOps.join_paths(self.root, "async", f"copy_{i}.json")) for i in range(500)], workers=1))
+            await asyncio.sleep(0)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        self.assert_equals(True, asyncio.run(cancelled_copy()))
+
+        async def copy_with_progress():
+            threads = []
+            jobs = [(file_path, FileOps.join_paths(self.root, "async", "progress", f"copy_{i}.json")) for i in range(20)]
+            await AsyncFileOps.copy_many(jobs, workers=4, progress=lambda update: threads.append(threading.get_ident()))
+            return threads
+
+        self.assert_equals([threading.get_ident()] * 20, asyncio.run(copy_with_progress()))
+
+        # Reconfiguring keeps the calls already queued on the old executor
+        async def reconfigure_while_busy():
+            tasks = [asyncio.ensure_future(AsyncFileOps.run(time.sleep, 0.01)) for _ in range(12)]
+            await asyncio.sleep(0)
+            AsyncFileOps.configure(2)
+            await asyncio.gather(*tasks)
+            return len(tasks)
+
+        self.assert_equals(12, asyncio.run(reconfigure_while_busy()))
+        AsyncFileOps.configure(4)
+
+        widget = _AfterQueue()
+        tk_loop = TkAsyncLoop(widget, interval=0)
+        results = []
+        tk_loop.submit(AsyncFileOps.load_json(file_path), on_done=lambda task: results.append(task.result()))
+        widget.pump()
+        self.assert_equals([{"key": [1, 2, 3]}], results)
+        self.assert_equals({}, widget.callbacks)
+        tk_loop.close()
+
+    def test_stat_cache(self) -> None:
+        """The stat cache answers repeated queries without stat calls and drops entries FileOps writes touch."""
+        file_path = FileOps.join_paths(self.root, "stat", "file.txt")
+        FileOps.write_file(file_path, "12345")
+        FileOps.enable_stat_cache(ttl=None)
+        try:
+            FileOps.stat_cache.reset_stats()
+            results = [(FileOps.file_exists(file_path), FileOps.is_file(file_path), FileOps.get_file_size(file_path)) for _ in range(10)]
+            self.assert_equals([(True, True, 5)] * 10, results)
+            stats = FileOps.get_stat_cache_stats()
+            self.assert_equals((29, 1), (stats.hits, stats.misses))
+
+            FileOps.write_file(file_path, "1234567")
+            self.assert_equals(7, FileOps.get_file_size(file_path))
+            self.assert_equals(True, FileOps.is_directory(FileOps.join_paths(self.root, "stat")))
+            FileOps.delete_file(file_path)
+            self.assert_equals(False, FileOps.file_exists(file_path))
+
+            with open(file_path, "w") as file:
+                file.write("outside")
+            self.assert_equals(False, FileOps.file_exists(file_path))
+            FileOps.invalidate_stat_cache(file_path)
+            self.assert_equals(7, FileOps.get_file_size(file_path))
+
+            FileOps.enable_stat_cache(ttl=None, watch=FileOps.join_paths(self.root, "stat"))
+            with open(file_path, "a") as file:
+                file.write("!")
+            deadline = time.monotonic() + 5
+            while FileOps.get_file_size(file_path) != 8 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assert_equals(8, FileOps.get_file_size(file_path))
+        finally:
+            FileOps.disable_stat_cache()
+
+    def test_content_hashing(self) -> None:
+        """hash_file and hash_many match hashlib and reuse fingerprints of unchanged files."""
+        directory = FileOps.join_paths(self.root, "hash")
+        paths = [FileOps.join_paths(directory, f"file_{i}.bin") for i in range(8)]
+        for index, file_path in enumerate(paths):
+            FileOps.write_file(file_path, f"content {index}" * 1000)
+        expected = {file_path: hashlib.sha256(FileOps.load_file(file_path).encode()).hexdigest() for file_path in paths}
+
+        self.assert_equals(expected, FileOps.hash_many(paths, "sha256", workers=4))
+        self.assert_equals(hashlib.blake2b(FileOps.load_file(paths[0]).encode()).hexdigest(), FileOps.hash_file(paths[0], chunk_size=100))
+
+        hits = FileOps.fingerprints.hits
+        FileOps.hash_many(paths, "sha256")
+        self.assert_equals(len(paths), FileOps.fingerprints.hits - hits)
+
+        FileOps.write_file(paths[1], "changed, and with a new size")
+        self.assert_equals(True, FileOps.file_changed(paths[1], expected[paths[1]], "sha256"))
+        self.assert_equals(False, FileOps.file_changed(paths[2], expected[paths[2]], "sha256"))
+        self.assert_equals({}, FileOps.hash_many([FileOps.join_paths(directory, "missing.bin")]))
+
+        cache_path = FileOps.join_paths(directory, "fingerprints.json")
+        FileOps.load_fingerprint_cache(cache_path)
+        FileOps.save_fingerprint_cache()
+        saved = len(FileOps.fingerprints)
+        FileOps.fingerprints.clear()
+        FileOps.load_fingerprint_cache(cache_path)
+        self.assert_equals(saved, len(FileOps.fingerprints))
+        FileOps.fingerprints.path = None
+
+    def test_sync_directory(self) -> None:
+        """sync_directory copies only new and changed files and optionally deletes extraneous ones."""
+        source = FileOps.join_paths(self.root, "sync", "source")
+        destination = FileOps.join_paths(self.root, "sync", "destination")
+        for file_path in ("a.txt", "sub/b.txt", "sub/deep/c.txt", "ignored.log"):
+            FileOps.write_file(FileOps.join_paths(source, file_path), file_path)
+
+        report = FileOps.sync_directory(source, destination, exclude=["*.log"])
+        self.assert_equals((["a.txt", "sub/b.txt", "sub/deep/c.txt"], [], True), (sorted(report.created), report.updated, report.ok))
+        self.assert_equals(False, FileOps.file_exists(FileOps.join_paths(destination, "ignored.log")))
+        report = FileOps.sync_directory(source, destination, exclude=["*.log"])
+        self.assert_equals((False, 3), (report.changed, report.unchanged))
+
+        FileOps.write_file(FileOps.join_paths(source, "sub", "b.txt"), "changed")
+        FileOps.write_file(FileOps.join_paths(destination, "extra", "x.txt"), "x")
+        FileOps.write_file(FileOps.join_paths(destination, "extra-file.txt"), "x")
+        dry_run = FileOps.sync_directory(source, destination, delete_extraneous=True, exclude=["*.log"], dry_run=True)
+        self.assert_equals((["sub/b.txt"], ["extra", "extra-file.txt"]), (dry_run.updated, dry_run.deleted))
+        self.assert_equals(True, FileOps.file_exists(FileOps.join_paths(destination, "extra", "x.txt")))
+
+        report = FileOps.sync_directory(source, destination, delete_extraneous=True, exclude=["*.log"])
+        self.assert_equals((["sub/b.txt"], 2, len("changed")), (report.updated, len(report.deleted), report.bytes_copied))
+        self.assert_equals("changed", FileOps.load_file(FileOps.join_paths(destination, "sub", "b.txt")))
+        self.assert_equals(["a.txt", "sub"], sorted(os.listdir(destination)))
+
+        os.utime(FileOps.join_paths(destination, "a.txt"), (0, 0))
+        self.assert_equals([], FileOps.sync_directory(source, destination, compare="hash", exclude=["*.log"]).updated)
+        self.assert_equals(["a.txt"], FileOps.sync_directory(source, destination, exclude=["*.log"]).updated)
+
+    def test_background_deletion(self) -> None:
+        """Background deletion frees the path right away and removes the tombstone on the worker pool."""
+        parent = FileOps.join_paths(self.root, "tombstones")
+        for directory in ("cache", "temp"):
+            for index in range(5):
+                FileOps.write_file(FileOps.join_paths(parent, directory, f"sub_{index}", "file.txt"), "data")
+            FileOps.write_file(FileOps.join_paths(parent, directory, "top.txt"), "data")
+        stale = FileOps.join_paths(parent, ".fileops-tombstone-old-0")
+        FileOps.write_file(FileOps.join_paths(stale, "left", "over.txt"), "data")
+
+        future = FileOps.delete_directory(FileOps.join_paths(parent, "cache"), background=True)
+        self.assert_equals(False, FileOps.directory_exists(FileOps.join_paths(parent, "cache")))
+        future.result(timeout=10)
+
+        future = FileOps.purge_directory(FileOps.join_paths(parent, "temp"), background=True)
+        self.assert_equals((True, True), (FileOps.directory_exists(FileOps.join_paths(parent, "temp")), FileOps.is_directory_empty(FileOps.join_paths(parent, "temp"))))
+        # Listings leave out tombstones, also the stale one and those still being removed
+        self.assert_equals(["temp"], FileOps.get_directory_names_in_directory(parent))
+        self.assert_equals([FileOps.join_paths(parent, "temp")], [os.path.normpath(path) for path in FileOps.get_contents_in_directory(parent, include_nested=True)])
+        future.result(timeout=10)
+
+        for stale_future in FileOps.remove_stale_tombstones(parent):
+            stale_future.result(timeout=10)
+        self.assert_equals(["temp"], os.listdir(parent))
+        self.assert_equals(None, FileOps.delete_directory(FileOps.join_paths(parent, "missing"), background=True))
+
+    def test_appender(self) -> None:
+        """Appenders are shared per path, buffer writes and flush on size, time, flush() and close()."""
+        file_path = FileOps.join_paths(self.root, "appender", "progress.log")
+        appender = FileOps.open_appender(file_path, buffer_size=100, flush_interval=None)
+        self.assert_equals(True, appender is FileOps.open_appender(file_path))
+
+        appender.write_line("first")
+        self.assert_equals("", FileOps.load_file(file_path))
+        appender.flush()
+        self.assert_equals("first\n", FileOps.load_file(file_path))
+
+        threads = [threading.Thread(target=lambda: [appender.write_line("x" * 9) for _ in range(100)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assert_equals(True, len(FileOps.load_file(file_path)) >= 4000 - 100)
+
+        appender.close()
+        self.assert_equals(False, appender.closed)
+        appender.close()
+        self.assert_equals((True, 4006), (appender.closed, len(FileOps.load_file(file_path))))
+
+        timed_path = FileOps.join_paths(self.root, "appender", "timed.log")
+        with FileOps.open_appender(timed_path, flush_interval=0.05, binary=True) as timed:
+            timed.write(b"data")
+            deadline = time.monotonic() + 5
+            while not FileOps.load_file(timed_path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assert_equals("data", FileOps.load_file(timed_path))
+
+    def test_json(self) -> None:
+        """JSON is written streamed or compact, read back unchanged and JSON lines are read record by record."""
+        data = {"b": [1, 2.5, None], "a": {"text": "\u00e4"}}
+        file_path = FileOps.join_paths(self.root, "json", "data.json")
+
+        FileOps.write_json(file_path, data)
+        self.assert_equals(json.dumps(data, indent=4), FileOps.load_file(file_path))
+        FileOps.write_json(file_path, data, compact=True, sort_keys=True, ensure_ascii=False)
+        self.assert_equals('{"a":{"text":"\u00e4"},"b":[1,2.5,null]}', FileOps.load_file(file_path))
+        self.assert_equals(data, FileOps.load_json(file_path))
+        FileOps.write_json(file_path, data, atomic=True)
+        self.assert_equals(["b", "a"], list(FileOps.load_json(file_path, object_pairs_hook=OrderedDict)))
+        self.assert_equals("fallback", FileOps.load_json(FileOps.join_paths(self.root, "json", "missing.json"), default="fallback"))
+
+        lines_path = FileOps.join_paths(self.root, "json", "records.jsonl")
+        FileOps.write_json_lines(lines_path, ({"index": index} for index in range(3)))
+        FileOps.append_file(lines_path, "not json\n\n")
+        FileOps.write_json_lines(lines_path, [{"index": 3}], append=True)
+        self.assert_equals([{"index": index} for index in range(4)], list(FileOps.iter_json_lines(lines_path)))
+
+        # Data that cannot be encoded raises and leaves the files unchanged
+        before = {path: FileOps.load_file(path) for path in (file_path, lines_path)}
+        for write in (lambda: FileOps.write_json(file_path, {"a": 1, "b": object()}),
+                      lambda: FileOps.write_json(file_path, {"a": 1, "b": object()}, atomic=True),
+                      lambda: FileOps.write_json_lines(lines_path, [{"index": 4}, {"index": object()}], append=True),
+                      lambda: FileOps.write_json_lines(lines_path, [{"index": 4}, {"index": object()}], atomic=True)):
+            try:
+                write()
+                self.assert_equals("TypeError", "no exception")
+            except TypeError:
+                self.success_count += 1
+        self.assert_equals(before, {path: FileOps.load_file(path) for path in before})
+
+        self.assert_equals(False, FileOps.set_json_backend("missing-backend"))
+        self.assert_equals("json", FileOps.json_backend.name)
+
+    def test_content_cache(self) -> None:
+        """Cached reads are answered from memory until the file changes and stay within the byte budget."""
+        file_path = FileOps.join_paths(self.root, "content", "layout.gui.json")
+        FileOps.write_json(file_path, {"button": {"text": "ok"}})
+        FileOps.clear_content_cache()
+        start = FileOps.get_content_cache_stats()
+
+        first = FileOps.load_json(file_path, cached=True)
+        self.assert_equals(True, first is FileOps.load_json(file_path, cached=True))
+        self.assert_equals(FileOps.load_file(file_path), FileOps.load_file(file_path, cached=True))
+        stats = FileOps.get_content_cache_stats()
+        self.assert_equals((1, 2, 1), (stats.misses - start.misses, stats.hits - start.hits, stats.parsed_hits - start.parsed_hits))
+
+        FileOps.write_json(file_path, {"button": {"text": "cancel"}})
+        self.assert_equals({"button": {"text": "cancel"}}, FileOps.load_json(file_path, cached=True))
+        with open(file_path, "w") as file:
+            file.write('{"changed": "outside"}\r\n')
+        self.assert_equals({"changed": "outside"}, FileOps.load_json(file_path, cached=True))
+        self.assert_equals('{"changed": "outside"}\n', FileOps.load_file(file_path, cached=True))
+
+        FileOps.configure_content_cache(4096)
+        for index in range(20):
+            path = FileOps.join_paths(self.root, "content", f"file_{index}.txt")
+            FileOps.write_file(path, "x" * 500)
+            FileOps.read_cached(path)
+        stats = FileOps.get_content_cache_stats()
+        self.assert_equals(True, stats.bytes <= 4096 and stats.evictions > 0)
+        self.assert_equals(b"", FileOps.read_cached(FileOps.join_paths(self.root, "content", "missing.txt")))
+        FileOps.configure_content_cache(16 * 1024 * 1024)
+
+    def test_method(self) -> None:
+        """Run all FileOps tests and log results."""
+        for test in (self.test_atomic_write, self.test_streaming_readers, self.test_scan_tree, self.test_patterns, self.test_bulk_transfer,
+                     self.test_same_file_copy, self.test_async_file_ops, self.test_stat_cache, self.test_content_hashing,
+                     self.test_sync_directory, self.test_background_deletion, self.test_appender,
+                     self.test_json, self.test_content_cache):
+            try:
+                test()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in {test.__name__}: {e}")
+        self._temp_directory.cleanup()
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestFileOps()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
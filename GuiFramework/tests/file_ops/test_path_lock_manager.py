@@ -0,0 +1,97 @@
+# GuiFramework/tests/file_ops/test_path_lock_manager.py
+
+import os
+import threading
+
+from typing import Any
+
+from GuiFramework.utilities.file_ops import FileOps
+
+
+class TestPathLockManager:
+    """Test class for the per-path locks used by FileOps."""
+
+    def __init__(self) -> None:
+        """Initialize test lock manager."""
+        self.locks = type(FileOps.locks)()
+        self.root = os.path.abspath("lock_test_root")
+        self.success_count: int = 0
+        self.fail_count: int = 0
+        self.error_count: int = 0
+
+    def assert_equals(self, expected: Any, actual: Any) -> None:
+        """Assert if expected equals actual, incrementing the respective count."""
+        try:
+            if expected == actual:
+                self.success_count += 1
+            else:
+                print(f"Expected: {expected}, Actual: {actual}")
+                self.fail_count += 1
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}\n")
+
+    def _try_in_thread(self, shared=(), exclusive=(), timeout: float = 0.2) -> bool:
+        """Return True if another thread gets the given locks within timeout."""
+        acquired = threading.Event()
+
+        def worker() -> None:
+            with self.locks.locked(shared=shared, exclusive=exclusive):
+                acquired.set()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return acquired.wait(timeout)
+
+    def test_method(self) -> None:
+        """Run tests on the lock manager and log results."""
+        file_a = os.path.join(self.root, "dir", "a.txt")
+        file_b = os.path.join(self.root, "dir", "b.txt")
+        directory = os.path.join(self.root, "dir")
+        try:
+            # Writers on different files do not block each other
+            with self.locks.exclusive(file_a):
+                self.assert_equals(True, self._try_in_thread(exclusive=(file_b,)))
+
+            # Readers share a file, writers are excluded
+            with self.locks.shared(file_a):
+                self.assert_equals(True, self._try_in_thread(shared=(file_a,)))
+                self.assert_equals(False, self._try_in_thread(exclusive=(file_a,)))
+
+            # An exclusive directory lock covers its whole subtree
+            with self.locks.exclusive(directory):
+                self.assert_equals(False, self._try_in_thread(shared=(file_b,)))
+            with self.locks.shared(file_a):
+                self.assert_equals(False, self._try_in_thread(exclusive=(directory,)))
+
+            # Reentrancy within one thread
+            with self.locks.exclusive(file_a):
+                with self.locks.locked(shared=(file_a,), exclusive=(file_a,)):
+                    self.assert_equals(False, self._try_in_thread(shared=(file_a,)))
+
+            # Pure path helpers never touch the lock manager
+            with FileOps.locks.exclusive(self.root):
+                self.assert_equals(file_a, FileOps.join_paths(directory, "a.txt"))
+                self.assert_equals(".txt", FileOps.get_file_extension(file_a))
+                self.assert_equals(directory, FileOps.get_directory_name(file_a))
+
+        except Exception as e:
+            self.error_count += 1
+            print(f"Error: {e}")
+
+        # Print success, fail, and error counts
+        print(f"\nTest completed with {self.success_count} successes, {self.fail_count} failures, and {self.error_count} errors.")
+
+
+def main() -> None:
+    """Main function to run the test."""
+    try:
+        test = TestPathLockManager()
+        test.test_method()
+    except Exception as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
+    input("Press any key to continue...")
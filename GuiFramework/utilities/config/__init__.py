@@ -10,12 +10,14 @@ from .config_file_handler import ConfigFileHandler, ConfigFileHandlerConfig
 from .config_dynamic_store import ConfigDynamicStore
 from .config_types import ConfigKey, ConfigKeyList, ConfigVariable
 from .custom_type_handler_base import CustomTypeHandlerBase
+from .config_storage_base import ConfigStorageBase
 
 __all__ = [
     "ConfigKey",
     "ConfigKeyList",
     "ConfigVariable",
     "CustomTypeHandlerBase",
+    "ConfigStorageBase",
     "ConfigHandler",
     "ConfigHandlerMixin",
     "ConfigFileHandler",
@@ -1,7 +1,9 @@
 # GuiFramework/utilities/config/config_file_handler.py
 
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
+from .config_storage_base import ConfigStorageBase
 from .internal._config_file_handler import _ConfigFileHandler, ConfigFileHandlerConfig
 
 
@@ -13,14 +15,24 @@ class ConfigFileHandler:
         """Registers a new configuration."""
         _ConfigFileHandler._add_config(config_name, handler_config, default_config)
 
+    @staticmethod
+    def register_storage(name: str, storage_class: Type[ConfigStorageBase]) -> None:
+        """Registers a storage for ConfigFileHandlerConfig.storage."""
+        _ConfigFileHandler._register_storage(name, storage_class)
+
+    @staticmethod
+    def migrate_storage(handler_config: ConfigFileHandlerConfig, source: str = "ini", destination: str = "sqlite") -> int:
+        """Copies custom settings between storages, returns the number copied."""
+        return _ConfigFileHandler._migrate_storage(handler_config, source, destination)
+
     @staticmethod
     def get_custom_config(config_name: str) -> Dict[str, Dict[str, str]]:
-        """Retrieves the entire custom configuration."""
+        """Retrieves a copy of the entire custom configuration."""
         return _ConfigFileHandler._get_custom_config(config_name)
 
     @staticmethod
     def get_default_config(config_name: str) -> Dict[str, Dict[str, str]]:
-        """Retrieves the entire default configuration."""
+        """Retrieves a copy of the entire default configuration."""
         return _ConfigFileHandler._get_default_config(config_name)
 
     @staticmethod
@@ -28,11 +40,43 @@ class ConfigFileHandler:
         """Saves the custom configuration to a file."""
         _ConfigFileHandler._save_custom_config_to_file(config_name)
 
+    @staticmethod
+    @contextmanager
+    def batch(config_name: Optional[str] = None) -> Iterator[None]:
+        """Defers auto saves of one or all configurations until the block ends."""
+        with _ConfigFileHandler._batch(config_name):
+            yield
+
+    @staticmethod
+    def flush(config_name: Optional[str] = None) -> None:
+        """Writes pending auto saves of one or all configurations now."""
+        _ConfigFileHandler._flush(config_name)
+
+    @staticmethod
+    def pending() -> List[str]:
+        """Lists the configurations with auto saves not written yet."""
+        return _ConfigFileHandler._pending()
+
     @staticmethod
     def load_custom_config_from_file(config_name: str) -> None:
         """Loads the custom configuration from a file."""
         _ConfigFileHandler._load_custom_config_from_file(config_name)
 
+    @staticmethod
+    def reload_custom_config(config_name: str) -> Set[Tuple[str, str]]:
+        """Replaces the custom configuration with the saved one, returns the changed (section, option) pairs."""
+        return _ConfigFileHandler._reload_custom_config(config_name)
+
+    @staticmethod
+    def watch(config_name: str, interval: float = 1.0, on_change: Optional[Callable[[str, Set[Tuple[str, str]]], None]] = None) -> None:
+        """Reloads the custom configuration when another program changes it."""
+        _ConfigFileHandler._watch(config_name, interval, on_change)
+
+    @staticmethod
+    def unwatch(config_name: str) -> None:
+        """Stops watching the custom configuration."""
+        _ConfigFileHandler._unwatch(config_name)
+
     @staticmethod
     def sync_custom_config(config_name: str) -> None:
         """Synchronizes the custom configuration."""
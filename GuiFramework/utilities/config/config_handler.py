@@ -1,6 +1,7 @@
 # GuiFramework/utilities/config/config_handler.py
 
-from typing import Any, Dict, Optional, List, Type, Union, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, List, Type, Union, Tuple
 
 from .internal._config_handler import _ConfigHandler, ConfigFileHandlerConfig, CustomTypeHandlerBase, ConfigVariable
 from .config_types import ConfigKey
@@ -16,12 +17,12 @@ class ConfigHandler:
 
     @staticmethod
     def get_custom_config(config_name: str) -> Dict[str, Dict[str, str]]:
-        """Retrieve custom configuration."""
+        """Retrieve a copy of the custom configuration."""
         return _ConfigHandler._get_custom_config(config_name)
 
     @staticmethod
     def get_default_config(config_name: str) -> Dict[str, Dict[str, str]]:
-        """Retrieve default configuration."""
+        """Retrieve a copy of the default configuration."""
         return _ConfigHandler._get_default_config(config_name)
 
     @staticmethod
@@ -29,11 +30,38 @@ class ConfigHandler:
         """Save custom configuration to file."""
         _ConfigHandler._save_custom_config_to_file(config_name)
 
+    @staticmethod
+    @contextmanager
+    def batch(config_name: Optional[str] = None) -> Iterator[None]:
+        """Defer saves and notifications until the block ends."""
+        with _ConfigHandler._batch(config_name):
+            yield
+
+    @staticmethod
+    def flush(config_name: Optional[str] = None) -> None:
+        """Write pending auto saves now."""
+        _ConfigHandler._flush(config_name)
+
+    @staticmethod
+    def pending() -> List[str]:
+        """List configurations with unwritten auto saves."""
+        return _ConfigHandler._pending()
+
     @staticmethod
     def load_custom_config_from_file(config_name: str) -> None:
         """Load custom configuration from file."""
         _ConfigHandler._load_custom_config_from_file(config_name)
 
+    @staticmethod
+    def watch(config_name: str, interval: float = 1.0, widget: Optional[Any] = None) -> None:
+        """Reload the custom configuration and update its variables when another program changes it."""
+        _ConfigHandler._watch(config_name, interval, widget)
+
+    @staticmethod
+    def unwatch(config_name: str) -> None:
+        """Stop watching the custom configuration."""
+        _ConfigHandler._unwatch(config_name)
+
     @staticmethod
     def sync_custom_config(config_name: str) -> None:
         """Synchronize custom configuration."""
@@ -71,6 +99,16 @@ class ConfigHandler:
         """Retrieve multiple settings."""
         return _ConfigHandler._get_settings(config_keys)
 
+    @staticmethod
+    def cache_stats() -> Dict[str, float]:
+        """Report hits, misses and hit rate of the setting cache."""
+        return _ConfigHandler._cache_stats()
+
+    @staticmethod
+    def clear_cache(reset_stats: bool = False) -> None:
+        """Drop all cached setting values."""
+        _ConfigHandler._clear_cache(reset_stats)
+
     @staticmethod
     def reset_setting(config_key: ConfigKey, auto_save: bool = None) -> None:
         """Reset a single setting to default."""
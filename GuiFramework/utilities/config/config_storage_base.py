@@ -0,0 +1,118 @@
+# GuiFramework/utilities/config/config_storage_base.py
+
+from abc import ABC, abstractmethod
+from configparser import ConfigParser
+from typing import Any, Callable, List, Optional
+
+# Kinds of change records, each record is a list starting with its kind
+SET_OPTION = "s"  # [kind, section, option, value]
+REMOVE_OPTION = "o"  # [kind, section, option]
+SET_SECTION = "S"  # [kind, section, {option: value}]
+REMOVE_SECTION = "r"  # [kind, section]
+SET_ALL = "a"  # [kind, {section: {option: value}}]
+
+
+def apply_record(parser: ConfigParser, record: List[Any]) -> None:
+    """Apply one change record to parser."""
+    kind = record[0]
+    if kind == SET_OPTION:
+        _, section, option, value = record
+        if not parser.has_section(section):
+            parser.add_section(section)
+        parser.set(section, option, value)
+    elif kind == REMOVE_OPTION:
+        _, section, option = record
+        if parser.has_section(section):
+            parser.remove_option(section, option)
+    elif kind == SET_SECTION:
+        _, section, options = record
+        parser.remove_section(section)
+        parser.add_section(section)
+        for option, value in options.items():
+            parser.set(section, option, value)
+    elif kind == REMOVE_SECTION:
+        parser.remove_section(record[1])
+    elif kind == SET_ALL:
+        parser.clear()
+        for section, options in record[1].items():
+            parser.add_section(section)
+            for option, value in options.items():
+                parser.set(section, option, value)
+    else:
+        raise ValueError(f"Unknown change record: {record!r}")
+
+
+class ConfigStorageBase(ABC):
+    """
+    Abstract base class for the storage of a custom configuration.
+
+    The ConfigFileHandler keeps the settings in a ConfigParser and reports every change to it as a
+    record. Apart from the callables returned by the write methods, all methods are called with the
+    handler lock held.
+    """
+
+    def __init__(self, handler_config: Any) -> None:
+        self.handler_config = handler_config
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """Return True if the storage holds a saved configuration."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, parser: ConfigParser) -> List[str]:
+        """
+        Load the saved settings into parser.
+
+        Lazy storages may leave sections out and load them in load_section.
+
+        :return: Descriptions of the parts that could not be loaded.
+        """
+        raise NotImplementedError
+
+    def load_section(self, parser: ConfigParser, section: str) -> None:
+        """Load a section left out by load, called before the section is used."""
+
+    def load_all(self, parser: ConfigParser) -> None:
+        """Load every section left out by load."""
+
+    def fully_loaded(self) -> bool:
+        """Return False while sections left out by load are still unloaded."""
+        return True
+
+    def record(self, *record: Any) -> None:
+        """Queue a change record for the next write."""
+
+    def mark(self) -> Any:
+        """Return a mark for rollback_to."""
+        return None
+
+    def rollback_to(self, mark: Any) -> bool:
+        """Drop the records queued since mark, returns False if part of them were written already."""
+        return False
+
+    @abstractmethod
+    def write_changes(self, parser: ConfigParser) -> Optional[Callable[[], None]]:
+        """
+        Persist the queued changes.
+
+        :return: None, or a callable the handler calls after releasing its lock to finish slow work.
+        """
+        raise NotImplementedError
+
+    def write_all(self, parser: ConfigParser) -> Optional[Callable[[], None]]:
+        """Persist the complete configuration, used for explicit saves and compaction."""
+        return self.write_changes(parser)
+
+    def needs_compaction(self) -> bool:
+        """Return True if write_all should run in the background to keep later writes fast."""
+        return False
+
+    def changed_externally(self) -> bool:
+        """
+        Return True if someone else changed the saved configuration since the last call or load.
+
+        Watched configurations poll this. A false positive only costs a reload, so own writes may
+        report a change when they cannot be told apart from others.
+        """
+        return False
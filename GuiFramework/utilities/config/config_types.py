@@ -1,19 +1,22 @@
 # GuiFramework/utilities/config/config_types.py
 
 from threading import RLock
-from functools import lru_cache
-from dataclasses import dataclass
-from collections import defaultdict
-from typing import Any, Optional, Type, Callable, Set
+from dataclasses import FrozenInstanceError
+from typing import Any, Dict, Optional, Type, Callable, Set
 
 from .exceptions import ConfigKeyTypeError, ConfigKeyNotPersistable
 from .custom_type_handler_base import CustomTypeHandlerBase
 
+from .internal._config_codecs import _compile_codec
+
 from GuiFramework.mixins.event_mixin import EventMixin
 
 
 BASIC_TYPES = (str, int, float, bool)
 
+# Variables share these locks instead of allocating one each, picked by the identity of the variable
+_LOCK_STRIPES = tuple(RLock() for _ in range(64))
+
 
 class ConfigKeyList:
     @classmethod
@@ -38,24 +41,54 @@ class ConfigKeyList:
         return [getattr(cls, attr) for attr in dir(cls) if isinstance(getattr(cls, attr), ConfigKey)]
 
 
-@dataclass(frozen=True)
 class ConfigKey:
-    """Represents a configuration key."""
-    name: str
-    section: str = "Default"
-    type_: Type[Any] = None
-    save_to_file: bool = False
-    auto_save: bool = True
-    config_name: str = "Default"
+    """Represents a configuration key.
+
+    Immutable and slotted, the hash is computed once since keys index every variable and cached setting.
+    """
+    __slots__ = ("name", "section", "type_", "save_to_file", "auto_save", "config_name", "_hash")
+
+    def __init__(self, name: str, section: str = "Default", type_: Type[Any] = None, save_to_file: bool = False,
+                 auto_save: bool = True, config_name: str = "Default") -> None:
+        """Initialize the key and validate the type_ attribute."""
+        if type_ is not None and not isinstance(type_, type):
+            raise ConfigKeyTypeError(f"Expected a type object or None for 'type_', got {type(type_).__name__} instead.")
+        fields = (name, section, type_, save_to_file, auto_save, config_name)
+        for slot, value in zip(self.__slots__, fields):
+            object.__setattr__(self, slot, value)
+        object.__setattr__(self, "_hash", hash(fields))
+
+    def _fields(self) -> tuple:
+        return (self.name, self.section, self.type_, self.save_to_file, self.auto_save, self.config_name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
 
-    def __post_init__(self) -> None:
-        """Validate type_ attribute after initialization."""
-        if self.type_ is not None and not isinstance(self.type_, type):
-            raise ConfigKeyTypeError(f"Expected a type object or None for 'type_', got {type(self.type_).__name__} instead.")
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self._fields() == other._fields())
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return (f"ConfigKey(name={self.name!r}, section={self.section!r}, type_={self.type_!r}, save_to_file={self.save_to_file!r}, "
+                f"auto_save={self.auto_save!r}, config_name={self.config_name!r})")
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, self._fields())
 
 
 class ConfigVariable(EventMixin):
-    """Represents a configuration variable."""
+    """Represents a configuration variable.
+
+    Slotted and without own lock or subscriber table until something subscribes, applications may hold tens of thousands.
+    """
+    __slots__ = ("_config_key", "_value", "_default_value", "_type_handler", "_persistable", "_subscribers")
 
     def __init__(self, config_key: ConfigKey, value: Optional[Any] = None, default_value: Optional[Any] = None, type_handler: Optional[CustomTypeHandlerBase] = None) -> None:
         """Initialize a configuration variable."""
@@ -64,8 +97,12 @@ class ConfigVariable(EventMixin):
         self._value = value
         self._default_value = default_value if default_value is not None else value
         self._type_handler = type_handler
-        self._subscribers = defaultdict(set)
-        self._lock = RLock()
+        self._persistable = config_key.type_ in BASIC_TYPES or bool(type_handler)
+        self._subscribers: Optional[Dict[str, Set[Callable]]] = None
+
+    @property
+    def _lock(self) -> RLock:
+        return _LOCK_STRIPES[(id(self) >> 4) % len(_LOCK_STRIPES)]
 
     def _validate_initialization_types(self, config_key: ConfigKey, value: Any, default_value: Any) -> None:
         """Validate types during initialization."""
@@ -86,25 +123,52 @@ class ConfigVariable(EventMixin):
         """Get the default value of the configuration variable."""
         return self._default_value
 
-    def set_value(self, value: Any) -> None:
+    def set_value(self, value: Any, notify: bool = True) -> None:
         """Set the value of the configuration variable."""
         self._validate_type(value, self._config_key.type_, 'value')
         self._value = value
-        self.notify('value_changed', new_value=value)
+        if notify:
+            self.notify('value_changed', new_value=value)
 
-    @lru_cache(maxsize=None)
     def is_persistable(self) -> bool:
         """Check if the configuration variable is persistable."""
-        return self._config_key.type_ in BASIC_TYPES or bool(self._type_handler)
+        return self._persistable
+
+    def subscribe(self, event_type: str, callback: Callable) -> None:
+        """Subscribe a callback to a specified event type."""
+        if not callable(callback):
+            raise ValueError(f"Callback is not callable: {callback}")
+        with self._lock:
+            if self._subscribers is None:
+                self._subscribers = {}
+            self._subscribers.setdefault(event_type, set()).add(callback)
+
+    def unsubscribe(self, event_type: str, callback: Callable) -> None:
+        """Unsubscribe a callback from a specified event type."""
+        with self._lock:
+            callbacks = self._subscribers.get(event_type) if self._subscribers else None
+            if callbacks is not None:
+                callbacks.discard(callback)
+                if not callbacks:
+                    del self._subscribers[event_type]
+
+    def notify(self, event_type: str, *args, **kwargs) -> None:
+        """Notify all subscribers of a specified event type."""
+        if not self._subscribers:  # Most variables never get a subscriber
+            return
+        with self._lock:
+            callbacks = list(self._subscribers.get(event_type, ()))
+        for callback in callbacks:
+            callback(event_type, *args, **kwargs)
 
     def serialize(self) -> str:
         """Serialize the configuration variable for storage."""
         if not self.is_persistable():
             raise ValueError(f"Cannot serialize '{self._config_key.name}': value is not persistable.")
-        return self._type_handler.serialize(self._value) if self._type_handler else str(self._value)
+        return _compile_codec(self._config_key.type_, self._type_handler).serialize(self._value)
 
     def deserialize(self, serialized_value: str) -> Any:
         """Deserialize the configuration variable from storage."""
         if not self.is_persistable():
             raise ValueError(f"Cannot deserialize '{self._config_key.name}': original value is not persistable.")
-        return self._type_handler.deserialize(serialized_value) if self._type_handler else self._config_key.type_(serialized_value)
+        return _compile_codec(self._config_key.type_, self._type_handler).deserialize(serialized_value)
@@ -0,0 +1,32 @@
+# GuiFramework/utilities/config/internal/_config_batch.py
+# ATTENTION: This module is for internal use only
+
+from typing import Any, Dict, Optional, Set, Tuple
+
+from GuiFramework.utilities.config.config_types import ConfigKey, ConfigVariable
+
+
+class _ConfigBatch:
+    """Changes collected by the batch block open on one thread.
+
+    A batch covers one config, or every config when config_name is None. Nested batches join the
+    outermost one, which then covers the configs of both, so the deferred work is applied only once.
+    """
+
+    def __init__(self, config_name: Optional[str] = None) -> None:
+        self.config_name = config_name
+        self.depth = 1
+        self.saves: Set[str] = set()  # Configs with deferred auto saves
+        self.snapshots: Dict[str, Dict[str, Dict[str, str]]] = {}  # Custom configs as they were before the batch changed them
+        self.marks: Dict[str, Tuple[Any, int]] = {}  # Storage mark and change count at the snapshot
+        self.variables: Dict[ConfigKey, Tuple[ConfigVariable, Any]] = {}  # Changed variables and their values before the batch
+        self.replaced_variables: Dict[ConfigKey, ConfigVariable] = {}  # Variables replaced by the batch
+
+    def covers(self, config_name: str) -> bool:
+        return self.config_name is None or self.config_name == config_name
+
+    def join(self, config_name: Optional[str]) -> None:
+        """Enter a nested batch, widening the scope to cover its config as well."""
+        if config_name is None or not self.covers(config_name):
+            self.config_name = None
+        self.depth += 1
@@ -0,0 +1,55 @@
+# GuiFramework/utilities/config/internal/_config_codecs.py
+# ATTENTION: This module is for internal use only
+
+from configparser import ConfigParser
+from typing import Any, Callable, Optional
+
+
+def _parse_bool(value: str) -> bool:
+    """Parses the spellings ConfigParser.getboolean accepts, bool(value) would be True for "False"."""
+    state = ConfigParser.BOOLEAN_STATES.get(value.strip().lower())
+    if state is None:
+        raise ValueError(f"Not a boolean: {value!r}")
+    return state
+
+
+class _Codec:
+    """The serialize and deserialize functions of one value type, resolved once and then called directly."""
+    __slots__ = ("serialize", "deserialize")
+
+    def __init__(self, serialize: Callable[[Any], Optional[str]], deserialize: Callable[[str], Any]) -> None:
+        self.serialize = serialize
+        self.deserialize = deserialize
+
+
+_BASIC_CODECS = {
+    str: _Codec(str, str),
+    int: _Codec(str, int),
+    float: _Codec(str, float),
+    bool: _Codec(str, _parse_bool),
+}
+
+# Keys without a type store strings and write basic values as they are
+_UNTYPED_CODEC = _Codec(lambda value: str(value) if type(value) in _BASIC_CODECS else None, str)
+
+
+def _compile_codec(type_: Optional[type], handler: Any = None) -> _Codec:
+    """Builds the codec for values of type_ from its resolved handler, a custom type handler or a basic type.
+
+    Without a handler, type_ falls back to the nearest basic type in its MRO.
+    """
+    if handler is not None and not isinstance(handler, type):
+        return _Codec(handler.serialize, handler.deserialize)
+    if type_ is None:
+        return _UNTYPED_CODEC
+    base = handler if handler is not None else next((base for base in type_.__mro__ if base in _BASIC_CODECS), None)
+    if base not in _BASIC_CODECS:
+        raise TypeError(f"No codec for type {type_.__name__}.")
+    codec = _BASIC_CODECS[base]
+    if type_ is base:
+        return codec
+
+    # Subclasses such as IntEnum are written as their base value and rebuilt from it
+    format_value = str.__str__ if base is str else base.__repr__
+    parse = codec.deserialize
+    return _Codec(format_value, lambda value: type_(parse(value)))
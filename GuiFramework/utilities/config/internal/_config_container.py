@@ -1,7 +1,7 @@
 # GuiFramework/utilities/config/internal/_config_container.py
 # ATTENTION: This module is for internal use only
 
-from typing import List, Type, Any, Tuple
+from typing import Dict, List, Type, Any, Tuple, Union
 
 from GuiFramework.core.constants import FRAMEWORK_NAME
 from GuiFramework.utilities.config.config_types import ConfigKey, ConfigVariable, BASIC_TYPES
@@ -45,9 +45,10 @@ class _ConfigVariableContainer(_BaseContainer):
 
     def _get_variable(self, config_key: ConfigKey) -> ConfigVariable:
         """Retrieve a configuration variable by its key."""
-        if config_key not in self:
+        variable = self.get(config_key)  # A single lookup, safe against a concurrent delete
+        if variable is None:
             self._log_and_raise_error(ConfigKeyNotFound, f"No ConfigKey found for name {config_key.name}.", caller=self.__class__.__name__ + '._get_variable')
-        return self[config_key]
+        return variable
 
     def _get_variables(self, config_keys: List[ConfigKey]) -> List[ConfigVariable]:
         """Retrieve multiple configuration variables by their keys."""
@@ -55,7 +56,7 @@ class _ConfigVariableContainer(_BaseContainer):
 
     def _get_variable_value(self, config_key: ConfigKey) -> Any:
         """Retrieve the value of a configuration variable by its key."""
-        return self._get_variable(config_key).value
+        return self._get_variable(config_key)._value
 
     def _get_variable_values(self, config_keys: List[ConfigKey]) -> List[Any]:
         """Retrieve the values of multiple configuration variables by their keys."""
@@ -94,6 +95,11 @@ class _ConfigVariableContainer(_BaseContainer):
 
 
 class _TypeHandlerContainer(_BaseContainer):
+    def __init__(self, *args, **kwargs):
+        """Initialize the container and the cache of resolved handlers."""
+        super().__init__(*args, **kwargs)
+        self._resolved: Dict[Type, Any] = {}
+
     def _add_type_handler(self, handler: CustomTypeHandlerBase) -> None:
         """Add a custom type handler."""
         self._validate_type(handler, CustomTypeHandlerBase, 'handler')
@@ -102,27 +108,34 @@ class _TypeHandlerContainer(_BaseContainer):
         if self.get(type_):
             self._log_and_raise_error(HandlerAlreadyExists, f"Custom type handler for type {type_.__name__} already exists.", caller=self.__class__.__name__ + '._add_type_handler')
         self[type_] = handler
+        self._resolved.clear()
 
-    def _add_custom_type_handlers(self, custom_type_handlers: List[CustomTypeHandlerBase]) -> None:
-        """Add multiple custom type handlers."""
+    def _add_custom_type_handlers(self, custom_type_handlers: Union[List[CustomTypeHandlerBase], Dict[Type, CustomTypeHandlerBase]]) -> None:
+        """Add multiple custom type handlers, given as a list or as a dict by type."""
+        if isinstance(custom_type_handlers, dict):
+            custom_type_handlers = list(custom_type_handlers.values())
         for handler in custom_type_handlers:
             self._add_type_handler(handler)
 
     def _get_type_handler(self, type_: Type) -> CustomTypeHandlerBase:
-        """Retrieve a custom type handler by type."""
-        handler = self.get(type_)
-        if handler is None:
-            if type_ in BASIC_TYPES:
-                return type_
-
-        if handler is None:
-            self._log_and_raise_error(HandlerNotFound, f"No type handler found for type {type_.__name__}.", caller=self.__class__.__name__ + '._get_type_handler')
-        return handler
+        """Retrieve the handler of type_ or of its nearest base class, basic types resolve to themselves."""
+        handler = self._resolved.get(type_)
+        if handler is not None:
+            return handler
+        for base in getattr(type_, "__mro__", ()):
+            handler = self.get(base)
+            if handler is None and base in BASIC_TYPES:
+                handler = base
+            if handler is not None:
+                self._resolved[type_] = handler
+                return handler
+        self._log_and_raise_error(HandlerNotFound, f"No type handler found for type {getattr(type_, '__name__', type_)}.", caller=self.__class__.__name__ + '._get_type_handler')
 
     def _delete_type_handler(self, type_: Type) -> None:
         """Delete a custom type handler by type."""
         if type_ in self:
             del self[type_]
+            self._resolved.clear()
         else:
             self._log_and_raise_error(HandlerNotFound, f"No type handler found for type {type_.__name__}.", caller=self.__class__.__name__ + '._delete_type_handler')
 
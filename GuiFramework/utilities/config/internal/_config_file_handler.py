@@ -5,13 +5,25 @@ import threading
 import configparser
 
 from configparser import ConfigParser
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from GuiFramework.core.constants import FRAMEWORK_NAME
 from GuiFramework.utilities.logging import Logger
-from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.file_ops import FileOps, WriteDurability
 from GuiFramework.utilities.config.config_types import ConfigKey
+from GuiFramework.utilities.config.config_storage_base import (
+    ConfigStorageBase, SET_OPTION, REMOVE_OPTION, SET_SECTION, REMOVE_SECTION, SET_ALL, apply_record
+)
+
+from ._config_batch import _ConfigBatch
+from ._config_watcher import _ConfigWatcher
+from ._config_snapshot import _ConfigSnapshot, UNKNOWN
+from ._ini_storage import _IniStorage
+from ._sqlite_storage import _SqliteStorage
+from ._write_behind import _WriteBehindScheduler
+
 
 @dataclass
 class ConfigFileHandlerConfig:
@@ -19,6 +31,12 @@ class ConfigFileHandlerConfig:
     config_path: str = "config"
     default_config_name: str = "default-config.ini"
     custom_config_name: str = "custom-config.ini"
+    save_delay: Optional[float] = None  # Seconds auto saves wait for further changes, None writes every change at once
+    max_save_delay: float = 2.0  # Upper bound for how long a changed custom config stays unsaved
+    storage: str = "ini"  # Name of the storage of the custom config, "ini" or "sqlite" or a registered one
+    journal: bool = False  # Append changes to a journal next to the custom INI instead of rewriting it
+    journal_compact_size: int = 256 * 1024  # Journal size in bytes that triggers writing the custom config in the background
+    durability: WriteDurability = WriteDurability.FLUSH  # How hard writes of the custom INI and its journal wait for the disk
 
     @property
     def default_config_path(self) -> str:
@@ -30,10 +48,21 @@ class ConfigFileHandlerConfig:
         """Returns path to the custom configuration file."""
         return FileOps.join_paths(self.config_path, self.custom_config_name)
 
+    @property
+    def journal_path(self) -> str:
+        """Returns path to the journal of the custom configuration."""
+        return FileOps.join_paths(self.config_path, self.custom_config_name[:-len(".ini")] + ".journal")
+
+    @property
+    def sqlite_path(self) -> str:
+        """Returns path to the SQLite database of the custom configuration."""
+        return FileOps.join_paths(self.config_path, self.custom_config_name[:-len(".ini")] + ".sqlite3")
+
     def __post_init__(self) -> None:
         """Validates configuration after initialization."""
         self._validate_config_path()
         self._validate_config_names()
+        self._validate_save_delays()
 
     def _validate_config_path(self) -> None:
         """Ensures configuration path exists, creates it if not."""
@@ -49,6 +78,15 @@ class ConfigFileHandlerConfig:
         if self.default_config_name == self.custom_config_name:
             raise ValueError("default_config_name and custom_config_name cannot be the same")
 
+    def _validate_save_delays(self) -> None:
+        """Ensures the write-behind delays are usable."""
+        if self.save_delay is not None and self.save_delay < 0:
+            raise ValueError(f"Invalid save_delay: {self.save_delay}")
+        if self.save_delay is not None and self.max_save_delay < self.save_delay:
+            raise ValueError("max_save_delay cannot be shorter than save_delay")
+        if self.journal_compact_size <= 0:
+            raise ValueError(f"Invalid journal_compact_size: {self.journal_compact_size}")
+
 
 @dataclass
 class ConfigData:
@@ -57,6 +95,12 @@ class ConfigData:
     default_config: Optional[Dict[str, Dict[str, str]]] = None
     default_config_parser: ConfigParser = field(default_factory=ConfigParser)
     custom_config_parser: ConfigParser = field(default_factory=ConfigParser)
+    storage: Optional[ConfigStorageBase] = None
+    compacting: bool = False
+    change_count: int = 0  # Changes made to the custom config, compared with saved_change_count by the watcher
+    saved_change_count: int = 0
+    writing: int = 0  # Writes whose slow part runs outside the lock
+    snapshot: Optional[_ConfigSnapshot] = None  # Published for lock-free reads, None sends reads through the lock
 
     def __post_init__(self) -> None:
         self._validate_default_config()
@@ -75,10 +119,20 @@ class ConfigData:
 
 
 class _ConfigFileHandler():
-    """Manages configuration files."""
+    """Manages configuration files.
+
+    Changes are made under lock. Reads use the snapshot each change publishes and only take the
+    lock for values that need interpolation or sections a lazy storage has not loaded yet.
+    """
     configs: Dict[str, ConfigData] = {}
     lock: threading.RLock = threading.RLock()
     logger = Logger.get_logger(FRAMEWORK_NAME)
+    write_behind: _WriteBehindScheduler = None  # Set after the class body, it needs _write_custom_config
+    batches = threading.local()  # The batch open on each thread
+    storages: Dict[str, Type[ConfigStorageBase]] = {"ini": _IniStorage, "sqlite": _SqliteStorage}
+    watcher: _ConfigWatcher = None  # Set after the class body, it needs _check_for_changes
+    change_callbacks: Dict[str, Callable[[str, Set[Tuple[str, str]]], None]] = {}
+    invalidation_listeners: List[Callable[[str, Optional[str], Optional[str]], None]] = []  # Called with the lock held
 
     # Methods for the public interface
     @classmethod
@@ -90,37 +144,184 @@ class _ConfigFileHandler():
             if config_name in cls.configs:
                 cls.logger.log_warning(f"Configuration \"{config_name}\" already exists.", "_ConfigFileHandler._add_config")
                 return
-            cls.configs[config_name] = ConfigData(file_handler_config=handler_config, default_config=default_config)
+            storage = cls._create_storage(handler_config.storage, handler_config, "_add_config")
+            config_data = cls.configs[config_name] = ConfigData(file_handler_config=handler_config, default_config=default_config, storage=storage)
             cls._sync_default_config(config_name)
             cls._sync_custom_config(config_name)
+            # Reads wait for the lock until both configs are loaded
+            cls._publish_snapshot(config_data, force=True)
 
     @classmethod
     def _get_custom_config(cls, config_name: str) -> Dict[str, Dict[str, str]]:
-        """Gets the entire configuration data."""
+        """Gets a copy of the entire configuration data."""
+        config_data = cls._ensure_config_exists(config_name, "_get_config")
+        snapshot = config_data.snapshot
+        if snapshot is not None and snapshot.complete:
+            return cls._copy_config(snapshot.custom)
         with cls.lock:
-            cls._ensure_config_exists(config_name, "_get_config")
-            return cls.configs[config_name].custom_config_parser._sections
+            config_data.storage.load_all(config_data.custom_config_parser)
+            cls._publish_snapshot(config_data)
+            return cls._copy_sections(config_data.custom_config_parser)
 
     @classmethod
     def _get_default_config(cls, config_name: str) -> Dict[str, Dict[str, str]]:
-        """Gets the entire default configuration data."""
+        """Gets a copy of the entire default configuration data."""
+        config_data = cls._ensure_config_exists(config_name, "_get_default_config")
+        snapshot = config_data.snapshot
+        if snapshot is not None:
+            return cls._copy_config(snapshot.default)
         with cls.lock:
-            cls._ensure_config_exists(config_name, "_get_default_config")
-            return cls.configs[config_name].default_config_parser._sections
+            return cls._copy_sections(config_data.default_config_parser)
 
     @classmethod
     def _save_custom_config_to_file(cls, config_name: str) -> None:
         """Saves the custom configuration to a file."""
+        cls._ensure_config_exists(config_name, "_save_custom_config_to_file")
+        cls._write_all(config_name)
+
+    @classmethod
+    def _flush(cls, config_name: Optional[str] = None) -> None:
+        """Writes the pending auto saves of a configuration, or of all configurations, now."""
+        if config_name is not None:
+            cls._ensure_config_exists(config_name, "_flush")
+        cls.write_behind.flush(config_name)
+
+    @classmethod
+    def _pending(cls) -> List[str]:
+        """Returns the names of the configurations with auto saves that are not written yet."""
+        return cls.write_behind.pending()
+
+    @classmethod
+    def _register_storage(cls, name: str, storage_class: Type[ConfigStorageBase]) -> None:
+        """Makes a storage class available under a name for ConfigFileHandlerConfig.storage."""
         with cls.lock:
-            config_data = cls._ensure_config_exists(config_name, "_save_custom_config_to_file")
-            cls._save_config_to_file(config_data.custom_config_parser, config_data.file_handler_config.custom_config_path)
+            if not isinstance(storage_class, type) or not issubclass(storage_class, ConfigStorageBase):
+                cls.logger.log_error(f"Storage {storage_class} is not a subclass of ConfigStorageBase.", "_ConfigFileHandler._register_storage")
+                raise ValueError(f"Storage {storage_class} is not a subclass of ConfigStorageBase.")
+            cls.storages[name] = storage_class
+
+    @classmethod
+    def _migrate_storage(cls, handler_config: ConfigFileHandlerConfig, source: str = "ini", destination: str = "sqlite") -> int:
+        """Copies the custom settings from one storage to another and returns how many were copied.
+
+        The source is left in place. Configurations using either storage must not be registered
+        while they are migrated.
+        """
+        with cls.lock:
+            source_storage = cls._create_storage(source, handler_config, "_migrate_storage")
+            destination_storage = cls._create_storage(destination, handler_config, "_migrate_storage")
+            if not source_storage.exists():
+                cls.logger.log_error(f"No {source} configuration found to migrate for {handler_config.custom_config_path}.", "_ConfigFileHandler._migrate_storage")
+                raise ValueError(f"No {source} configuration found to migrate for {handler_config.custom_config_path}.")
+            parser = ConfigParser()
+            try:
+                for error in source_storage.load(parser):
+                    cls.logger.log_warning(f"Skipped while migrating: {error}", "_ConfigFileHandler._migrate_storage")
+                source_storage.load_all(parser)
+                destination_storage.record(SET_ALL, cls._copy_sections(parser))
+                finish = destination_storage.write_all(parser)
+                if finish is not None:
+                    finish()
+            except Exception as e:
+                cls.logger.log_error(f"Failed to migrate {handler_config.custom_config_path} from {source} to {destination}: {str(e)}", "_ConfigFileHandler._migrate_storage")
+                raise ValueError(f"Failed to migrate {handler_config.custom_config_path} from {source} to {destination}: {str(e)}")
+            return sum(len(options) for options in parser._sections.values())
+
+    @classmethod
+    @contextmanager
+    def _batch(cls, config_name: Optional[str] = None) -> Iterator[_ConfigBatch]:
+        """Defers the auto saves of this thread until the batch ends, then saves each changed config once.
+
+        If an exception leaves the outermost batch, the custom configs are restored to their state
+        before the batch and nothing is saved.
+        """
+        if config_name is not None:
+            cls._ensure_config_exists(config_name, "_batch")
+        batch = getattr(cls.batches, "current", None)
+        if batch is not None:
+            batch.join(config_name)
+            try:
+                yield batch
+            finally:
+                batch.depth -= 1
+            return
+        batch = cls.batches.current = _ConfigBatch(config_name)
+        try:
+            yield batch
+        except BaseException:
+            cls.batches.current = None
+            cls._rollback_batch(batch)
+            raise
+        cls.batches.current = None
+        with cls.lock:
+            for name in batch.saves:
+                cls._schedule_save(name)
 
     @classmethod
     def _load_custom_config_from_file(cls, config_name: str) -> None:
         """Loads the custom configuration from a file."""
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_load_custom_config_from_file")
-            cls._load_config_from_file(config_data.custom_config_parser, config_data.file_handler_config.custom_config_path)
+            if not config_data.storage.exists():
+                raise FileNotFoundError(f"Config file {config_data.file_handler_config.custom_config_path} does not exist")
+            cls._load_custom_config(config_name, config_data)
+
+    @classmethod
+    def _reload_custom_config(cls, config_name: str) -> Set[Tuple[str, str]]:
+        """Replaces the custom configuration with the saved one and returns the (section, option) pairs that changed.
+
+        Only the changed options are touched, unsaved changes are dropped.
+        """
+        with cls.lock:
+            config_data = cls._ensure_config_exists(config_name, "_reload_custom_config")
+            handler_config = config_data.file_handler_config
+            storage = cls._create_storage(handler_config.storage, handler_config, "_reload_custom_config")
+            if not storage.exists():
+                raise FileNotFoundError(f"Config file {handler_config.custom_config_path} does not exist")
+            saved_config = ConfigParser()
+            try:
+                for error in storage.load(saved_config):
+                    cls.logger.log_warning(f"Skipped part of custom configuration {config_name}: {error}", "_ConfigFileHandler._reload_custom_config")
+                storage.load_all(saved_config)
+            except Exception as e:
+                cls.logger.log_error(f"Failed to reload custom configuration for {config_name}: {str(e)}", "_ConfigFileHandler._reload_custom_config")
+                raise ValueError(f"Failed to reload custom configuration for {config_name}: {str(e)}")
+            config_data.storage.load_all(config_data.custom_config_parser)
+            records, changed = cls._diff_sections(config_data.custom_config_parser._sections, saved_config._sections)
+            for record in records:
+                apply_record(config_data.custom_config_parser, record)
+            for section, option in changed:
+                cls._invalidate(config_name, section, option)
+            # The new storage matches the saved state, the old one may still hold queued changes
+            config_data.storage = storage
+            cls.write_behind.discard(config_name)
+            config_data.saved_change_count = config_data.change_count
+            return changed
+
+    @classmethod
+    def _watch(cls, config_name: str, interval: float = 1.0, on_change: Optional[Callable[[str, Set[Tuple[str, str]]], None]] = None) -> None:
+        """Reloads the custom configuration whenever another program changes it.
+
+        on_change(config_name, changed) is called on the watcher thread after each reload that changed
+        options. Reloads wait while the configuration has unsaved changes.
+        """
+        with cls.lock:
+            cls._ensure_config_exists(config_name, "_watch")
+            if interval <= 0:
+                cls.logger.log_error(f"Invalid watch interval: {interval}", "_ConfigFileHandler._watch")
+                raise ValueError(f"Invalid watch interval: {interval}")
+            if on_change is None:
+                cls.change_callbacks.pop(config_name, None)
+            else:
+                cls.change_callbacks[config_name] = on_change
+            cls.watcher.watch(config_name, interval)
+
+    @classmethod
+    def _unwatch(cls, config_name: str) -> None:
+        """Stops watching the custom configuration."""
+        with cls.lock:
+            cls.watcher.unwatch(config_name)
+            cls.change_callbacks.pop(config_name, None)
 
     @classmethod
     def _sync_custom_config(cls, config_name: str) -> None:
@@ -128,11 +329,13 @@ class _ConfigFileHandler():
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_sync_custom_config")
             try:
-                try:
-                    cls._load_config_from_file(config_data.custom_config_parser, config_data.file_handler_config.custom_config_path)
-                except FileNotFoundError:
+                if config_data.storage.exists():
+                    cls._load_custom_config(config_name, config_data)
+                else:
                     cls._repopulate_config(config_data.custom_config_parser, config_data.default_config_parser)
-                    cls._save_config_to_file(config_data.custom_config_parser, config_data.file_handler_config.custom_config_path)
+                    config_data.storage.record(SET_ALL, cls._copy_sections(config_data.custom_config_parser))
+                    cls._invalidate(config_name)
+                    cls._write_all(config_name)
             except Exception as e:
                 cls.logger.log_error(f"Failed to synchronize custom configuration for {config_name}: {str(e)}", "_ConfigFileHandler._sync_custom_config")
                 raise ValueError(f"Failed to synchronize custom configuration for {config_name}: {str(e)}")
@@ -149,6 +352,7 @@ class _ConfigFileHandler():
                     if config_data.default_config:
                         cls._repopulate_config(config_data.default_config_parser, config_data.default_config)
                     cls._save_config_to_file(config_data.default_config_parser, config_data.file_handler_config.default_config_path)
+                cls._invalidate(config_name)
             except Exception as e:
                 cls.logger.log_error(f"Failed to synchronize default configuration for {config_name}: {str(e)}", "_ConfigFileHandler._sync_default_config")
                 raise ValueError(f"Failed to synchronize default configuration for {config_name}: {str(e)}")
@@ -158,10 +362,13 @@ class _ConfigFileHandler():
         """Resets all custom settings to their default values."""
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_reset_config")
+            cls._track_change(config_name, config_data)
             try:
                 cls._repopulate_config(config_data.custom_config_parser, config_data.default_config_parser)
+                config_data.storage.record(SET_ALL, cls._copy_sections(config_data.default_config_parser))
+                cls._invalidate(config_name)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to reset config {config_name}: {str(e)}", "_ConfigFileHandler._reset_config")
                 raise ValueError(f"Failed to reset config {config_name}: {str(e)}")
@@ -171,26 +378,38 @@ class _ConfigFileHandler():
         """Saves a specific setting to the configuration."""
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_save_setting")
+            cls._track_change(config_name, config_data)
             try:
+                config_data.storage.load_section(config_data.custom_config_parser, section)
                 if not config_data.custom_config_parser.has_section(section):
                     config_data.custom_config_parser.add_section(section)
                 config_data.custom_config_parser.set(section, option, value)
+                config_data.storage.record(SET_OPTION, section, option, value)
+                cls._invalidate(config_name, section, option)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to save setting {option} in section {section} for config {config_name}: {str(e)}", "_ConfigFileHandler._save_setting")
                 raise ValueError(f"Failed to save setting {option} in section {section} for config {config_name}: {str(e)}")
 
     @classmethod
     def _save_settings(cls, config_name: str, settings: Dict[str, Dict[str, str]], auto_save: bool = True) -> None:
-        """Saves multiple settings to the configuration."""
+        """Saves multiple settings to the configuration, publishing each changed section once."""
         with cls.lock:
+            config_data = cls._ensure_config_exists(config_name, "_save_settings")
+            cls._track_change(config_name, config_data)
+            parser = config_data.custom_config_parser
             try:
                 for section, options in settings.items():
+                    config_data.storage.load_section(parser, section)
+                    if not parser.has_section(section):
+                        parser.add_section(section)
                     for option, value in options.items():
-                        cls._save_setting(config_name, section, option, value, auto_save=False)
+                        parser.set(section, option, value)
+                        config_data.storage.record(SET_OPTION, section, option, value)
+                    cls._invalidate(config_name, section)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to save settings for config {config_name}: {str(e)}", "_ConfigFileHandler._save_settings")
                 raise ValueError(f"Failed to save settings for config {config_name}: {str(e)}")
@@ -198,10 +417,20 @@ class _ConfigFileHandler():
     @classmethod
     def _get_setting(cls, config_name: str, section: str, option: str, fallback_value: Optional[str] = None, force_default: bool = False) -> str:
         """Retrieves a specific setting from the configuration."""
+        config_data = cls._ensure_config_exists(config_name, "_get_setting")
+        snapshot = config_data.snapshot
+        if snapshot is not None:
+            value = snapshot.get(section, option, force_default)
+            if value is not UNKNOWN:
+                if value is None:
+                    return fallback_value if fallback_value is not None else "NoDefaultValue"
+                return value
         with cls.lock:
-            config_data = cls._ensure_config_exists(config_name, "_get_setting")
             try:
                 if not force_default:
+                    config_data.storage.load_section(config_data.custom_config_parser, section)
+                    if config_data.snapshot is not None and not config_data.snapshot.knows(section):
+                        cls._publish_snapshot(config_data, section)
                     if config_data.custom_config_parser.has_option(section, option):
                         return config_data.custom_config_parser.get(section, option)
                 if config_data.default_config_parser.has_option(section, option):
@@ -213,31 +442,43 @@ class _ConfigFileHandler():
 
     @classmethod
     def _get_settings(cls, config_name: str, settings: Dict[str, Dict[str, str]], force_default: bool = False) -> Dict[str, Dict[str, str]]:
-        """Retrieves multiple settings from the configuration."""
-        with cls.lock:
-            result: Dict[str, Dict[str, str]] = {}
-            try:
-                for section, options in settings.items():
-                    result_section = result.setdefault(section, {})
-                    for option, fallback_value in options.items():
-                        result_section[option] = cls._get_setting(config_name, section, option, fallback_value, force_default)
-            except configparser.Error as e:
-                cls.logger.log_error(f"Failed to get settings for config {config_name}: {str(e)}", "_ConfigFileHandler._get_settings")
-                raise ValueError(f"Failed to get settings for config {config_name}: {str(e)}")
-            return result
+        """Retrieves multiple settings from the configuration, reading them from one snapshot where it has them."""
+        config_data = cls._ensure_config_exists(config_name, "_get_settings")
+        snapshot = config_data.snapshot
+        result: Dict[str, Dict[str, str]] = {}
+        try:
+            for section, options in settings.items():
+                result_section = result.setdefault(section, {})
+                for option, fallback_value in options.items():
+                    value = snapshot.get(section, option, force_default) if snapshot is not None else UNKNOWN
+                    if value is UNKNOWN:
+                        value = cls._get_setting(config_name, section, option, fallback_value, force_default)
+                        snapshot = config_data.snapshot  # The locked read may have published a lazily loaded section
+                    elif value is None:
+                        value = fallback_value if fallback_value is not None else "NoDefaultValue"
+                    result_section[option] = value
+        except configparser.Error as e:
+            cls.logger.log_error(f"Failed to get settings for config {config_name}: {str(e)}", "_ConfigFileHandler._get_settings")
+            raise ValueError(f"Failed to get settings for config {config_name}: {str(e)}")
+        return result
 
     @classmethod
     def _reset_setting(cls, config_name: str, section: str, option: str, auto_save: bool = True) -> None:
         """Resets a specific setting to its default value."""
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_reset_setting")
+            cls._track_change(config_name, config_data)
             try:
+                config_data.storage.load_section(config_data.custom_config_parser, section)
                 if config_data.default_config_parser.has_section(section) and option in config_data.default_config_parser[section]:
                     config_data.custom_config_parser.setdefault(section, {})[option] = config_data.default_config_parser[section][option]
+                    config_data.storage.record(SET_OPTION, section, option, config_data.default_config_parser[section][option])
                 elif config_data.custom_config_parser.has_section(section):
                     del config_data.custom_config_parser[section][option]
+                    config_data.storage.record(REMOVE_OPTION, section, option)
+                cls._invalidate(config_name, section, option)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to reset setting {option} in section {section} for config {config_name}: {str(e)}", "_ConfigFileHandler._reset_setting")
                 raise ValueError(f"Failed to reset setting {option} in section {section} for config {config_name}: {str(e)}")
@@ -251,7 +492,7 @@ class _ConfigFileHandler():
                     for option in options:
                         cls._reset_setting(config_name, section, option, auto_save=False)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to reset settings for config {config_name}: {str(e)}", "_ConfigFileHandler._reset_settings")
                 raise ValueError(f"Failed to reset settings for config {config_name}: {str(e)}")
@@ -261,13 +502,18 @@ class _ConfigFileHandler():
         """Resets all settings in a section to their default values."""
         with cls.lock:
             config_data = cls._ensure_config_exists(config_name, "_reset_section")
+            cls._track_change(config_name, config_data)
             try:
+                config_data.storage.load_section(config_data.custom_config_parser, section)
                 if section in config_data.default_config_parser:
                     config_data.custom_config_parser[section] = {k: v for k, v in config_data.default_config_parser[section].items()}
+                    config_data.storage.record(SET_SECTION, section, dict(config_data.custom_config_parser._sections[section]))
                 elif section in config_data.custom_config_parser:
                     del config_data.custom_config_parser[section]
+                    config_data.storage.record(REMOVE_SECTION, section)
+                cls._invalidate(config_name, section)
                 if auto_save:
-                    cls._save_custom_config_to_file(config_name)
+                    cls._schedule_save(config_name)
             except configparser.Error as e:
                 cls.logger.log_error(f"Failed to reset section {section} for config {config_name}: {str(e)}", "_ConfigFileHandler._reset_section")
                 raise ValueError(f"Failed to reset section {section} for config {config_name}: {str(e)}")
@@ -282,6 +528,218 @@ class _ConfigFileHandler():
             raise ValueError(f"Config {config_name} does not exist in {cls.configs}.")
         return config_data
 
+    @classmethod
+    def _current_batch(cls, config_name: str) -> Optional[_ConfigBatch]:
+        """Returns the batch of this thread if it covers the configuration."""
+        batch = getattr(cls.batches, "current", None)
+        return batch if batch is not None and batch.covers(config_name) else None
+
+    @classmethod
+    def _invalidate(cls, config_name: str, section: Optional[str] = None, option: Optional[str] = None) -> None:
+        """Publishes the changed option, section, or whole configuration and tells the invalidation listeners."""
+        config_data = cls.configs.get(config_name)
+        if config_data is not None:
+            cls._publish_snapshot(config_data, section)
+        for listener in cls.invalidation_listeners:
+            listener(config_name, section, option)
+
+    @classmethod
+    def _publish_snapshot(cls, config_data: ConfigData, section: Optional[str] = None, force: bool = False) -> None:
+        """Replaces the snapshot of a configuration, copying only section if one is given.
+
+        Nothing is published before force creates the first snapshot, or while a DEFAULT section
+        makes ConfigParser inherit values the snapshot does not model.
+        """
+        old = config_data.snapshot
+        if old is None and not force:
+            return
+        custom_parser, default_parser = config_data.custom_config_parser, config_data.default_config_parser
+        if custom_parser._defaults or default_parser._defaults:
+            config_data.snapshot = None
+            return
+        complete = config_data.storage.fully_loaded()
+        if section is None or old is None or complete != old.complete:
+            config_data.snapshot = _ConfigSnapshot(cls._copy_sections(custom_parser), cls._copy_sections(default_parser), complete)
+            return
+        custom = dict(old.custom)
+        options = custom_parser._sections.get(section)
+        if options is None:
+            custom.pop(section, None)
+            absent = old.absent | {section}
+        else:
+            custom[section] = dict(options)
+            absent = old.absent - {section}
+        config_data.snapshot = _ConfigSnapshot(custom, old.default, complete, absent)
+
+    @classmethod
+    def _create_storage(cls, name: str, handler_config: ConfigFileHandlerConfig, caller_method_name: str) -> ConfigStorageBase:
+        """Creates the storage registered under name for a configuration."""
+        storage_class = cls.storages.get(name)
+        if storage_class is None:
+            cls.logger.log_error(f"Unknown storage \"{name}\", registered are {list(cls.storages)}.", f"_ConfigFileHandler.{caller_method_name}")
+            raise ValueError(f"Unknown storage \"{name}\", registered are {list(cls.storages)}.")
+        return storage_class(handler_config)
+
+    @classmethod
+    def _copy_sections(cls, config: ConfigParser) -> Dict[str, Dict[str, str]]:
+        """Returns a copy of the raw sections of a configuration."""
+        return cls._copy_config(config._sections)
+
+    @classmethod
+    def _copy_config(cls, sections: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Returns a copy of sections that callers may change without touching a snapshot or parser."""
+        return {section: dict(options) for section, options in sections.items()}
+
+    @classmethod
+    def _load_custom_config(cls, config_name: str, config_data: ConfigData) -> None:
+        """Loads the custom configuration from its storage."""
+        for error in config_data.storage.load(config_data.custom_config_parser):
+            cls.logger.log_warning(f"Skipped part of custom configuration {config_name}: {error}", "_ConfigFileHandler._load_custom_config")
+        cls._invalidate(config_name)
+        if config_data.storage.needs_compaction():
+            cls._start_compaction(config_name)
+
+    @classmethod
+    def _check_for_changes(cls, config_name: str) -> None:
+        """Reloads a watched custom configuration if its storage was changed by someone else."""
+        with cls.lock:
+            config_data = cls.configs.get(config_name)
+            if config_data is None or config_data.writing or config_data.change_count != config_data.saved_change_count:
+                return
+            try:
+                if not config_data.storage.changed_externally():
+                    return
+                changed = cls._reload_custom_config(config_name)
+            except Exception as e:
+                cls.logger.log_warning(f"Failed to reload changed custom configuration {config_name}: {str(e)}", "_ConfigFileHandler._check_for_changes")
+                return
+            on_change = cls.change_callbacks.get(config_name)
+        if changed and on_change is not None:
+            on_change(config_name, changed)
+
+    @classmethod
+    def _diff_sections(cls, current: Dict[str, Dict[str, str]], saved: Dict[str, Dict[str, str]]) -> Tuple[List[list], Set[Tuple[str, str]]]:
+        """Returns the change records that turn current into saved and the (section, option) pairs they change."""
+        records: List[list] = []
+        changed: Set[Tuple[str, str]] = set()
+        for section, options in saved.items():
+            current_options = current.get(section)
+            if current_options is None:
+                records.append([SET_SECTION, section, dict(options)])
+                changed.update((section, option) for option in options)
+                continue
+            for option, value in options.items():
+                if current_options.get(option) != value:
+                    records.append([SET_OPTION, section, option, value])
+                    changed.add((section, option))
+            for option in current_options.keys() - options.keys():
+                records.append([REMOVE_OPTION, section, option])
+                changed.add((section, option))
+        for section in current.keys() - saved.keys():
+            records.append([REMOVE_SECTION, section])
+            changed.update((section, option) for option in current[section])
+        return records, changed
+
+    @classmethod
+    def _track_change(cls, config_name: str, config_data: ConfigData) -> None:
+        """Counts a change of the custom configuration and remembers it before the first change a batch makes to it."""
+        batch = cls._current_batch(config_name)
+        if batch is not None and config_name not in batch.snapshots:
+            config_data.storage.load_all(config_data.custom_config_parser)
+            batch.snapshots[config_name] = cls._copy_sections(config_data.custom_config_parser)
+            batch.marks[config_name] = (config_data.storage.mark(), config_data.change_count)
+        config_data.change_count += 1
+
+    @classmethod
+    def _rollback_batch(cls, batch: _ConfigBatch) -> None:
+        """Restores the custom configurations changed by a failed batch, saving those written in the meantime."""
+        with cls.lock:
+            for config_name, snapshot in batch.snapshots.items():
+                config_data = cls.configs[config_name]
+                cls._repopulate_config(config_data.custom_config_parser, snapshot)
+                cls._invalidate(config_name)
+                mark, change_count = batch.marks[config_name]
+                if config_data.storage.rollback_to(mark):
+                    config_data.change_count = change_count
+                else:
+                    config_data.storage.record(SET_ALL, snapshot)
+                    cls._schedule_save(config_name)
+
+    @classmethod
+    def _start_compaction(cls, config_name: str) -> None:
+        """Writes the complete custom configuration on a background thread to keep later writes fast."""
+        config_data = cls.configs[config_name]
+        if config_data.compacting:
+            return
+        config_data.compacting = True
+
+        def compact() -> None:
+            try:
+                cls._write_all(config_name)
+            except Exception:
+                pass  # Logged by _write_all, the storage keeps the changes until the next compaction
+            finally:
+                with cls.lock:
+                    config_data.compacting = False
+
+        threading.Thread(target=compact, name=f"ConfigCompaction-{config_name}", daemon=True).start()
+
+    @classmethod
+    def _schedule_save(cls, config_name: str) -> None:
+        """Saves the custom configuration after its save_delay, coalescing the changes made until then."""
+        batch = cls._current_batch(config_name)
+        if batch is not None:
+            batch.saves.add(config_name)
+            return
+        handler_config = cls.configs[config_name].file_handler_config
+        if not handler_config.save_delay:
+            cls._write_custom_config(config_name)
+        else:
+            cls.write_behind.mark_dirty(config_name, handler_config.save_delay, handler_config.max_save_delay)
+
+    @classmethod
+    def _write_custom_config(cls, config_name: str) -> None:
+        """Writes the changes made to the custom configuration since the last write."""
+        cls._write(config_name, write_all=False)
+
+    @classmethod
+    def _write_all(cls, config_name: str) -> None:
+        """Writes the complete custom configuration."""
+        cls._write(config_name, write_all=True)
+
+    @classmethod
+    def _write(cls, config_name: str, write_all: bool) -> None:
+        """Runs a write of the storage under the lock and the slow part it returns after releasing it."""
+        config_data = cls.configs[config_name]
+        try:
+            with cls.lock:
+                cls.write_behind.discard(config_name)
+                change_count = config_data.change_count
+                if write_all:
+                    finish: Optional[Callable[[], None]] = config_data.storage.write_all(config_data.custom_config_parser)
+                else:
+                    finish = config_data.storage.write_changes(config_data.custom_config_parser)
+                    if config_data.storage.needs_compaction():
+                        cls._start_compaction(config_name)
+                config_data.writing += 1
+            try:
+                if finish is not None:
+                    finish()
+            except BaseException:
+                with cls.lock:
+                    config_data.writing -= 1
+                raise
+            with cls.lock:
+                config_data.writing -= 1
+                config_data.saved_change_count = max(config_data.saved_change_count, change_count)
+        except Exception as e:
+            handler_config = config_data.file_handler_config
+            if handler_config.save_delay:
+                # The scheduled write was discarded before the snapshot, retry it so the changes are not dropped
+                cls.write_behind.mark_dirty(config_name, handler_config.max_save_delay, handler_config.max_save_delay)
+            cls.logger.log_error(f"Failed to write custom configuration for {config_name}: {str(e)}", "_ConfigFileHandler._write")
+            raise ValueError(f"Failed to write custom configuration for {config_name}: {str(e)}")
+
     @classmethod
     def _load_config_from_file(cls, config: ConfigParser, config_path: str) -> None:
         """Reads configuration from specified file."""
@@ -323,3 +781,7 @@ class _ConfigFileHandler():
                         config.add_section(section)
                     for option, value in values.items(section):
                         config.set(section, option, value)
+
+
+_ConfigFileHandler.write_behind = _WriteBehindScheduler(_ConfigFileHandler._write_custom_config)
+_ConfigFileHandler.watcher = _ConfigWatcher(_ConfigFileHandler._check_for_changes)
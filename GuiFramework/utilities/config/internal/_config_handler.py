@@ -2,16 +2,22 @@
 # ATTENTION: This module is for internal use only
 
 from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import partial
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 
 from GuiFramework.utilities.config.custom_type_handler_base import CustomTypeHandlerBase
+from ._config_batch import _ConfigBatch
+from ._config_codecs import _Codec, _compile_codec
+from ._config_watcher import _WidgetDispatcher
+from ._setting_cache import _SettingCache, MISSING
 from ._config_file_handler import _ConfigFileHandler, ConfigFileHandlerConfig
 
 from GuiFramework.core.constants import FRAMEWORK_NAME
 from GuiFramework.utilities.logging import Logger
 from GuiFramework.utilities.config.exceptions import *
-from GuiFramework.utilities.config.config_types import ConfigKey, ConfigVariable, BASIC_TYPES
+from GuiFramework.utilities.config.config_types import ConfigKey, ConfigVariable
 from GuiFramework.utilities.config.internal._config_container import _ConfigVariableContainer, _TypeHandlerContainer
 
 
@@ -20,6 +26,10 @@ class _ConfigHandler:
     _config_variables = _ConfigVariableContainer()
     _type_handler_container = _TypeHandlerContainer()
     _lock = RLock()
+    _setting_cache = _SettingCache()
+    _codecs: Dict[ConfigKey, _Codec] = {}  # Compiled on registration or first use, cleared when type handlers change
+    _dispatchers: Dict[str, _WidgetDispatcher] = {}
+    _external_changes: Dict[str, Set[Tuple[str, str]]] = {}  # Reloaded options waiting for their dispatch
 
     @classmethod
     def _add_config(cls, config_name: str, handler_config: ConfigFileHandlerConfig, default_config: Optional[List[CustomTypeHandlerBase]] = None, custom_type_handlers: Optional[Dict[type, CustomTypeHandlerBase]] = None) -> None:
@@ -27,6 +37,8 @@ class _ConfigHandler:
         _ConfigFileHandler._add_config(config_name, handler_config, default_config)
         if custom_type_handlers:
             cls._type_handler_container._add_custom_type_handlers(custom_type_handlers)
+            cls._codecs.clear()
+            cls._setting_cache.clear()
 
     @classmethod
     def _get_custom_config(cls, config_name: str) -> Dict[str, Dict[str, str]]:
@@ -43,11 +55,66 @@ class _ConfigHandler:
         """Saves the custom config to the custom config file."""
         _ConfigFileHandler._save_custom_config_to_file(config_name)
 
+    @classmethod
+    def _flush(cls, config_name: Optional[str] = None) -> None:
+        """Writes the pending auto saves of one or all configs now."""
+        _ConfigFileHandler._flush(config_name)
+
+    @classmethod
+    def _pending(cls) -> List[str]:
+        """Returns the configs with auto saves that are not written yet."""
+        return _ConfigFileHandler._pending()
+
+    @classmethod
+    @contextmanager
+    def _batch(cls, config_name: Optional[str] = None) -> Iterator[None]:
+        """Defers saves and value_changed notifications of this thread until the outermost batch ends.
+
+        Each changed config is then saved once and each variable whose final value differs from its
+        value before the batch notifies once with it. An exception leaving the outermost batch restores
+        the values from before the batch.
+        """
+        with _ConfigFileHandler._batch(config_name) as batch:
+            outermost = batch.depth == 1
+            try:
+                yield
+            except BaseException:
+                if outermost:
+                    cls._rollback_variables(batch)
+                raise
+        if outermost:
+            for variable, old_value in batch.variables.values():
+                if variable._value != old_value:
+                    variable.notify('value_changed', new_value=variable._value)
+
     @classmethod
     def _load_custom_config_from_file(cls, config_name: str) -> None:
-        """Loads the custom config from the custom config file."""
+        """Loads the custom config from the custom config file and updates the variables whose values changed."""
+        with cls._lock:
+            cls._apply_external_changes(config_name, _ConfigFileHandler._reload_custom_config(config_name))
+
+    @classmethod
+    def _watch(cls, config_name: str, interval: float = 1.0, widget: Optional[Any] = None) -> None:
+        """Reloads the custom config whenever another program changes it and updates the affected variables.
+
+        The value_changed events of a reload fire together after all its values are set, on the Tk
+        thread of widget if one is given and on the watcher thread otherwise. Call it on the Tk thread.
+        """
         with cls._lock:
-            _ConfigFileHandler._load_custom_config_from_file(config_name)
+            cls._close_dispatcher(config_name)
+            dispatch: Callable[[Callable[[], None]], None] = lambda callback: callback()
+            if widget is not None:
+                dispatcher = cls._dispatchers[config_name] = _WidgetDispatcher(widget)
+                dispatch = dispatcher.post
+            _ConfigFileHandler._watch(config_name, interval, partial(cls._queue_external_changes, dispatch=dispatch))
+
+    @classmethod
+    def _unwatch(cls, config_name: str) -> None:
+        """Stops watching the custom config."""
+        with cls._lock:
+            _ConfigFileHandler._unwatch(config_name)
+            cls._close_dispatcher(config_name)
+            cls._external_changes.pop(config_name, None)
 
     @classmethod
     def _sync_custom_config(cls, config_name: str) -> None:
@@ -74,7 +141,7 @@ class _ConfigHandler:
         """Saves a setting to a configuration file."""
         try:
             if not isinstance(value, str):
-                serialized_value = cls._serialize(config_key, value)
+                serialized_value = (cls._codecs.get(config_key) or cls._resolve_codec(config_key)).serialize(value)
                 if serialized_value is not None:
                     value = serialized_value
                 if not isinstance(value, str):
@@ -85,14 +152,37 @@ class _ConfigHandler:
 
     @classmethod
     def _save_settings(cls, config_keys: List[Tuple[ConfigKey, Any]]) -> None:
-        for config_key, value in config_keys:
-            cls._save_setting(config_key, value)
+        with cls._batch():
+            for config_key, value in config_keys:
+                cls._save_setting(config_key, value)
 
     @classmethod
     def _get_setting(cls, config_key: ConfigKey, fallback_value: Any = None, force_default: bool = False) -> Any:
-        """Retrieves a setting from a configuration file."""
-        value = _ConfigFileHandler._get_setting(config_key.config_name, config_key.section, config_key.name, fallback_value, force_default)
-        return cls._deserialize(config_key, value)
+        """Retrieves a setting from a configuration file, deserialized values are cached until the setting changes."""
+        value = cls._setting_cache.get(config_key, force_default)
+        if value is not MISSING:
+            return value
+        generation = cls._setting_cache.generation
+        value = _ConfigFileHandler._get_setting(config_key.config_name, config_key.section, config_key.name, None, force_default)
+        codec = cls._codecs.get(config_key) or cls._resolve_codec(config_key)
+        if value == "NoDefaultValue":
+            # Not stored anywhere, the result depends on fallback_value and is not cached
+            return codec.deserialize(fallback_value if fallback_value is not None else value)
+        value = codec.deserialize(value)
+        cls._setting_cache.put(config_key, force_default, value, generation)
+        return value
+
+    @classmethod
+    def _cache_stats(cls) -> Dict[str, float]:
+        """Returns the hits, misses, hit rate, invalidations and size of the setting cache."""
+        return cls._setting_cache.stats()
+
+    @classmethod
+    def _clear_cache(cls, reset_stats: bool = False) -> None:
+        """Drops all cached setting values."""
+        cls._setting_cache.clear()
+        if reset_stats:
+            cls._setting_cache.reset_stats()
 
     @classmethod
     def _get_settings(cls, config_keys: List[Dict[str, Union[ConfigKey, Any, bool]]]) -> Dict[str, Dict[str, Any]]:
@@ -117,18 +207,16 @@ class _ConfigHandler:
         _ConfigFileHandler._reset_setting(config_key.config_name, config_key.section, config_key.name, auto_save or config_key.auto_save)
         if config_key in cls._config_variables:
             variable = cls._config_variables._get_variable(config_key)
-            variable.set_value(variable._default_value)
+            cls._apply_value(variable, variable._default_value)
 
     @classmethod
     def _reset_settings(cls, config_keys: List[ConfigKey]) -> None:
         """Resets multiple settings in a configuration file to their default values."""
-        for config_key in config_keys:
-            cls._reset_setting(config_key)
-        configs_saved = {}
-        for config_key in config_keys:
-            if config_key.config_name not in configs_saved:
-                _ConfigFileHandler._save_custom_config_to_file(config_key.config_name)
-                configs_saved[config_key.config_name] = True
+        with cls._batch():
+            for config_key in config_keys:
+                cls._reset_setting(config_key)
+            for config_name in {config_key.config_name for config_key in config_keys}:
+                _ConfigFileHandler._schedule_save(config_name)
 
     @classmethod
     def _reset_section(cls, config_name: str, section: str, auto_save: bool = True) -> None:
@@ -143,18 +231,12 @@ class _ConfigHandler:
         with cls._lock:
             type_handler = cls._type_handler_container._get_type_handler(config_key.type_)
             variable = ConfigVariable(config_key=config_key, value=value, default_value=default_value, type_handler=type_handler)
-            cls._config_variables._add_variable(variable)
-            config_key = variable._config_key
-            if variable.is_persistable():
-                if init_from_file:
-                    value = cls._get_setting(config_key=config_key)
-                    variable.set_value(value)
-                elif config_key.save_to_file:
-                    cls._save_setting(config_key=config_key, value=variable._value)
+            cls._register_variables([(variable, init_from_file)])
 
     @classmethod
     def _add_variables(cls, variables: List[Union[ConfigVariable, Tuple[ConfigVariable, bool]]]) -> None:
         """Adds multiple variables to the configuration, with an optional flag to initialize from file."""
+        entries: List[Tuple[ConfigVariable, bool]] = []
         for variable in variables:
             if isinstance(variable, ConfigVariable):
                 init_from_file = False
@@ -162,46 +244,114 @@ class _ConfigHandler:
                 variable, init_from_file = variable
             else:
                 raise ConfigVariableTypeError(f"Expected ConfigVariable or (ConfigVariable, bool), got '{type(variable).__name__}'.")
-            cls._add_variable(variable, init_from_file)
+            entries.append((variable, init_from_file))
+        cls._register_variables(entries)
+
+    @classmethod
+    def _register_variables(cls, entries: List[Tuple[ConfigVariable, bool]]) -> None:
+        """Registers variables and initializes them in one batch, reading and saving each config once.
+
+        Variables initialized from file take the stored value and otherwise behave like the others,
+        which save their value if their key saves to file. All or none of the variables are registered.
+        """
+        with cls._lock:
+            added: List[ConfigKey] = []
+            try:
+                for variable, _ in entries:
+                    cls._config_variables._add_variable(variable)
+                    added.append(variable._config_key)
+                with cls._batch():
+                    cls._initialize_variables(entries)
+            except BaseException:
+                for config_key in added:
+                    cls._config_variables.pop(config_key, None)
+                raise
+
+    @classmethod
+    def _initialize_variables(cls, entries: List[Tuple[ConfigVariable, bool]]) -> None:
+        """Reads the values of the variables initialized from file, then saves the values to save per config."""
+        reads: Dict[str, List[ConfigVariable]] = {}
+        saves: List[ConfigVariable] = []
+        for variable, init_from_file in entries:
+            if not variable.is_persistable():
+                continue
+            if variable._config_key not in cls._codecs:
+                cls._resolve_codec(variable._config_key)
+            if init_from_file:
+                reads.setdefault(variable._config_key.config_name, []).append(variable)
+            elif variable._config_key.save_to_file:
+                saves.append(variable)
+
+        for config_name, variables in reads.items():
+            requested: Dict[str, Dict[str, None]] = {}
+            for variable in variables:
+                requested.setdefault(variable._config_key.section, {})[variable._config_key.name] = None
+            stored = _ConfigFileHandler._get_settings(config_name, requested)
+            for variable in variables:
+                config_key = variable._config_key
+                value = stored[config_key.section][config_key.name]
+                if value == "NoDefaultValue":
+                    if config_key.save_to_file:
+                        saves.append(variable)
+                    continue
+                try:
+                    cls._apply_value(variable, cls._deserialize(config_key, value))
+                except Exception as e:
+                    cls._logger.log_warning(f"Could not read setting '{config_key.name}' in [{config_name}][{config_key.section}], keeping its value: {e}", "_ConfigHandler._initialize_variables")
+
+        settings: Dict[str, Dict[str, Dict[str, str]]] = {}
+        auto_saves: Set[str] = set()
+        for variable in saves:
+            config_key = variable._config_key
+            try:
+                value = variable._value if isinstance(variable._value, str) else cls._serialize(config_key, variable._value)
+                if not isinstance(value, str):
+                    raise ValueNotSaveable(f"Expected 'str', got '{type(value).__name__}'.")
+            except Exception as e:
+                cls._logger.log_error(f"Error saving setting '{config_key.name}' in [{config_key.config_name}][{config_key.section}]: {e}", "_ConfigHandler")
+                continue
+            settings.setdefault(config_key.config_name, {}).setdefault(config_key.section, {})[config_key.name] = value
+            if config_key.auto_save:
+                auto_saves.add(config_key.config_name)
+        for config_name, config_settings in settings.items():
+            _ConfigFileHandler._save_settings(config_name, config_settings, config_name in auto_saves)
+
+    # Reads of variables take no lock, a variable and its value are each replaced by a single assignment
 
     @classmethod
     def _get_variable(cls, config_key: ConfigKey) -> ConfigVariable:
         """Retrieves a single variable from the configuration."""
-        with cls._lock:
-            return cls._config_variables._get_variable(config_key)
+        return cls._config_variables._get_variable(config_key)
 
     @classmethod
     def _get_variables(cls, config_keys: List[ConfigKey]) -> List[ConfigVariable]:
         """Retrieves multiple variables from the configuration."""
-        with cls._lock:
-            return cls._config_variables._get_variables(config_keys)
+        return cls._config_variables._get_variables(config_keys)
 
     @classmethod
     def _get_variable_value(cls, config_key: ConfigKey) -> Any:
         """Retrieves the value of a single variable from the configuration."""
-        with cls._lock:
-            return cls._config_variables._get_variable(config_key)._value
+        return cls._config_variables._get_variable(config_key)._value
 
     @classmethod
     def _get_variable_values(cls, config_keys: List[ConfigKey]) -> List[Any]:
         """Retrieves the values of multiple variables from the configuration."""
-        with cls._lock:
-            return cls._config_variables._get_variable_values(config_keys)
+        return cls._config_variables._get_variable_values(config_keys)
 
     @classmethod
     def _set_variable(cls, updated_variable: ConfigVariable) -> None:
         """Updates a single variable in the configuration."""
         with cls._lock:
-            cls._config_variables._set_variable(updated_variable)
-            if updated_variable.config_key.save_to_file and updated_variable.config_key.auto_save:
-                cls._save_setting(config_key=updated_variable.config_key, value=updated_variable._value)
+            cls._replace_variable(updated_variable)
+            if updated_variable._config_key.save_to_file and updated_variable._config_key.auto_save:
+                cls._save_setting(config_key=updated_variable._config_key, value=updated_variable._value)
 
     @classmethod
     def _set_variables(cls, updated_variables: List[ConfigVariable]) -> None:
         """Updates multiple variables in the configuration."""
-        with cls._lock:
-            cls._config_variables._set_variables(updated_variables)
+        with cls._lock, cls._batch():
             for variable in updated_variables:
+                cls._replace_variable(variable)
                 if variable._config_key.save_to_file and variable._config_key.auto_save:
                     cls._save_setting(config_key=variable._config_key, value=variable._value)
 
@@ -209,16 +359,16 @@ class _ConfigHandler:
     def _set_variable_value(cls, config_key: ConfigKey, new_value: Any) -> None:
         """Updates the value of a single variable in the configuration."""
         with cls._lock:
-            cls._config_variables._set_variable_value(config_key, new_value)
+            cls._apply_value(cls._config_variables._get_variable(config_key), new_value)
             if config_key.save_to_file and config_key.auto_save:
                 cls._save_setting(config_key=config_key, value=new_value)
 
     @classmethod
     def _set_variable_values(cls, config_keys: List[Tuple[ConfigKey, Any]]) -> None:
         """Updates the values of multiple variables in the configuration."""
-        with cls._lock:
-            cls._config_variables._set_variable_values(config_keys)
+        with cls._lock, cls._batch():
             for config_key, new_value in config_keys:
+                cls._apply_value(cls._config_variables._get_variable(config_key), new_value)
                 if config_key.save_to_file and config_key.auto_save:
                     cls._save_setting(config_key=config_key, value=new_value)
 
@@ -234,24 +384,92 @@ class _ConfigHandler:
         with cls._lock:
             cls._config_variables._delete_variables(config_keys)
 
+    @classmethod
+    def _apply_value(cls, variable: ConfigVariable, value: Any) -> None:
+        """Sets the value of a variable, deferring its notification while a batch covers its config."""
+        batch = _ConfigFileHandler._current_batch(variable._config_key.config_name)
+        if batch is None:
+            variable.set_value(value)
+            return
+        batch.variables.setdefault(variable._config_key, (variable, variable._value))
+        variable.set_value(value, notify=False)
+
+    @classmethod
+    def _replace_variable(cls, variable: ConfigVariable) -> None:
+        """Replaces a registered variable, remembering the replaced one while a batch covers its config."""
+        batch = _ConfigFileHandler._current_batch(variable._config_key.config_name)
+        if batch is not None and variable._config_key in cls._config_variables:
+            batch.replaced_variables.setdefault(variable._config_key, cls._config_variables[variable._config_key])
+        cls._config_variables._set_variable(variable)
+
+    @classmethod
+    def _rollback_variables(cls, batch: _ConfigBatch) -> None:
+        """Restores the variables changed by a failed batch without notifying subscribers."""
+        with cls._lock:
+            for config_key, variable in batch.replaced_variables.items():
+                cls._config_variables[config_key] = variable
+            for variable, value in batch.variables.values():
+                variable.set_value(value, notify=False)
+
+    @classmethod
+    def _close_dispatcher(cls, config_name: str) -> None:
+        dispatcher = cls._dispatchers.pop(config_name, None)
+        if dispatcher is not None:
+            dispatcher.close()
+
+    @classmethod
+    def _queue_external_changes(cls, config_name: str, changed: Set[Tuple[str, str]], dispatch: Callable[[Callable[[], None]], None]) -> None:
+        """Collects reloaded options until the dispatched update runs, so several reloads update the variables once."""
+        with cls._lock:
+            queued = cls._external_changes.get(config_name)
+            if queued is not None:
+                queued.update(changed)
+                return
+            cls._external_changes[config_name] = set(changed)
+        dispatch(partial(cls._apply_queued_changes, config_name))
+
+    @classmethod
+    def _apply_queued_changes(cls, config_name: str) -> None:
+        with cls._lock:
+            changed = cls._external_changes.pop(config_name, None)
+            if changed:
+                cls._apply_external_changes(config_name, changed)
+
+    @classmethod
+    def _apply_external_changes(cls, config_name: str, changed: Set[Tuple[str, str]]) -> None:
+        """Sets the variables of the changed (section, option) pairs to their reloaded values in one batch."""
+        with cls._lock, cls._batch(config_name):
+            for config_key, variable in list(cls._config_variables.items()):
+                # ConfigParser stores option names in lower case
+                if config_key.config_name != config_name or (config_key.section, config_key.name.lower()) not in changed:
+                    continue
+                if not variable.is_persistable():
+                    continue
+                try:
+                    value = _ConfigFileHandler._get_setting(config_name, config_key.section, config_key.name)
+                    value = variable._default_value if value == "NoDefaultValue" else cls._deserialize(config_key, value)
+                except Exception as e:
+                    cls._logger.log_warning(f"Could not read reloaded setting '{config_key.name}' in [{config_name}][{config_key.section}]: {e}", "_ConfigHandler._apply_external_changes")
+                    continue
+                if value != variable._value:
+                    cls._apply_value(variable, value)
+
+    @classmethod
+    def _resolve_codec(cls, config_key: ConfigKey) -> _Codec:
+        """Resolves the type handler of a ConfigKey once and caches the codec built from it."""
+        handler = cls._type_handler_container._get_type_handler(config_key.type_) if config_key.type_ is not None else None
+        codec = cls._codecs[config_key] = _compile_codec(config_key.type_, handler)
+        return codec
+
     @classmethod
     def _deserialize(cls, config_key: ConfigKey, value: str) -> Any:
         """Deserialize a value based on its ConfigKey type."""
-        handler = cls._type_handler_container._get_type_handler(config_key.type_)
-        if handler and hasattr(handler, 'deserialize'):
-            return handler.deserialize(value)
-        elif config_key.type_ in BASIC_TYPES:
-            return config_key.type_(value)
-        else:
-            return None
+        return (cls._codecs.get(config_key) or cls._resolve_codec(config_key)).deserialize(value)
 
     @classmethod
     def _serialize(cls, config_key: ConfigKey, value: Any) -> str:
         """Serialize a value based on its ConfigKey type."""
-        handler = cls._type_handler_container._get_type_handler(config_key.type_)
-        if handler and hasattr(handler, 'serialize'):
-            return handler.serialize(value)
-        elif type(value) in BASIC_TYPES:
-            return str(value)
-        else:
-            return None
+        return (cls._codecs.get(config_key) or cls._resolve_codec(config_key)).serialize(value)
+
+
+_ConfigFileHandler.invalidation_listeners.append(_ConfigHandler._setting_cache.invalidate)
@@ -0,0 +1,114 @@
+# GuiFramework/utilities/config/internal/_config_journal.py
+# ATTENTION: This module is for internal use only
+
+import os
+import json
+import threading
+
+from configparser import ConfigParser
+from typing import Any, List, Tuple
+
+from GuiFramework.utilities.file_ops import FileOps, WriteDurability
+from GuiFramework.utilities.config.config_storage_base import apply_record
+
+
+class _ConfigJournal:
+    """Append-only file of the changes made to a custom config since its INI file was last written.
+
+    Changes are collected as compact JSON records and appended in one write per save. Replaying the
+    journal in order on top of any INI snapshot taken while it grew yields the current config, so a
+    crash between writing the INI and trimming the journal is harmless. Records are queued under the
+    handler lock; positions are absolute offsets that keep growing across trims. The file is written
+    through FileOps, which holds its path lock and syncs each append and trim according to durability.
+    """
+
+    def __init__(self, path: str, compact_size: int, durability: WriteDurability = WriteDurability.FLUSH) -> None:
+        self.path = path
+        self.compact_size = compact_size
+        self.durability = durability
+        self.records: List[str] = []  # Encoded records not appended yet
+        self.appends = 0
+        self.base = 0  # Absolute position of the first byte of the file
+        self.end = 0  # Absolute position of the end of the file
+        self._lock = threading.Lock()  # Serializes appends and trims, which run outside the handler lock
+
+    @property
+    def size(self) -> int:
+        return self.end - self.base
+
+    def needs_compaction(self) -> bool:
+        return self.size >= self.compact_size
+
+    def record(self, *record: Any) -> None:
+        """Queue a record for the next append."""
+        self.records.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+    def mark(self) -> Tuple[int, int]:
+        """Return a mark for rollback_to."""
+        return self.appends, len(self.records)
+
+    def rollback_to(self, mark: Tuple[int, int]) -> bool:
+        """Drop the records queued since mark, returns False if some of them were already appended."""
+        appends, count = mark
+        if appends != self.appends:
+            return False
+        del self.records[count:]
+        return True
+
+    def append(self) -> None:
+        """Append the queued records to the journal file."""
+        if not self.records:
+            return
+        data = ("\n".join(self.records) + "\n").encode("utf-8")
+        with self._lock:
+            if not FileOps.append_file(self.path, data, durability=self.durability):
+                try:
+                    with FileOps.locks.exclusive(self.path):
+                        os.truncate(self.path, self.size)  # Cut a partial append off so the next one starts on a new line
+                except OSError:
+                    pass
+                raise OSError(f"Failed to append to the journal {self.path}")
+            self.records.clear()
+            self.appends += 1
+            self.end += len(data)
+
+    def trim(self, position: int) -> None:
+        """Remove the records before the absolute position, they are part of a written INI snapshot."""
+        with self._lock:
+            drop = position - self.base
+            if drop <= 0:
+                return
+            with FileOps.locks.shared(self.path):
+                with open(self.path, "rb") as f:
+                    f.seek(drop)
+                    rest = f.read()
+            if not FileOps.write_file(self.path, rest, atomic=True, durability=self.durability):
+                raise OSError(f"Failed to trim the journal {self.path}")
+            self.base = position
+
+    def replay(self, parser: ConfigParser) -> Tuple[int, List[str]]:
+        """Apply the journal file to parser, returns the number of records applied and the errors.
+
+        A torn last record from an interrupted append is cut off so later appends start on a new line.
+        """
+        with self._lock, FileOps.locks.exclusive(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = b""
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                with open(self.path, "r+b") as f:
+                    f.truncate(complete)
+            self.end = self.base + complete
+        applied, errors = 0, []
+        for line_number, line in enumerate(data[:complete].splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                apply_record(parser, json.loads(line))
+                applied += 1
+            except Exception as e:
+                errors.append(f"line {line_number}: {e}")
+        return applied, errors
@@ -0,0 +1,49 @@
+# GuiFramework/utilities/config/internal/_config_snapshot.py
+# ATTENTION: This module is for internal use only
+
+from typing import Any, Dict, FrozenSet
+
+
+UNKNOWN = object()
+
+
+class _ConfigSnapshot:
+    """Immutable view of the custom and default settings of a config for reads without the lock.
+
+    Writers build a new snapshot under the handler lock and replace the old one with a single
+    assignment, copying only the changed section. Nothing reachable from a published snapshot is
+    mutated afterwards, so readers see either the old or the new state, never a mix.
+    """
+    __slots__ = ("custom", "default", "complete", "absent")
+
+    def __init__(self, custom: Dict[str, Dict[str, str]], default: Dict[str, Dict[str, str]], complete: bool, absent: FrozenSet[str] = frozenset()) -> None:
+        self.custom = custom
+        self.default = default
+        self.complete = complete  # False while the storage may still load sections missing from custom
+        self.absent = absent  # Sections known to be missing from the storage of an incomplete snapshot
+
+    def knows(self, section: str) -> bool:
+        """Return True if custom holds section or the section is known to be missing."""
+        return self.complete or section in self.custom or section in self.absent
+
+    def get(self, section: str, option: str, force_default: bool) -> Any:
+        """Return the raw value, None if neither config sets it, or UNKNOWN if the lock has to be taken.
+
+        Values containing % need interpolation by the ConfigParser and are left to the locked path.
+        """
+        option = option.lower()  # ConfigParser.optionxform
+        if not force_default:
+            options = self.custom.get(section)
+            if options is None:
+                if not self.knows(section):
+                    return UNKNOWN
+            else:
+                value = options.get(option)
+                if value is not None:
+                    return value if "%" not in value else UNKNOWN
+        options = self.default.get(section)
+        if options is not None:
+            value = options.get(option)
+            if value is not None:
+                return value if "%" not in value else UNKNOWN
+        return None
@@ -0,0 +1,98 @@
+# GuiFramework/utilities/config/internal/_config_watcher.py
+# ATTENTION: This module is for internal use only
+
+import time
+import queue
+import threading
+
+from typing import Any, Callable, Dict, List, Optional
+
+
+class _ConfigWatcher:
+    """Polls the storages of watched configs for changes made by other programs.
+
+    Each watched config is checked every interval seconds on one background thread. Checks only
+    compare file signatures or a database counter, the config is reloaded only when they differ.
+    """
+
+    def __init__(self, check: Callable[[str], None]) -> None:
+        """check(config_name) looks for external changes of one config and applies them."""
+        self._check = check
+        self._lock = threading.Lock()
+        self._intervals: Dict[str, float] = {}
+        self._next_checks: Dict[str, float] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, config_name: str, interval: float) -> None:
+        """Check config_name every interval seconds, replacing an earlier interval."""
+        with self._lock:
+            self._intervals[config_name] = interval
+            self._next_checks[config_name] = time.monotonic() + interval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def unwatch(self, config_name: str) -> None:
+        """Stop checking config_name."""
+        with self._lock:
+            self._intervals.pop(config_name, None)
+            self._next_checks.pop(config_name, None)
+
+    def watched(self) -> List[str]:
+        """Return the names of the watched configs."""
+        with self._lock:
+            return list(self._intervals)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                next_check = min(self._next_checks.values(), default=None)
+            self._wake.wait(max(0.0, next_check - time.monotonic()) if next_check is not None else None)
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                due = [name for name, next_check in self._next_checks.items() if next_check <= now]
+                for name in due:
+                    self._next_checks[name] = now + self._intervals[name]
+            for name in due:
+                try:
+                    self._check(name)
+                except Exception:
+                    pass  # The check logs its own failures, the watcher has to keep running
+
+
+class _WidgetDispatcher:
+    """Runs callbacks posted from any thread on the Tk thread of a widget.
+
+    Tk must only be called from its own thread, so callbacks are queued and the widget drains the
+    queue with after every interval milliseconds. Create it on the Tk thread.
+    """
+
+    def __init__(self, widget: Any, interval: int = 50) -> None:
+        self.widget = widget
+        self.interval = interval
+        self._queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._after_id = widget.after(interval, self._tick)
+
+    def post(self, callback: Callable[[], None]) -> None:
+        """Queue callback for the Tk thread."""
+        self._queue.put(callback)
+
+    def close(self) -> None:
+        """Stop draining the queue, callbacks still queued are dropped."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self) -> None:
+        try:
+            while True:
+                try:
+                    callback = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            self._after_id = self.widget.after(self.interval, self._tick)
@@ -0,0 +1,129 @@
+# GuiFramework/utilities/config/internal/_ini_storage.py
+# ATTENTION: This module is for internal use only
+
+import io
+import os
+import threading
+import configparser
+
+from configparser import ConfigParser
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.config.config_storage_base import ConfigStorageBase
+
+from ._config_journal import _ConfigJournal
+
+
+class _IniStorage(ConfigStorageBase):
+    """Stores the custom configuration in its INI file, optionally with a journal of later changes.
+
+    Without a journal every write renders the whole file. The text is rendered under the handler
+    lock and written after it is released; a writer whose snapshot was overtaken by a newer one
+    skips its write instead of overwriting the newer file.
+
+    External changes are detected by the modification time and size of the files. Own writes update
+    the known values only if nobody else changed the file before them.
+    """
+
+    def __init__(self, handler_config: Any) -> None:
+        super().__init__(handler_config)
+        self.path = handler_config.custom_config_path
+        self.durability = handler_config.durability
+        self.journal = _ConfigJournal(handler_config.journal_path, handler_config.journal_compact_size, handler_config.durability) if handler_config.journal else None
+        self._write_lock = threading.Lock()
+        self._snapshot_version = 0
+        self._written_version = 0
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def load(self, parser: ConfigParser) -> List[str]:
+        self._signatures = {path: self._stat(path) for path in self._paths()}
+        try:
+            with open(self.path, 'r', encoding="utf-8") as f:
+                parser.read_file(f)
+        except configparser.Error as e:
+            raise ValueError(f"Failed to load config from {self.path}: {e}")
+        if self.journal is None:
+            return []
+        _, errors = self.journal.replay(parser)
+        return [f"{self.journal.path} {error}" for error in errors]
+
+    def record(self, *record: Any) -> None:
+        if self.journal is not None:
+            self.journal.record(*record)
+
+    def mark(self) -> Any:
+        return self._snapshot_version, self.journal.mark() if self.journal is not None else None
+
+    def rollback_to(self, mark: Any) -> bool:
+        version, journal_mark = mark
+        if self.journal is not None and not self.journal.rollback_to(journal_mark):
+            return False
+        return version == self._snapshot_version
+
+    def write_changes(self, parser: ConfigParser) -> Optional[Callable[[], None]]:
+        if self.journal is None:
+            return self.write_all(parser)
+        with self._own_write(self.journal.path):
+            self.journal.append()
+        return None
+
+    def write_all(self, parser: ConfigParser) -> Optional[Callable[[], None]]:
+        self._snapshot_version += 1
+        version = self._snapshot_version
+        buffer = io.StringIO()
+        parser.write(buffer)
+        journal_position = None
+        if self.journal is not None:
+            # Queued records are in the snapshot too, appending them keeps the journal complete if the write fails
+            with self._own_write(self.journal.path):
+                self.journal.append()
+            journal_position = self.journal.end
+
+        def write() -> None:
+            with self._write_lock:
+                if version <= self._written_version:
+                    return
+                with self._own_write(self.path):
+                    written = FileOps.write_file(self.path, buffer.getvalue(), atomic=True, durability=self.durability)
+                if not written:
+                    # The journal still holds the changes, keep it for the next write
+                    raise OSError(f"Failed to write config to {self.path}")
+                self._written_version = version
+            if journal_position is not None:
+                with self._own_write(self.journal.path):
+                    self.journal.trim(journal_position)
+        return write
+
+    def needs_compaction(self) -> bool:
+        return self.journal is not None and self.journal.needs_compaction()
+
+    def changed_externally(self) -> bool:
+        signatures = {path: self._stat(path) for path in self._paths()}
+        if signatures == self._signatures:
+            return False
+        self._signatures = signatures
+        return True
+
+    def _paths(self) -> List[str]:
+        return [self.path] if self.journal is None else [self.path, self.journal.path]
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def _own_write(self, path: str) -> Iterator[None]:
+        """Keeps a change of path by this storage from being reported as external."""
+        before = self._stat(path)
+        yield
+        if self._signatures.get(path) == before:
+            self._signatures[path] = self._stat(path)
@@ -0,0 +1,110 @@
+# GuiFramework/utilities/config/internal/_setting_cache.py
+# ATTENTION: This module is for internal use only
+
+import threading
+
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Set
+
+from GuiFramework.utilities.config.config_types import ConfigKey
+
+
+MISSING = object()
+
+_IMMUTABLE_TYPES = {str, int, float, bool, complex, bytes, type(None)}
+
+
+def _is_immutable(value: Any) -> bool:
+    """Return True for values every caller can share, mutable values are deserialized anew on each read."""
+    if type(value) in _IMMUTABLE_TYPES or isinstance(value, Enum):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+class _SettingCache:
+    """Deserialized setting values by ConfigKey, dropped precisely when their stored value changes.
+
+    Entries are indexed by config, section and lower-case option, the form ConfigParser stores
+    option names in, so a change of one option only drops the keys reading it. A value read while an
+    invalidation ran is returned but not stored, it may already be stale. Only immutable values are
+    stored, since cached values are shared between callers.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+        self._index: Dict[str, Dict[str, Dict[str, Set[Hashable]]]] = {}  # config -> section -> option -> cache keys
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, config_key: ConfigKey, force_default: bool) -> Any:
+        """Return the cached value, or MISSING. Read generation before loading a value to put."""
+        value = self._values.get((config_key, force_default), MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def put(self, config_key: ConfigKey, force_default: bool, value: Any, generation: int) -> None:
+        """Store a value loaded after generation was read, unless it is mutable or an invalidation ran in between."""
+        if not _is_immutable(value):
+            return
+        cache_key = (config_key, force_default)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._values[cache_key] = value
+            options = self._index.setdefault(config_key.config_name, {}).setdefault(config_key.section, {})
+            options.setdefault(config_key.name.lower(), set()).add(cache_key)
+
+    def invalidate(self, config_name: str, section: Optional[str] = None, option: Optional[str] = None) -> None:
+        """Drop the values of an option, a section, or a whole config when section is None."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            sections = self._index.get(config_name)
+            if not sections:
+                return
+            if section is None:
+                dropped = [sections.pop(name) for name in list(sections)]
+            elif option is None:
+                dropped = [sections.pop(section, {})]
+            else:
+                options = sections.get(section, {})
+                dropped = [{option: options.pop(option.lower(), set())}]
+            for options in dropped:
+                for cache_keys in options.values():
+                    for cache_key in cache_keys:
+                        self._values.pop(cache_key, None)
+
+    def clear(self) -> None:
+        """Drop every value, used when the deserialization itself changes."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self._values.clear()
+            self._index.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Return the hits, misses, hit rate, invalidations and number of cached values."""
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "invalidations": self.invalidations,
+            "size": len(self._values),
+        }
+
+    def reset_stats(self) -> None:
+        """Start counting hits, misses and invalidations from zero."""
+        self.hits = self.misses = self.invalidations = 0
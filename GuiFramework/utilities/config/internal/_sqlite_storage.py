@@ -0,0 +1,164 @@
+# GuiFramework/utilities/config/internal/_sqlite_storage.py
+# ATTENTION: This module is for internal use only
+
+import os
+import sqlite3
+
+from configparser import ConfigParser
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+from GuiFramework.utilities.config.config_storage_base import (
+    ConfigStorageBase, SET_OPTION, REMOVE_OPTION, SET_SECTION, REMOVE_SECTION, SET_ALL
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (name TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS settings (
+    section TEXT NOT NULL,
+    option TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (section, option)
+) WITHOUT ROWID;
+"""
+UPSERT_SETTING = "INSERT INTO settings (section, option, value) VALUES (?, ?, ?) ON CONFLICT (section, option) DO UPDATE SET value = excluded.value"
+INSERT_SECTION = "INSERT OR IGNORE INTO sections (name) VALUES (?)"
+
+
+class _SqliteStorage(ConfigStorageBase):
+    """Stores the custom configuration in a SQLite database with one row per setting.
+
+    A write upserts or deletes only the changed rows in one transaction, and WAL mode turns that
+    into an append to the write-ahead log. load only reads the section names, the settings of a
+    section are read the first time the section is used. Commits of other connections are detected
+    by PRAGMA data_version.
+    """
+
+    def __init__(self, handler_config: Any) -> None:
+        super().__init__(handler_config)
+        self.path = handler_config.sqlite_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._records: List[Tuple[Any, ...]] = []
+        self._writes = 0
+        self._unloaded: Set[str] = set()
+        self._data_version: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # Transactions are opened explicitly, the handler lock serializes all use of the connection
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def exists(self) -> bool:
+        if not os.path.isfile(self.path):
+            return False
+        return self._connect().execute("SELECT 1 FROM sections LIMIT 1").fetchone() is not None
+
+    def load(self, parser: ConfigParser) -> List[str]:
+        connection = self._connect()
+        self._data_version = self._read_data_version(connection)
+        sections = {name for name, in connection.execute("SELECT name FROM sections")}
+        loaded = sections.intersection(parser.sections())
+        self._unloaded = sections - loaded
+        for section in loaded:
+            self._read_section(parser, section)
+        return []
+
+    def load_section(self, parser: ConfigParser, section: str) -> None:
+        if section in self._unloaded:
+            self._unloaded.discard(section)
+            self._read_section(parser, section)
+
+    def load_all(self, parser: ConfigParser) -> None:
+        for section in sorted(self._unloaded):
+            self.load_section(parser, section)
+
+    def fully_loaded(self) -> bool:
+        return not self._unloaded
+
+    def _read_section(self, parser: ConfigParser, section: str) -> None:
+        rows = self._connect().execute("SELECT option, value FROM settings WHERE section = ?", (section,))
+        parser.read_dict({section: dict(rows)})
+
+    def record(self, *record: Any) -> None:
+        kind = record[0]
+        if kind == SET_ALL:
+            self._unloaded.clear()
+        elif kind in (SET_SECTION, REMOVE_SECTION):
+            self._unloaded.discard(record[1])
+        self._records.append(record)
+
+    def mark(self) -> Any:
+        return self._writes, len(self._records)
+
+    def rollback_to(self, mark: Any) -> bool:
+        writes, count = mark
+        if writes != self._writes:
+            return False
+        del self._records[count:]
+        return True
+
+    def write_changes(self, parser: ConfigParser) -> Optional[Callable[[], None]]:
+        if not self._records:
+            return None
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            upserts = []
+            for record in self._records:
+                if record[0] == SET_OPTION:
+                    upserts.append(record[1:])
+                    continue
+                # Other records depend on the order of the upserts before them
+                self._execute_upserts(connection, upserts)
+                self._execute(connection, record)
+            self._execute_upserts(connection, upserts)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._records.clear()
+        self._writes += 1
+        return None
+
+    def changed_externally(self) -> bool:
+        data_version = self._read_data_version(self._connect())
+        changed = data_version != self._data_version
+        self._data_version = data_version
+        return changed
+
+    @staticmethod
+    def _read_data_version(connection: sqlite3.Connection) -> int:
+        return connection.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _execute_upserts(connection: sqlite3.Connection, upserts: List[Tuple[str, str, str]]) -> None:
+        if upserts:
+            connection.executemany(INSERT_SECTION, {(section,) for section, _, _ in upserts})
+            connection.executemany(UPSERT_SETTING, upserts)
+            upserts.clear()
+
+    @staticmethod
+    def _execute(connection: sqlite3.Connection, record: Tuple[Any, ...]) -> None:
+        kind = record[0]
+        if kind == REMOVE_OPTION:
+            connection.execute("DELETE FROM settings WHERE section = ? AND option = ?", record[1:])
+        elif kind == SET_SECTION:
+            _, section, options = record
+            connection.execute("DELETE FROM settings WHERE section = ?", (section,))
+            connection.execute(INSERT_SECTION, (section,))
+            connection.executemany(UPSERT_SETTING, [(section, option, value) for option, value in options.items()])
+        elif kind == REMOVE_SECTION:
+            connection.execute("DELETE FROM settings WHERE section = ?", (record[1],))
+            connection.execute("DELETE FROM sections WHERE name = ?", (record[1],))
+        elif kind == SET_ALL:
+            connection.execute("DELETE FROM settings")
+            connection.execute("DELETE FROM sections")
+            for section, options in record[1].items():
+                connection.execute(INSERT_SECTION, (section,))
+                connection.executemany(UPSERT_SETTING, [(section, option, value) for option, value in options.items()])
+        else:
+            raise ValueError(f"Unknown change record: {record!r}")
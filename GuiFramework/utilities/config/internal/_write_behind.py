@@ -0,0 +1,98 @@
+# GuiFramework/utilities/config/internal/_write_behind.py
+# ATTENTION: This module is for internal use only
+
+import time
+import atexit
+import threading
+
+from typing import Callable, Dict, List, Optional
+
+
+class _DirtyConfig:
+    __slots__ = ("first_change", "last_change", "delay", "max_latency")
+
+    def __init__(self, now: float, delay: float, max_latency: float) -> None:
+        self.first_change = now
+        self.last_change = now
+        self.delay = delay
+        self.max_latency = max_latency
+
+    def deadline(self) -> float:
+        return min(self.last_change + self.delay, self.first_change + self.max_latency)
+
+
+class _WriteBehindScheduler:
+    """Coalesces the saves of dirty configs and writes each config once its changes have settled.
+
+    A config is written when no change arrived for delay seconds, and at the latest max_latency
+    seconds after its first unsaved change, so a continuous stream of changes still reaches the disk.
+    Pending configs are written on a timer thread and everything still pending is written at exit.
+    """
+
+    def __init__(self, write: Callable[[str], None]) -> None:
+        """write(config_name) saves one config, it is expected to call discard before taking its snapshot
+        and mark_dirty again if the write fails."""
+        self._write = write
+        self._lock = threading.Lock()
+        self._dirty: Dict[str, _DirtyConfig] = {}
+        self._wake = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        atexit.register(self._flush_at_exit)
+
+    def mark_dirty(self, config_name: str, delay: float, max_latency: float) -> None:
+        """Schedule a write of config_name, postponing an already scheduled one by delay."""
+        now = time.monotonic()
+        with self._lock:
+            dirty = self._dirty.get(config_name)
+            if dirty is None:
+                self._dirty[config_name] = _DirtyConfig(now, delay, max_latency)
+            else:
+                dirty.last_change = now
+                dirty.delay, dirty.max_latency = delay, max_latency
+            self._start_timer()
+        self._wake.set()
+
+    def discard(self, config_name: str) -> None:
+        """Drop the scheduled write of config_name, called by the writer before it takes its snapshot."""
+        with self._lock:
+            self._dirty.pop(config_name, None)
+
+    def pending(self) -> List[str]:
+        """Return the names of the configs with unsaved changes."""
+        with self._lock:
+            return list(self._dirty)
+
+    def flush(self, config_name: Optional[str] = None) -> None:
+        """Write config_name, or every pending config, now if it has unsaved changes."""
+        for name in ([config_name] if config_name is not None else self.pending()):
+            with self._lock:
+                if name not in self._dirty:
+                    continue
+            self._write(name)
+
+    def _flush_at_exit(self) -> None:
+        for name in self.pending():
+            try:
+                self._write(name)
+            except Exception:
+                pass  # Logged by the writer, the remaining configs still get written
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="ConfigWriteBehind", daemon=True)
+            self._timer.start()
+
+    def _run_timer(self) -> None:
+        while True:
+            with self._lock:
+                deadlines = [dirty.deadline() for dirty in self._dirty.values()]
+            self._wake.wait(max(0.0, min(deadlines) - time.monotonic()) if deadlines else None)
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                due = [name for name, dirty in self._dirty.items() if dirty.deadline() <= now]
+            for name in due:
+                try:
+                    self._write(name)
+                except Exception:
+                    pass  # The writer logs its own failures, the timer has to keep running
@@ -1,6 +1,6 @@
 # GuiFramework/utilities/config/mixins/config_file_handler_mixin.py
 
-from typing import Dict, List, Optional
+from typing import Callable, ContextManager, Dict, List, Optional, Set, Tuple
 
 from GuiFramework.utilities.config.config_file_handler import ConfigFileHandler, ConfigFileHandlerConfig
 
@@ -25,10 +25,30 @@ class ConfigFileHandlerMixin:
         """Save custom configuration to file."""
         ConfigFileHandler.save_custom_config_to_file(self.config_name)
 
+    def batch(self) -> ContextManager[None]:
+        """Defer auto saves until the block ends."""
+        return ConfigFileHandler.batch(self.config_name)
+
+    def flush(self) -> None:
+        """Write pending auto saves now."""
+        ConfigFileHandler.flush(self.config_name)
+
+    def has_pending_saves(self) -> bool:
+        """Check for auto saves not written yet."""
+        return self.config_name in ConfigFileHandler.pending()
+
     def load_custom_config_from_file(self) -> None:
         """Load custom configuration from file."""
         ConfigFileHandler.load_custom_config_from_file(self.config_name)
 
+    def watch(self, interval: float = 1.0, on_change: Optional[Callable[[str, Set[Tuple[str, str]]], None]] = None) -> None:
+        """Reload the custom configuration when another program changes it."""
+        ConfigFileHandler.watch(self.config_name, interval, on_change)
+
+    def unwatch(self) -> None:
+        """Stop watching the custom configuration."""
+        ConfigFileHandler.unwatch(self.config_name)
+
     def sync_custom_config(self) -> None:
         """Synchronize custom configuration."""
         ConfigFileHandler.sync_custom_config(self.config_name)
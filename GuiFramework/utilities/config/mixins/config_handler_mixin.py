@@ -1,6 +1,6 @@
 # GuiFramework/utilities/config/mixins/config_handler_mixin.py
 
-from typing import Dict, Optional, Any, List, Union, Tuple, Type
+from typing import ContextManager, Dict, Optional, Any, List, Union, Tuple, Type
 
 from GuiFramework.utilities.config.config_handler import ConfigHandler, ConfigFileHandlerConfig, CustomTypeHandlerBase, ConfigVariable
 
@@ -39,6 +39,18 @@ class ConfigHandlerMixin:
         """Load the custom configuration from file."""
         ConfigHandler.load_custom_config_from_file(self.config_name)
 
+    def watch(self, interval: float = 1.0, widget: Optional[Any] = None) -> None:
+        """Reload the configuration and update its variables when another program changes it."""
+        ConfigHandler.watch(self.config_name, interval, widget)
+
+    def unwatch(self) -> None:
+        """Stop watching the configuration."""
+        ConfigHandler.unwatch(self.config_name)
+
+    def batch(self) -> ContextManager[None]:
+        """Defer saves and notifications of this configuration until the block ends."""
+        return ConfigHandler.batch(self.config_name)
+
     def sync_default_config(self) -> None:
         """Synchronize the default configuration."""
         ConfigHandler.sync_default_config(self.config_name)
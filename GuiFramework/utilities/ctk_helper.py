@@ -3,11 +3,13 @@
 import customtkinter as ctk
 
 from GuiFramework.utilities.logging import Logger
-from GuiFramework.utilities.file_ops import FileOps
+from GuiFramework.utilities.file_ops import FileOps, FileSizes
 
 
 class CtkHelper:
     logger = Logger.get_logger("GuiFramework")
+    LOAD_MARK = "ctk_helper_load"
+    LOAD_CHUNK_SIZE = FileSizes.KB_100.value
 
     @staticmethod
     def load_file_to_textbox(textbox, file_path, overwrite=False, append=False, encoding="utf-8"):
@@ -17,14 +19,19 @@ class CtkHelper:
                 CtkHelper.logger.log_error(f"File not found: {file_path}", "CtkHelper")
                 return
 
-            content = FileOps.load_file(file_path, encoding)
-            if content:
-                if overwrite or not textbox.get("1.0", "end-1c").strip():
-                    textbox.delete("1.0", "end")
-                if append or not textbox.get("1.0", "end-1c").strip():
-                    textbox.insert("end", content)
-                else:
-                    textbox.insert("1.0", content)
+            if FileOps.is_file_empty(file_path):
+                return
+            if overwrite or not textbox.get("1.0", "end-1c").strip():
+                textbox.delete("1.0", "end")
+            # Insert chunk by chunk at a mark that moves along, so the file is never held in memory twice
+            insert_at = "end" if append or not textbox.get("1.0", "end-1c").strip() else "1.0"
+            textbox.mark_set(CtkHelper.LOAD_MARK, insert_at)
+            textbox.mark_gravity(CtkHelper.LOAD_MARK, "right")
+            try:
+                for chunk in FileOps.iter_chunks(file_path, CtkHelper.LOAD_CHUNK_SIZE, encoding=encoding):
+                    textbox.insert(CtkHelper.LOAD_MARK, chunk)
+            finally:
+                textbox.mark_unset(CtkHelper.LOAD_MARK)
         except Exception as e:
             CtkHelper.logger.log_error(f"Error while loading file {file_path}: {e}", "CtkHelper")
 
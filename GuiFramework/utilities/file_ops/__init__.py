@@ -0,0 +1,29 @@
+# GuiFramework/utilities/file_ops/__init__.py
+
+from .file_ops import FileOps, FileSizes, WriteDurability
+from .async_file_ops import AsyncFileOps, TkAsyncLoop
+from .internal._tree_scanner import ScanEntry
+from .internal._path_matcher import PathMatcher
+from .internal._bulk_transfer import TransferProgress, TransferReport
+from .internal._stat_cache import StatCacheStats
+from .internal._directory_sync import SyncReport
+from .internal._appender import Appender
+from .internal._json_codec import JsonBackend
+from .internal._content_cache import ContentCacheStats
+
+__all__ = [
+    "FileOps",
+    "FileSizes",
+    "WriteDurability",
+    "AsyncFileOps",
+    "TkAsyncLoop",
+    "ScanEntry",
+    "PathMatcher",
+    "TransferProgress",
+    "TransferReport",
+    "StatCacheStats",
+    "SyncReport",
+    "Appender",
+    "JsonBackend",
+    "ContentCacheStats",
+]
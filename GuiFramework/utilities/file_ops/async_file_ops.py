@@ -0,0 +1,245 @@
+# GuiFramework/utilities/file_ops/async_file_ops.py
+
+import asyncio
+import threading
+
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional
+
+from .file_ops import FileOps, WriteDurability, FileSizes
+
+
+class AsyncFileOps:
+    """Awaitable versions of the FileOps operations, run on a dedicated thread pool.
+
+    Cancelling the awaiting task discards the result. Calls that have not started yet never run,
+    chunked operations (read_file, scan_tree, copy_many, move_many) stop at the next chunk or job,
+    and single blocking calls that are already running finish in the background. The progress
+    callbacks of copy_many and move_many run on the event loop thread, not on a pool worker.
+    """
+    max_workers: int = 4
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """Return the executor, creating it on first use."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix="AsyncFileOps")
+        return cls._executor
+
+    @classmethod
+    def configure(cls, max_workers: int) -> None:
+        """Set the number of worker threads. Queued calls still run on the old executor, new calls use a new one."""
+        cls.max_workers = max_workers
+        cls.shutdown(wait=False, cancel_pending=False)
+
+    @classmethod
+    def shutdown(cls, wait: bool = True, cancel_pending: bool = True) -> None:
+        """Shut the executor down, a new one is created on the next call. cancel_pending drops the queued calls that have not started."""
+        with cls._executor_lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    @classmethod
+    async def run(cls, function: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function on the executor and return its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.get_executor(), partial(function, *args, **kwargs))
+
+    @classmethod
+    async def _run_cancellable(cls, function: Callable, *args, **kwargs) -> Any:
+        """Run a function that takes a cancel_event and set the event when the awaiting task is cancelled."""
+        cancel_event = threading.Event()
+        try:
+            return await cls.run(function, *args, cancel_event=cancel_event, **kwargs)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    # File Operations
+    @classmethod
+    async def load_file(cls, file_path, encoding='utf-8'):
+        return await cls.run(FileOps.load_file, file_path, encoding)
+
+    @classmethod
+    async def read_file(cls, file_path, binary=False, encoding='utf-8', chunk_size=FileSizes.MB_1.value):
+        """Read a file chunk by chunk so a cancelled read stops early."""
+        return await cls._run_cancellable(_read_chunked, file_path, binary, encoding, chunk_size)
+
+    @classmethod
+    async def tail_lines(cls, file_path, line_count=10, encoding='utf-8'):
+        return await cls.run(FileOps.tail_lines, file_path, line_count, encoding)
+
+    @classmethod
+    async def write_file(cls, file_path, content, append=False, encoding='utf-8', atomic=False, durability=WriteDurability.NONE):
+        return await cls.run(FileOps.write_file, file_path, content, append, encoding, atomic, durability)
+
+    @classmethod
+    async def append_file(cls, file_path, content, encoding='utf-8', durability=WriteDurability.NONE):
+        return await cls.run(FileOps.append_file, file_path, content, encoding, durability)
+
+    @classmethod
+    async def load_json(cls, file_path, encoding='utf-8', default=None):
+        return await cls.run(FileOps.load_json, file_path, encoding, default)
+
+    @classmethod
+    async def write_json(cls, file_path, data, encoding='utf-8', atomic=False, durability=WriteDurability.NONE):
+        return await cls.run(FileOps.write_json, file_path, data, encoding, atomic, durability)
+
+    @classmethod
+    async def delete_file(cls, file_path):
+        return await cls.run(FileOps.delete_file, file_path)
+
+    @classmethod
+    async def copy_file(cls, source_file, destination, preserve_metadata=False):
+        return await cls.run(FileOps.copy_file, source_file, destination, preserve_metadata)
+
+    @classmethod
+    async def move_file(cls, source_file, destination):
+        return await cls.run(FileOps.move_file, source_file, destination)
+
+    @classmethod
+    async def copy_many(cls, jobs, preserve_metadata=False, workers=None, progress=None):
+        """Run FileOps.copy_many, progress is called on the event loop thread."""
+        progress = _on_loop(asyncio.get_running_loop(), progress)
+        return await cls._run_cancellable(FileOps.copy_many, list(jobs), preserve_metadata, workers, progress)
+
+    @classmethod
+    async def move_many(cls, jobs, workers=None, progress=None):
+        """Run FileOps.move_many, progress is called on the event loop thread."""
+        progress = _on_loop(asyncio.get_running_loop(), progress)
+        return await cls._run_cancellable(FileOps.move_many, list(jobs), workers, progress)
+
+    # Directory Operations
+    @classmethod
+    async def create_directory(cls, directory):
+        return await cls.run(FileOps.create_directory, directory)
+
+    @classmethod
+    async def delete_directory(cls, directory, delete_contents=True):
+        return await cls.run(FileOps.delete_directory, directory, delete_contents)
+
+    @classmethod
+    async def purge_directory(cls, directory):
+        return await cls.run(FileOps.purge_directory, directory)
+
+    @classmethod
+    async def scan_tree(cls, directory, max_depth=None, prune=None, follow_symlinks=False, workers=None, on_error=None, include=None, exclude=None):
+        """Return the list of ScanEntry objects scan_tree yields."""
+        scan = partial(FileOps.scan_tree, directory, max_depth, prune, follow_symlinks, workers, on_error, include=include, exclude=exclude)
+        return await cls._run_cancellable(_collect_scan, scan)
+
+    @classmethod
+    async def get_files_in_directory(cls, directory, pattern="", include_nested=False, exclude=None):
+        return await cls.run(FileOps.get_files_in_directory, directory, pattern, include_nested, exclude)
+
+    @classmethod
+    async def get_directories_in_directory(cls, directory, pattern="", include_nested=False, exclude=None):
+        return await cls.run(FileOps.get_directories_in_directory, directory, pattern, include_nested, exclude)
+
+
+def _on_loop(loop, callback):
+    """Wrap a callback so calls from worker threads are scheduled on loop, calls after the loop closed are dropped."""
+    if callback is None:
+        return None
+
+    def call(*args):
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass
+    return call
+
+
+def _read_chunked(file_path, binary, encoding, chunk_size, cancel_event):
+    """Join the chunks of iter_chunks, stopping when cancel_event is set."""
+    chunks = []
+    for chunk in FileOps.iter_chunks(file_path, chunk_size, binary, encoding):
+        if cancel_event.is_set():
+            break
+        chunks.append(chunk)
+    return (b"" if binary else "").join(chunks)
+
+
+def _collect_scan(scan, cancel_event):
+    """Collect a scan_tree iterator, stopping when cancel_event is set."""
+    entries = []
+    iterator = scan()
+    try:
+        for entry in iterator:
+            if cancel_event.is_set():
+                break
+            entries.append(entry)
+    finally:
+        iterator.close()
+    return entries
+
+
+class TkAsyncLoop:
+    """Drives an asyncio event loop from the Tk main loop with widget.after.
+
+    Each tick runs the callbacks that are ready without blocking, so awaiting AsyncFileOps calls from a
+    Tk callback keeps the window responsive. The loop only ticks while it has unfinished tasks.
+
+        tk_loop = TkAsyncLoop(root)
+        tk_loop.submit(AsyncFileOps.load_file(path), on_done=lambda task: show(task.result()))
+    """
+
+    def __init__(self, widget, interval: int = 10, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """widget is any Tk widget, interval is the tick period in milliseconds."""
+        self.widget = widget
+        self.interval = interval
+        self.loop = loop or asyncio.new_event_loop()
+        self._after_id = None
+        self._pending = 0  # Submitted tasks whose done callbacks have not run yet
+
+    def submit(self, coroutine: Coroutine, on_done: Optional[Callable[[asyncio.Task], None]] = None) -> asyncio.Task:
+        """Schedule a coroutine on the loop, on_done is called with the finished task on the Tk thread."""
+        task = self.loop.create_task(coroutine)
+        if on_done is not None:
+            task.add_done_callback(on_done)
+        task.add_done_callback(self._on_task_done)
+        self._pending += 1
+        self._schedule()
+        return task
+
+    def cancel_all(self) -> None:
+        """Cancel every unfinished task on the loop."""
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self._schedule()
+
+    def close(self) -> None:
+        """Stop ticking, cancel what is left and close the loop."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._pending -= 1
+
+    def _schedule(self) -> None:
+        if self._after_id is None:
+            self._after_id = self.widget.after(0, self._tick)
+
+    def _tick(self) -> None:
+        self._after_id = None
+        self.run_once()
+        if self._pending or asyncio.all_tasks(self.loop):
+            self._after_id = self.widget.after(self.interval, self._tick)
+
+    def run_once(self) -> None:
+        """Run one iteration of the event loop without waiting for I/O."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
@@ -0,0 +1,1064 @@
+# GuiFramework/utilities/file_ops/file_ops.py
+
+import os
+import sys
+import mmap
+import json
+import stat
+import atexit
+import shutil
+import hashlib
+import tempfile
+
+from enum import Enum
+from functools import partial
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from .internal._path_lock_manager import _PathLockManager
+from .internal._tree_scanner import _TreeScanner
+from .internal._path_matcher import compile_patterns
+from .internal._stat_cache import _StatCache
+from .internal._content_hasher import _FingerprintCache, fingerprint_key, hash_path
+from .internal._directory_sync import _DirectorySync
+from .internal._tombstone_remover import _TombstoneRemover, is_tombstone
+from .internal._appender import _AppenderRegistry
+from .internal import _json_codec
+from .internal._content_cache import _ContentCache
+from .internal import _bulk_transfer
+
+
+class FileSizes(Enum):
+    KB_1 = 1024
+    KB_10 = 10240
+    KB_100 = 102400
+    MB_1 = 1048576
+    MB_10 = 10485760
+    MB_100 = 104857600
+    GB_1 = 1073741824
+    GB_10 = 10737418240
+    GB_100 = 107374182400
+    TB_1 = 1099511627776
+
+
+def _get_default_file_mode():
+    """Return the mode open() gives new files under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+_DEFAULT_FILE_MODE = _get_default_file_mode()
+
+
+class WriteDurability(Enum):
+    """How hard a write waits for its data to reach the disk."""
+    NONE = 0  # Leave flushing to the OS
+    FLUSH = 1  # Sync the file data before it becomes visible
+    FSYNC = 2  # Sync the file data and its directory entry
+
+
+def _decode_text(data, encoding):
+    """Decode file bytes the way a text mode read does, including the newline translation."""
+    text = data.decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _decode_json(data, encoding, object_pairs_hook):
+    """Parse JSON file bytes, UTF-8 goes to the decoder without a separate decoding step."""
+    if object_pairs_hook is not None:
+        return json.loads(data.decode(encoding), object_pairs_hook=object_pairs_hook)
+    if encoding.replace("-", "").lower() in ("utf8", "utf8sig"):
+        return FileOps.json_backend.loads(data)
+    return FileOps.json_backend.loads(data.decode(encoding))
+
+
+class FileOps:
+    locks = _PathLockManager()
+    stat_cache = _StatCache()
+    content_cache = _ContentCache()
+    fingerprints = _FingerprintCache()
+    tombstones = _TombstoneRemover()
+    json_backend = _json_codec.JsonBackend()
+    appenders = _AppenderRegistry(lambda file_path: FileOps._exclusive_write(file_path), locks.normalize)
+
+    # File Operations
+    @staticmethod
+    def write_file(file_path, content, append=False, encoding='utf-8', atomic=False, durability=WriteDurability.NONE):
+        """Write or append content to a file, returns False if the write failed.
+
+        content is a string, an iterable of lines, or bytes that are written unchanged in binary mode.
+        With atomic=True the content goes to a sibling temp file that replaces the target in one
+        step, so readers see either the old or the new file but never a truncated one.
+        """
+        if atomic:
+            # Readers keep working on the old file until the replace. An append copies the old
+            # content first, so concurrent appends must not start from the same copy.
+            lock = FileOps.locks.exclusive(file_path) if append else FileOps.locks.shared(file_path)
+            with lock:
+                try:
+                    FileOps.ensure_directory_exists(file_path)
+                    FileOps._write_atomic(file_path, content, append, encoding, durability)
+                    return True
+                except Exception as e:
+                    print(f"Error saving file {file_path}: {e}")
+                    return False
+                finally:
+                    FileOps._invalidate(file_path)
+        with FileOps.locks.exclusive(file_path):
+            try:
+                FileOps.ensure_directory_exists(file_path)
+                mode, file_encoding = FileOps._write_mode(content, "a" if append else "w", encoding)
+                with open(file_path, mode, encoding=file_encoding) as file:
+                    FileOps._write_content(file, content)
+                    FileOps._sync_file(file, durability)
+                if durability == WriteDurability.FSYNC and not append:
+                    FileOps._sync_directory(os.path.dirname(os.path.abspath(file_path)))
+                return True
+            except Exception as e:
+                print(f"Error saving file {file_path}: {e}")
+                return False
+            finally:
+                FileOps._invalidate(file_path)
+
+    @staticmethod
+    def append_file(file_path, content, encoding='utf-8', durability=WriteDurability.NONE):
+        """Append content to a file, returns False if the write failed."""
+        return FileOps.write_file(file_path, content, append=True, encoding=encoding, durability=durability)
+
+    @staticmethod
+    def open_appender(file_path, buffer_size=FileSizes.KB_100.value, flush_interval=1.0, encoding='utf-8', binary=False):
+        """Return the Appender of a file, keeping it open and buffering writes for frequent appends.
+
+        Buffered data is written once it reaches buffer_size, after flush_interval seconds (never if
+        None), on flush() and on close(). All callers opening the same path share one Appender and
+        the settings of the first one; each call needs a matching close() or with block. Appenders
+        still open at interpreter exit are flushed and closed. Prints an error and returns None if
+        the file cannot be opened.
+        """
+        try:
+            FileOps.ensure_directory_exists(file_path)
+            return FileOps.appenders.open(file_path, buffer_size, flush_interval, encoding, binary)
+        except Exception as e:
+            print(f"Error opening appender for file {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def clear_file(file_path):
+        """Clear the content of a file."""
+        FileOps.write_file(file_path, "", encoding='utf-8')
+
+    @staticmethod
+    def load_file(file_path, encoding='utf-8', cached=False):
+        """Load and return content from a file.
+
+        With cached=True the text comes from the shared content cache while the file keeps its size
+        and mtime, see read_cached.
+        """
+        with FileOps.locks.shared(file_path):
+            try:
+                if cached:
+                    return FileOps.content_cache.get_parsed(file_path, ("text", encoding), partial(_decode_text, encoding=encoding))
+                with open(file_path, "r", encoding=encoding) as file:
+                    return file.read()
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+                return ""
+            except Exception as e:
+                print(f"Error while loading file {file_path}: {e}")
+                return ""
+
+    @staticmethod
+    def read_cached(file_path):
+        """Return the bytes of a file through the shared content cache; print an error and return b"" on failure.
+
+        Entries are keyed by path and checked against the file's size and mtime_ns on every read, so
+        a file that did not change costs one stat call. The least recently used entries are evicted once
+        the byte budget set with configure_content_cache is exceeded.
+        """
+        with FileOps.locks.shared(file_path):
+            try:
+                return FileOps.content_cache.read(file_path)
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+            except Exception as e:
+                print(f"Error while loading file {file_path}: {e}")
+            return b""
+
+    @staticmethod
+    def configure_content_cache(byte_budget):
+        """Set the total number of bytes the content cache may hold, evicting entries beyond it."""
+        FileOps.content_cache.resize(byte_budget)
+
+    @staticmethod
+    def clear_content_cache():
+        """Drop every entry of the content cache."""
+        FileOps.content_cache.clear()
+
+    @staticmethod
+    def get_content_cache_stats():
+        """Return the hit, miss, eviction and size counters of the content cache."""
+        return FileOps.content_cache.get_stats()
+
+    @staticmethod
+    def iter_lines(file_path, encoding='utf-8'):
+        """Yield the lines of a file one by one, without line endings."""
+        file = FileOps._open_for_streaming(file_path, "r", encoding)
+        if file is None:
+            return
+        with file:
+            for line in file:
+                yield line.rstrip("\r\n")
+
+    @staticmethod
+    def iter_chunks(file_path, size=FileSizes.MB_1.value, binary=False, encoding='utf-8'):
+        """Yield the content of a file in chunks of up to size characters, or bytes if binary."""
+        file = FileOps._open_for_streaming(file_path, "rb" if binary else "r", None if binary else encoding)
+        if file is None:
+            return
+        with file:
+            while True:
+                chunk = file.read(size)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    @contextmanager
+    def open_mapped(file_path):
+        """Map a file read-only into memory and yield it as a bytes-like object.
+
+        Pages are loaded on access, so slicing or searching a huge file does not read all of it.
+        Empty files yield b"" since they cannot be mapped.
+        """
+        with FileOps.locks.shared(file_path):
+            file = open(file_path, "rb")
+        with file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b""
+                return
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    @staticmethod
+    def tail_lines(file_path, line_count=10, encoding='utf-8', block_size=FileSizes.KB_10.value):
+        """Return the last line_count lines of a file, reading backwards from its end.
+
+        Only the blocks holding these lines are read; the encoding must be ASCII compatible.
+        """
+        if line_count <= 0:
+            return []
+        file = FileOps._open_for_streaming(file_path, "rb", None)
+        if file is None:
+            return []
+        with file:
+            position = file.seek(0, os.SEEK_END)
+            blocks = []
+            newline_count = 0
+            while position > 0 and newline_count <= line_count:
+                read_size = min(block_size, position)
+                position -= read_size
+                file.seek(position)
+                block = file.read(read_size)
+                blocks.append(block)
+                newline_count += block.count(b"\n")
+        data = b"".join(reversed(blocks))
+        lines = data.decode(encoding, errors="replace").splitlines()
+        return lines[-line_count:]
+
+    @staticmethod
+    def create_file(file_path, encoding='utf-8'):
+        """Create an empty file."""
+        FileOps.write_file(file_path, "", encoding='utf-8')
+
+    @staticmethod
+    def delete_file(file_path):
+        """Delete a specified file."""
+        with FileOps.locks.exclusive(file_path):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+            except Exception as e:
+                print(f"Failed to delete file {file_path}: {e}")
+            FileOps._invalidate(file_path)
+
+    @staticmethod
+    def copy_file(source_file, destination, preserve_metadata=False):
+        """Copy a file to a specified destination."""
+        destination_path = FileOps._get_destination_path(source_file, destination)
+        with FileOps.locks.locked(shared=(source_file,), exclusive=(destination_path,)):
+            try:
+                FileOps.ensure_directory_exists(destination)
+                _bulk_transfer.copy_file(source_file, destination_path, preserve_metadata)
+            except FileNotFoundError as e:
+                print(f"File not found: {source_file}")
+            except Exception as e:
+                print(f"Error copying file {source_file} to {destination}: {e}")
+            FileOps._invalidate(destination_path)
+
+    @staticmethod
+    def move_file(source_file, destination):
+        """Move a file to a specified destination."""
+        destination_path = FileOps._get_destination_path(source_file, destination)
+        with FileOps.locks.exclusive(source_file, destination_path):
+            try:
+                FileOps.ensure_directory_exists(destination)
+                shutil.move(source_file, destination)
+            except FileNotFoundError as e:
+                print(f"File not found: {source_file}")
+            except Exception as e:
+                print(f"Error moving file {source_file} to {destination}: {e}")
+            FileOps._invalidate(source_file, destination_path, recursive=True)
+
+    @staticmethod
+    def copy_many(jobs, preserve_metadata=False, workers=None, progress=None, cancel_event=None):
+        """Copy many (source, destination) pairs in parallel and return a TransferReport.
+
+        Files are copied inside the kernel where the platform allows it (copy_file_range, sendfile),
+        directories are copied as whole trees. Each job only locks its own paths. progress is called
+        with a TransferProgress after every job, errors are collected per source instead of raised.
+        Jobs that have not started when cancel_event (a threading.Event) is set are skipped.
+        """
+        def transfer(source, destination):
+            try:
+                if os.path.isdir(source):
+                    return _bulk_transfer.copy_tree(source, destination)
+                return _bulk_transfer.copy_file(source, destination, preserve_metadata)
+            finally:
+                FileOps._invalidate(destination, recursive=True)
+
+        def lock_for(source, destination):
+            return FileOps.locks.locked(shared=(source,), exclusive=(destination,))
+
+        return FileOps._run_bulk_transfer(jobs, transfer, lock_for, workers, progress, cancel_event)
+
+    @staticmethod
+    def move_many(jobs, workers=None, progress=None, cancel_event=None):
+        """Move many (source, destination) pairs in parallel and return a TransferReport.
+
+        Moves within one file system are plain renames, others fall back to a copy and delete.
+        """
+        def transfer(source, destination):
+            try:
+                return _bulk_transfer.move_file(source, destination)
+            finally:
+                FileOps._invalidate(source, destination, recursive=True)
+
+        def lock_for(source, destination):
+            return FileOps.locks.exclusive(source, destination)
+
+        return FileOps._run_bulk_transfer(jobs, transfer, lock_for, workers, progress, cancel_event)
+
+    @staticmethod
+    def write_json(file_path, data, encoding='utf-8', atomic=False, durability=WriteDurability.NONE, indent=4, sort_keys=False,
+                   ensure_ascii=True, compact=False):
+        """Write JSON data to a file, raising the error if data cannot be encoded.
+
+        With atomic=True indented output is streamed to the temp file chunk by chunk instead of being
+        built as one string. compact=True (or indent=None) writes without whitespace using the C encoder.
+        A failed encode leaves the file unchanged.
+        """
+        indent = None if compact else indent
+        content = _json_codec.encode(FileOps.json_backend, data, indent, sort_keys, ensure_ascii)
+        FileOps._write_encoded(file_path, content, False, encoding, atomic, durability)
+
+    @staticmethod
+    def load_json(file_path, encoding='utf-8', default=None, object_pairs_hook=None, cached=False):
+        """Load and return JSON data from a file, or default if it cannot be read.
+
+        With cached=True the parsed object is shared through the content cache and must not be modified.
+        """
+        with FileOps.locks.shared(file_path):
+            try:
+                if cached:
+                    parser_key = ("json", encoding, object_pairs_hook, FileOps.json_backend)
+                    return FileOps.content_cache.get_parsed(file_path, parser_key, partial(_decode_json, encoding=encoding, object_pairs_hook=object_pairs_hook))
+                with open(file_path, "rb") as file:
+                    return _decode_json(file.read(), encoding, object_pairs_hook)
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+                return default
+            except Exception as e:
+                print(f"Error while loading JSON file {file_path}: {e}")
+                return default
+
+    @staticmethod
+    def write_json_lines(file_path, records, append=False, encoding='utf-8', atomic=False, durability=WriteDurability.NONE,
+                         sort_keys=False, ensure_ascii=True):
+        """Write records as JSON lines, one compact object per line, raising the error if a record cannot be encoded.
+
+        With atomic=True the lines are streamed to the temp file. A failed encode leaves the file unchanged.
+        """
+        lines = _json_codec.encode_lines(FileOps.json_backend, records, sort_keys, ensure_ascii)
+        FileOps._write_encoded(file_path, lines, append, encoding, atomic, durability)
+
+    @staticmethod
+    def iter_json_lines(file_path):
+        """Yield the records of a JSON lines file one by one; print and skip lines that are not valid JSON."""
+        file = FileOps._open_for_streaming(file_path, "rb", None)
+        if file is None:
+            return
+        with file:
+            for line_number, record, error in _json_codec.iter_decoded_lines(FileOps.json_backend, file):
+                if error is not None:
+                    print(f"Invalid JSON on line {line_number} of {file_path}: {error}")
+                    continue
+                yield record
+
+    @staticmethod
+    def set_json_backend(backend="json"):
+        """Select the JSON encoder and decoder by name ("json", "orjson", "ujson") or as a JsonBackend.
+
+        Returns False and keeps the current backend if the package is not installed. Calls a backend
+        cannot format exactly as requested fall back to the standard library.
+        """
+        if isinstance(backend, str):
+            try:
+                backend = _json_codec.create_backend(backend)
+            except (ImportError, ValueError) as e:
+                print(f"JSON backend {backend} is not available: {e}")
+                return False
+        FileOps.json_backend = backend
+        return True
+
+    @staticmethod
+    def change_file_extension(file_path, new_extension):
+        """Change the extension of a specified file."""
+        base, _ = os.path.splitext(file_path)
+        new_file_path = f"{base}.{new_extension}"
+        with FileOps.locks.exclusive(file_path, new_file_path):
+            try:
+                os.rename(file_path, new_file_path)
+            except Exception as e:
+                print(f"Error changing file extension of file {file_path}: {e}")
+            FileOps._invalidate(file_path, new_file_path)
+
+    # Content Hashing
+    @staticmethod
+    def hash_file(file_path, algorithm="blake2b", chunk_size=FileSizes.MB_1.value, use_cache=True):
+        """Return the hex digest of a file, read in chunks; print an error and return "" on failure.
+
+        With use_cache the digest is looked up in FileOps.fingerprints by (device, inode, size, mtime_ns)
+        first, so a file that has not changed since it was last hashed is not read again.
+        """
+        try:
+            hashlib.new(algorithm)
+        except ValueError:
+            print(f"Unsupported hash algorithm: {algorithm}")
+            return ""
+        with FileOps.locks.shared(file_path):
+            try:
+                if use_cache:
+                    digest = FileOps.fingerprints.get(fingerprint_key(algorithm, os.stat(file_path)))
+                    if digest is not None:
+                        return digest
+                digest, file_stat = hash_path(file_path, algorithm, chunk_size)
+                if use_cache and file_stat is not None:
+                    FileOps.fingerprints.put(fingerprint_key(algorithm, file_stat), digest)
+                return digest
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+                return ""
+            except Exception as e:
+                print(f"Error while hashing file {file_path}: {e}")
+                return ""
+
+    @staticmethod
+    def hash_many(file_paths, algorithm="blake2b", workers=None, use_cache=True):
+        """Hash files in parallel and return a dict of path to hex digest, files that fail are left out.
+
+        hashlib releases the GIL while hashing, so threads spread the work over all cores.
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        workers = workers if workers is not None else min(32, (os.cpu_count() or 1) + 4)
+        if workers <= 1 or len(file_paths) <= 1:
+            digests = [FileOps.hash_file(file_path, algorithm, use_cache=use_cache) for file_path in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(file_paths)), thread_name_prefix="FileOpsHash") as executor:
+                digests = list(executor.map(lambda file_path: FileOps.hash_file(file_path, algorithm, use_cache=use_cache), file_paths))
+        return {file_path: digest for file_path, digest in zip(file_paths, digests) if digest}
+
+    @staticmethod
+    def file_changed(file_path, digest, algorithm="blake2b"):
+        """Return True if the content of a file no longer has the given digest."""
+        return FileOps.hash_file(file_path, algorithm) != digest
+
+    @staticmethod
+    def load_fingerprint_cache(cache_path):
+        """Load persisted fingerprints from cache_path and save them back there at exit."""
+        fingerprints = FileOps.fingerprints
+        if fingerprints.path is None:
+            atexit.register(FileOps.save_fingerprint_cache)
+        fingerprints.path = cache_path
+        if os.path.isfile(cache_path):
+            fingerprints.load_json(FileOps.load_json(cache_path, default=[]))
+
+    @staticmethod
+    def save_fingerprint_cache():
+        """Write the fingerprint cache to the file given to load_fingerprint_cache if it changed."""
+        fingerprints = FileOps.fingerprints
+        if fingerprints.path is not None and fingerprints.dirty:
+            FileOps.write_json(fingerprints.path, fingerprints.to_json(), atomic=True, compact=True)
+
+    # Directory Operations
+    @staticmethod
+    def create_directory(directory):
+        """Create a directory if it doesn't exist."""
+        with FileOps.locks.shared(directory):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except Exception as e:
+                print(f"Failed to create directory {directory}: {e}")
+            FileOps._invalidate(directory)
+
+    @staticmethod
+    def delete_directory(directory, delete_contents=True, background=False):
+        """Delete a directory, optionally including its contents.
+
+        With background=True the directory is renamed to a hidden tombstone next to it and removed on a
+        worker pool, the call returns a Future that resolves once the tombstone is gone. Tombstones a
+        killed run left behind are only removed by the next background delete in the same parent, call
+        remove_stale_tombstones on the parent at startup if it may not see another one.
+        """
+        with FileOps.locks.exclusive(directory):
+            try:
+                if not delete_contents:
+                    os.rmdir(directory)
+                elif background:
+                    return FileOps.tombstones.bury(directory)
+                else:
+                    shutil.rmtree(directory)
+            except FileNotFoundError:
+                print(f"Directory not found: {directory}")
+            except Exception as e:
+                print(f"Failed to delete directory {directory}: {e}")
+            finally:
+                FileOps._invalidate(directory, recursive=True)
+
+    @staticmethod
+    def purge_directory(directory, background=False):
+        """Remove all contents from a directory.
+
+        With background=True the contents are moved into a tombstone next to the directory and removed
+        on a worker pool, the call returns a Future that resolves once the tombstone is gone. Tombstones
+        a killed run left behind are only removed by the next background delete in the same parent, call
+        remove_stale_tombstones on the parent at startup if it may not see another one.
+        """
+        with FileOps.locks.exclusive(directory):
+            try:
+                if background:
+                    return FileOps.tombstones.bury_contents(directory)
+                for entry in os.scandir(directory):
+                    if entry.is_file():
+                        os.remove(entry.path)
+                    else:
+                        shutil.rmtree(entry.path)
+            except FileNotFoundError:
+                print(f"Directory not found: {directory}")
+            except Exception as e:
+                print(f"Failed to purge directory {directory}: {e}")
+            finally:
+                FileOps._invalidate(directory, recursive=True)
+
+    @staticmethod
+    def remove_stale_tombstones(directory):
+        """Remove tombstones a killed run left in directory in the background, return their Futures.
+
+        Call it at startup for the parents of the directories deleted or purged with background=True,
+        for example FileOps.remove_stale_tombstones(FileOps.get_directory_name(cache_directory)).
+        """
+        return FileOps.tombstones.remove_stale(directory)
+
+    @staticmethod
+    def sync_directory(source, destination, compare="metadata", delete_extraneous=False, include=None, exclude=None,
+                       workers=None, dry_run=False, progress=None):
+        """Make destination a copy of source by copying only new and changed files, return a SyncReport.
+
+        Files are compared by size and mtime (compare="metadata"), or by content hash when the sizes
+        match (compare="hash"). Copies keep the source mtime, so the next sync finds them unchanged.
+        delete_extraneous removes destination paths the source does not have. include and exclude
+        take the globs of scan_tree and apply to both trees, so excluded destination paths are kept.
+        Copies run on a thread pool like copy_many and progress gets a TransferProgress per file.
+        dry_run only fills the report.
+        """
+        sync = _DirectorySync(source, destination, compare, delete_extraneous, compile_patterns(include, exclude), workers, FileOps.hash_file)
+        with FileOps.locks.shared(source):
+            report = sync.plan()
+        report.dry_run = dry_run
+        if dry_run:
+            return report
+        with FileOps.locks.exclusive(destination):
+            for relative_path in sync.deletions:
+                sync.delete(relative_path)
+            for directory in sync.directories_to_create:
+                os.makedirs(directory, exist_ok=True)
+        # Each copy locks only its own paths, so they are not run under a lock on either tree
+        transfer_report = FileOps.copy_many(sync.copies, preserve_metadata=True, workers=workers, progress=progress)
+        report.failed.update(transfer_report.failed)
+        report.bytes_copied = transfer_report.bytes_done
+        FileOps._invalidate(destination, recursive=True)
+        return report
+
+    @staticmethod
+    def scan_tree(directory, max_depth=None, prune=None, follow_symlinks=False, workers=None, on_error=None, collect=False, include=None, exclude=None):
+        """Walk a directory tree with os.scandir and yield a ScanEntry for every file and directory.
+
+        max_depth limits recursion (0 lists only the directory itself), prune(entry) returning True
+        skips a subdirectory entirely, and workers > 1 scans subdirectories on a thread pool, in which
+        case entries arrive in no particular order. Errors below the top directory go to on_error.
+        include and exclude take gitignore-style globs matched against the path relative to directory;
+        excluded directories are not descended into. With collect=True the whole tree is gathered
+        under a shared lock and returned as a list.
+        """
+        scanner = _TreeScanner(directory, max_depth, prune, follow_symlinks, workers, on_error, compile_patterns(include, exclude))
+        if collect:
+            with FileOps.locks.shared(directory):
+                return list(scanner)
+        return iter(scanner)
+
+    @staticmethod
+    def compile_patterns(include=None, exclude=None):
+        """Return a PathMatcher for include and exclude globs, or None if both are empty."""
+        return compile_patterns(include, exclude)
+
+    @staticmethod
+    def get_files_in_directory(directory, pattern="", include_nested=False, exclude=None):
+        """List files in a directory, optionally matching a pattern and including nested directories."""
+        try:
+            return [entry.path for entry in FileOps._scan_for_listing(directory, include_nested, pattern, exclude) if entry.is_file]
+        except Exception as e:
+            print(f"Error while listing files in directory {directory}: {e}")
+            return []
+
+    @staticmethod
+    def get_directories_in_directory(directory, pattern="", include_nested=False, exclude=None):
+        """List directories in a directory, optionally matching a pattern and including nested directories."""
+        try:
+            return [entry.path for entry in FileOps._scan_for_listing(directory, include_nested, pattern, exclude) if entry.is_dir]
+        except Exception as e:
+            print(f"Error while listing directories in directory {directory}: {e}")
+            return []
+
+    @staticmethod
+    def get_contents_in_directory(directory, pattern="", include_nested=False, exclude=None):
+        """List all contents in a directory, optionally matching a pattern and including nested directories."""
+        try:
+            return [entry.path for entry in FileOps._scan_for_listing(directory, include_nested, pattern, exclude)]
+        except Exception as e:
+            print(f"Error while listing contents in directory {directory}: {e}")
+            return []
+
+    # File Information
+    @staticmethod
+    def file_exists(file_path):
+        """Return True if the specified file exists."""
+        return FileOps._stat(file_path) is not None
+
+    @staticmethod
+    def is_file(file_path):
+        """Return True if the path is a file; print an error if not found."""
+        file_stat = FileOps._stat(file_path)
+        if file_stat is not None:
+            return stat.S_ISREG(file_stat.st_mode)
+        print(f"File not found: {file_path}")
+        return False
+
+    @staticmethod
+    def is_file_empty(file_path):
+        """Return True if the file is empty; print an error if not found."""
+        file_stat = FileOps._stat(file_path)
+        if file_stat is not None:
+            return file_stat.st_size == 0
+        print(f"File not found: {file_path}")
+        return False
+
+    @staticmethod
+    def is_file_readable(file_path):
+        """Return True if the file is readable; print an error if not found."""
+        with FileOps.locks.shared(file_path):
+            if os.path.exists(file_path):
+                return os.access(file_path, os.R_OK)
+            print(f"File not found: {file_path}")
+            return False
+
+    @staticmethod
+    def is_file_writable(file_path):
+        """Return True if the file is writable; print an error if not found."""
+        with FileOps.locks.shared(file_path):
+            if os.path.exists(file_path):
+                return os.access(file_path, os.W_OK)
+            print(f"File not found: {file_path}")
+            return False
+
+    @staticmethod
+    def get_file_size(file_path):
+        """Return the file size in bytes; print an error if not found."""
+        return FileOps._get_stat_field(file_path, "st_size")
+
+    @staticmethod
+    def get_file_creation_time(file_path):
+        """Return the file creation time; print an error if not found."""
+        return FileOps._get_stat_field(file_path, "st_ctime")
+
+    @staticmethod
+    def get_file_modification_time(file_path):
+        """Return the file modification time; print an error if not found."""
+        return FileOps._get_stat_field(file_path, "st_mtime")
+
+    @staticmethod
+    def get_file_access_time(file_path):
+        """Return the file access time; print an error if not found."""
+        return FileOps._get_stat_field(file_path, "st_atime")
+
+    @staticmethod
+    def validate_file_name(file_name):
+        """Return invalid characters in a file name."""
+        return FileOps.get_invalid_file_name_chars(file_name)
+
+    # Directory Information
+    @staticmethod
+    def is_directory(directory):
+        """Return True if the path is a directory."""
+        directory_stat = FileOps._stat(directory)
+        return directory_stat is not None and stat.S_ISDIR(directory_stat.st_mode)
+
+    @staticmethod
+    def directory_exists(directory):
+        """Return True if the directory exists."""
+        return FileOps.is_directory(directory)
+
+    @staticmethod
+    def is_directory_empty(directory):
+        """Return True if the directory is empty, tombstones of background deletions do not count."""
+        with FileOps.locks.shared(directory):
+            return all(is_tombstone(name) for name in os.listdir(directory))
+
+    @staticmethod
+    def is_directory_readable(directory):
+        """Return True if the directory is readable."""
+        with FileOps.locks.shared(directory):
+            return os.access(directory, os.R_OK)
+
+    @staticmethod
+    def is_directory_writable(directory):
+        """Return True if the directory is writable."""
+        with FileOps.locks.shared(directory):
+            return os.access(directory, os.W_OK)
+
+    @staticmethod
+    def validate_directory_name(directory_name):
+        """Return invalid characters in a directory name."""
+        return FileOps.get_invalid_file_name_chars(directory_name)
+
+    # Stat Cache
+    @staticmethod
+    def enable_stat_cache(ttl=1.0, watch=()):
+        """Cache the stat calls behind the file and directory information queries.
+
+        Entries expire after ttl seconds, or only on invalidation if ttl is None. FileOps' own writes
+        invalidate what they touch; changes made by other code need invalidate_stat_cache, or a
+        directory in watch, whose file system events then invalidate entries through watchdog.
+        """
+        FileOps.stat_cache.enable(ttl)
+        for directory in ([watch] if isinstance(watch, str) else watch):
+            FileOps.stat_cache.watch(directory)
+
+    @staticmethod
+    def disable_stat_cache():
+        """Turn the stat cache off, drop its entries and stop watching directories."""
+        FileOps.stat_cache.disable()
+
+    @staticmethod
+    def invalidate_stat_cache(path=None, recursive=False):
+        """Drop the cached stat of a path and its parent, or of everything if no path is given."""
+        if path is None:
+            FileOps.stat_cache.clear()
+        else:
+            FileOps.stat_cache.invalidate(path, recursive=recursive)
+
+    @staticmethod
+    def get_stat_cache_stats():
+        """Return the hit, miss and invalidation counters of the stat cache."""
+        return FileOps.stat_cache.get_stats()
+
+    # Path Operations
+    @staticmethod
+    def join_paths(*args):
+        """Join and return the combined paths."""
+        return os.path.join(*args)
+
+    @staticmethod
+    def get_file_name(file_path):
+        """Return the file name from a file path."""
+        return os.path.basename(file_path)
+
+    @staticmethod
+    def get_file_name_without_extension(file_path):
+        """Return the file name without its extension from a file path."""
+        return os.path.splitext(os.path.basename(file_path))[0]
+
+    @staticmethod
+    def get_file_extension(file_path):
+        """Return the file extension from a file path."""
+        return os.path.splitext(file_path)[1]
+
+    @staticmethod
+    def _get_directory(file_path):
+        """Return the directory from a file path."""
+        return os.path.dirname(file_path)
+
+    @staticmethod
+    def get_directory_name(file_path):
+        """Return the directory name from a file path."""
+        return os.path.dirname(file_path)
+
+    @staticmethod
+    def get_parent_directory(file_path, directory):
+        """Return the parent directory from a file path."""
+        while file_path:
+            file_path, tail = os.path.split(file_path)
+            if tail == directory:
+                return FileOps.join_paths(file_path, tail)
+        return None
+
+    # Utility Operations
+    @staticmethod
+    def ensure_directory_exists(file_path):
+        """Ensure the directory of the given file path exists."""
+        directory = os.path.dirname(file_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+            FileOps._invalidate(directory)
+
+    @staticmethod
+    def _scan_for_listing(directory, include_nested, pattern=None, exclude=None):
+        """Collect the entries the directory listing helpers filter.
+
+        pattern is one glob or a list of globs to include, an empty pattern includes everything. The
+        entries are sorted by path, nested scans run in parallel and finish in no particular order.
+        """
+        if include_nested:
+            entries = FileOps.scan_tree(directory, collect=True, include=pattern, exclude=exclude)
+        else:
+            entries = FileOps.scan_tree(directory, max_depth=0, workers=1, collect=True, include=pattern, exclude=exclude)
+        entries.sort(key=lambda entry: entry.relative_path)
+        return entries
+
+    @staticmethod
+    def _run_bulk_transfer(jobs, transfer, lock_for, workers, progress, cancel_event):
+        """Resolve destinations like copy_file does and run the jobs on a thread pool."""
+        resolved_jobs = [(source, FileOps._get_destination_path(source, destination)) for source, destination in jobs]
+        return _bulk_transfer._BulkTransfer(resolved_jobs, transfer, lock_for, workers, progress, cancel_event).run()
+
+    @staticmethod
+    def _invalidate(*paths, recursive=False):
+        """Drop cached stats and contents of paths after FileOps changed them."""
+        FileOps.stat_cache.invalidate(*paths, recursive=recursive)
+        FileOps.content_cache.invalidate(*paths, recursive=recursive)
+
+    @staticmethod
+    def _stat(path):
+        """Return the stat result of path from the stat cache or the file system, None if it does not exist."""
+        if FileOps.stat_cache.enabled:
+            return FileOps.stat_cache.stat(path, FileOps._stat_locked)
+        return FileOps._stat_locked(path)
+
+    @staticmethod
+    def _stat_locked(path):
+        with FileOps.locks.shared(path):
+            try:
+                return os.stat(path)
+            except (OSError, ValueError):
+                return None
+
+    @staticmethod
+    def _get_stat_field(file_path, field):
+        """Return one field of the stat result of file_path; print an error and return 0 if not found."""
+        file_stat = FileOps._stat(file_path)
+        if file_stat is not None:
+            return getattr(file_stat, field)
+        print(f"File not found: {file_path}")
+        return 0
+
+    @staticmethod
+    @contextmanager
+    def _exclusive_write(file_path):
+        """Hold the exclusive lock of file_path while it is written and drop its cached stat afterwards."""
+        with FileOps.locks.exclusive(file_path):
+            try:
+                yield
+            finally:
+                FileOps._invalidate(file_path)
+
+    @staticmethod
+    def _open_for_streaming(file_path, mode, encoding):
+        """Open a file for a streaming reader; print an error and return None if that fails."""
+        with FileOps.locks.shared(file_path):
+            try:
+                return open(file_path, mode, encoding=encoding)
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
+            except Exception as e:
+                print(f"Error while opening file {file_path}: {e}")
+        return None
+
+    @staticmethod
+    def _write_encoded(file_path, content, append, encoding, atomic, durability):
+        """Write encoder output so an encoding error reaches the caller and never leaves a partial file."""
+        if isinstance(content, str):
+            FileOps.write_file(file_path, content, append, encoding, atomic, durability)
+            return
+        if not atomic:
+            # A plain write truncates or extends the file first, so the encoding has to finish before it
+            FileOps.write_file(file_path, "".join(content), append, encoding, atomic, durability)
+            return
+        chunks = _json_codec.TrackedChunks(content)
+        FileOps.write_file(file_path, chunks, append, encoding, atomic, durability)
+        if chunks.error is not None:
+            raise chunks.error
+
+    @staticmethod
+    def _write_mode(content, mode, encoding):
+        """Return the open mode and encoding for content, bytes are written in binary mode."""
+        if isinstance(content, (bytes, bytearray)):
+            return mode + "b", None
+        return mode, encoding
+
+    @staticmethod
+    def _write_content(file, content):
+        """Write a string, bytes or an iterable of lines to an open file."""
+        if isinstance(content, (str, bytes, bytearray)):
+            file.write(content)
+        else:
+            file.writelines(str(line) for line in content)
+
+    @staticmethod
+    def _write_atomic(file_path, content, append, encoding, durability):
+        """Write to a sibling temp file and move it over file_path."""
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory)
+        try:
+            if append and os.path.exists(file_path):
+                os.close(fd)
+                shutil.copyfile(file_path, temp_path)
+                mode, file_encoding = FileOps._write_mode(content, "a", encoding)
+                file = open(temp_path, mode, encoding=file_encoding)
+            else:
+                mode, file_encoding = FileOps._write_mode(content, "w", encoding)
+                file = open(fd, mode, encoding=file_encoding)
+            with file:
+                FileOps._write_content(file, content)
+                FileOps._sync_file(file, durability)
+            FileOps._copy_permissions(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        if durability == WriteDurability.FSYNC:
+            FileOps._sync_directory(directory)
+
+    @staticmethod
+    def _copy_permissions(file_path, temp_path):
+        """Give the temp file the mode of the file it replaces, or the default mode for new files."""
+        try:
+            shutil.copymode(file_path, temp_path)
+        except FileNotFoundError:
+            os.chmod(temp_path, _DEFAULT_FILE_MODE)
+
+    @staticmethod
+    def _sync_file(file, durability):
+        """Push the data of an open file to the disk according to durability."""
+        if durability == WriteDurability.NONE:
+            return
+        file.flush()
+        if durability == WriteDurability.FLUSH and hasattr(os, "fdatasync"):
+            os.fdatasync(file.fileno())
+        else:
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def _sync_directory(directory):
+        """Persist the directory entries of directory, a no-op where directories cannot be opened."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _get_destination_path(source_file, destination):
+        """Return the path a copy or move of source_file into destination will end up at."""
+        if os.path.isdir(destination):
+            return os.path.join(destination, os.path.basename(source_file))
+        return destination
+
+    @staticmethod
+    def resolve_development_path(start_path, sub_path='', root_marker="GuiFramework"):
+        """Resolve and return the absolute path for a given sub-path relative to the project's root,
+        adapting for both development environments and packaged EXE environments."""
+        # Check if running as a standalone EXE
+        if getattr(sys, 'frozen', False):
+            return os.path.join(os.path.dirname(sys.executable), sub_path)
+        else:
+            current_dir = os.path.dirname(os.path.abspath(start_path))
+
+            while not os.path.basename(current_dir) == root_marker:
+                parent_dir = os.path.dirname(current_dir)
+                if parent_dir == current_dir:
+                    raise FileNotFoundError(f"Could not find the root marker '{root_marker}' in any parent directories.")
+                current_dir = parent_dir
+
+            return os.path.join(current_dir, sub_path)
+
+    @staticmethod
+    def get_invalid_file_name_chars(file_name):
+        """Return invalid characters in a file name, 'Empty file name' if empty or the file_name if valid."""
+        if not file_name.strip():
+            return "Empty file name"
+
+        # Including control characters and spaces in the set of invalid characters
+        invalid_chars = set('\\/:*?"<>|' + ''.join(chr(i) for i in range(32)))  # ASCII 0-31 are control chars
+        found_invalid_chars = {char for char in file_name if char in invalid_chars}
+
+        # Check for OS reserved names (mainly for Windows)
+        reserved_names = {"CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"}
+        base_name, ext = os.path.splitext(file_name)
+        if base_name.upper() in reserved_names:
+            found_invalid_chars.add(base_name)
+
+        if found_invalid_chars:
+            return ', '.join(found_invalid_chars)
+        else:
+            return file_name
+
+    @staticmethod
+    def get_file_names_in_directory(directory, include_nested=False, exclude=None):
+        """List and return all file names in a directory."""
+        try:
+            return [entry.name for entry in FileOps._scan_for_listing(directory, include_nested, exclude=exclude) if entry.is_file]
+        except Exception as e:
+            print(f"Error while listing files in directory {directory}: {e}")
+            return []
+
+    @staticmethod
+    def get_directory_names_in_directory(directory, include_nested=False, exclude=None):
+        """List and return all directory names in a directory."""
+        try:
+            return [entry.name for entry in FileOps._scan_for_listing(directory, include_nested, exclude=exclude) if entry.is_dir]
+        except Exception as e:
+            print(f"Error while listing directories in directory {directory}: {e}")
+            return []
@@ -0,0 +1 @@
+# GuiFramework/utilities/file_ops/internal/__init__.py
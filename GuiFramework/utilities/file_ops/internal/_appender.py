@@ -0,0 +1,164 @@
+# GuiFramework/utilities/file_ops/internal/_appender.py
+# ATTENTION: This module is for internal use only
+
+import os
+import time
+import atexit
+import threading
+
+from typing import Callable, ContextManager, Dict, List, Optional, Union
+
+
+class Appender:
+    """Append-only file handle that buffers writes in memory and writes them out in one call.
+
+    The buffer is written when it reaches buffer_size, when data has waited flush_interval seconds,
+    on flush() and on close(). Appenders are shared per path, so every open_appender call for the
+    same file returns the same object and needs its own close().
+    """
+
+    def __init__(self, path: str, buffer_size: int, flush_interval: Optional[float], encoding: str, binary: bool,
+                 lock_for: Callable[[str], ContextManager], registry: "_AppenderRegistry") -> None:
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+        self.binary = binary
+        self._lock_for = lock_for
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._buffer: List[Union[str, bytes]] = []
+        self._buffered = 0
+        self._first_write: Optional[float] = None  # monotonic time of the oldest buffered write
+        self._references = 0
+        self._file = open(path, "ab", buffering=0)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, data: Union[str, bytes]) -> None:
+        """Buffer data, writing the buffer out once it holds buffer_size characters or bytes."""
+        with self._lock:
+            if self._file.closed:
+                raise ValueError(f"Appender for {self.path} is closed")
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._first_write is None:
+                self._first_write = time.monotonic()
+            if self._buffered >= self.buffer_size:
+                self._write_buffer()
+
+    def write_line(self, line: str) -> None:
+        """Buffer line followed by a newline."""
+        self.write(line + "\n")
+
+    def flush(self) -> None:
+        """Write everything buffered to the file."""
+        with self._lock:
+            self._write_buffer()
+
+    def flush_if_due(self, now: float) -> None:
+        with self._lock:
+            if self._first_write is not None and now - self._first_write >= self.flush_interval:
+                self._write_buffer()
+
+    def close(self) -> None:
+        """Release this reference, the file is flushed and closed when the last one is released."""
+        self._registry.release(self)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            try:
+                self._write_buffer()
+            finally:
+                self._file.close()
+
+    def _write_buffer(self) -> None:
+        if not self._buffer or self._file.closed:
+            return
+        data = b"".join(self._buffer) if self.binary else "".join(self._buffer).encode(self.encoding)
+        self._buffer.clear()
+        self._buffered = 0
+        self._first_write = None
+        with self._lock_for(self.path):
+            view = memoryview(data)
+            while view:
+                view = view[self._file.write(view):]
+
+    def __enter__(self) -> "Appender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Appender({self.path!r}, buffered={self._buffered})"
+
+
+class _AppenderRegistry:
+    """Shares one Appender per path, flushes due buffers on a timer thread and closes everything at exit."""
+
+    def __init__(self, lock_for: Callable[[str], ContextManager], normalize: Callable[[str], str]) -> None:
+        self._lock_for = lock_for
+        self._normalize = normalize
+        self._lock = threading.Lock()
+        self._appenders: Dict[str, Appender] = {}
+        self._wake = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        atexit.register(self.close_all)
+
+    def open(self, path: str, buffer_size: int, flush_interval: Optional[float], encoding: str, binary: bool) -> Appender:
+        key = self._normalize(path)
+        with self._lock:
+            appender = self._appenders.get(key)
+            if appender is None or appender.closed:
+                appender = Appender(path, buffer_size, flush_interval, encoding, binary, self._lock_for, self)
+                self._appenders[key] = appender
+            appender._references += 1
+            if flush_interval is not None:
+                self._start_timer()
+                self._wake.set()
+            return appender
+
+    def release(self, appender: Appender) -> None:
+        with self._lock:
+            if appender._references > 0:
+                appender._references -= 1
+            if appender._references:
+                return
+            key = self._normalize(appender.path)
+            if self._appenders.get(key) is appender:
+                del self._appenders[key]
+        appender._close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            appenders = list(self._appenders.values())
+            self._appenders.clear()
+        for appender in appenders:
+            appender._close()
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="FileOpsAppenderFlush", daemon=True)
+            self._timer.start()
+
+    def _run_timer(self) -> None:
+        while True:
+            with self._lock:
+                intervals = [appender.flush_interval for appender in self._appenders.values() if appender.flush_interval is not None]
+            # Waking at half the shortest interval keeps every buffer within 1.5 intervals of its first write
+            self._wake.wait(min(intervals) / 2 if intervals else None)
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                appenders = list(self._appenders.values())
+            for appender in appenders:
+                if appender.flush_interval is not None:
+                    try:
+                        appender.flush_if_due(now)
+                    except Exception as e:
+                        print(f"Error flushing appender for {appender.path}: {e}")
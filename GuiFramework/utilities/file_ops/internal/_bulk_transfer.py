@@ -0,0 +1,179 @@
+# GuiFramework/utilities/file_ops/internal/_bulk_transfer.py
+# ATTENTION: This module is for internal use only
+
+import os
+import sys
+import errno
+import shutil
+import threading
+
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+COPY_BUFFER_SIZE = 1024 * 1024
+KERNEL_COPY_CHUNK = 1024 * 1024 * 1024
+# Errors that mean the kernel copy path is unavailable for this pair of files, not that the copy failed
+_KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, getattr(errno, "ENOTSUP", errno.EOPNOTSUPP)}
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+@dataclass
+class TransferProgress:
+    """Snapshot passed to the progress callback after every finished job."""
+    completed: int
+    total: int
+    bytes_done: int
+    bytes_total: int
+    source: str
+    destination: str
+    error: Optional[Exception] = None
+
+
+@dataclass
+class TransferReport:
+    """Outcome of a bulk copy or move."""
+    succeeded: List[Tuple[str, str]] = field(default_factory=list)
+    failed: Dict[str, Exception] = field(default_factory=dict)
+    bytes_done: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every job succeeded."""
+        return not self.failed
+
+
+def _kernel_copy(source_fd: int, destination_fd: int) -> None:
+    """Copy from the current positions of the descriptors inside the kernel where possible."""
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            while os.copy_file_range(source_fd, destination_fd, KERNEL_COPY_CHUNK):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    if _HAS_SENDFILE:
+        try:
+            while os.sendfile(destination_fd, source_fd, None, KERNEL_COPY_CHUNK):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    # Continue from wherever the kernel paths stopped
+    while True:
+        chunk = os.read(source_fd, COPY_BUFFER_SIZE)
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(destination_fd, view):]
+
+
+def copy_file_data(source: str, destination: str) -> int:
+    """Copy the content of source to destination without buffering it in Python where possible."""
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        # Opening the destination would truncate the source
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        _kernel_copy(source_file.fileno(), destination_file.fileno())
+        return os.fstat(destination_file.fileno()).st_size
+
+
+def copy_file(source: str, destination: str, preserve_metadata: bool = False) -> int:
+    """Copy a file like shutil.copy or shutil.copy2, return the number of bytes copied."""
+    size = copy_file_data(source, destination)
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    else:
+        shutil.copymode(source, destination)
+    return size
+
+
+def move_file(source: str, destination: str) -> int:
+    """Move a file or directory, renaming when both sides share a file system."""
+    try:
+        size = os.path.getsize(source) if os.path.isfile(source) else 0
+        os.replace(source, destination)
+        return size
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if os.path.isdir(source):
+        shutil.copytree(source, destination, copy_function=_copy2, dirs_exist_ok=True)
+        shutil.rmtree(source)
+        return 0
+    size = copy_file(source, destination, preserve_metadata=True)
+    os.remove(source)
+    return size
+
+
+def _copy2(source: str, destination: str) -> str:
+    """copy_function for shutil.copytree using the kernel copy path."""
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    copy_file(source, destination, preserve_metadata=True)
+    return destination
+
+
+def copy_tree(source: str, destination: str) -> int:
+    """Copy a directory tree with the kernel copy path."""
+    shutil.copytree(source, destination, copy_function=_copy2, dirs_exist_ok=True)
+    return 0
+
+
+class _BulkTransfer:
+    """Runs copy or move jobs on a bounded thread pool and reports progress."""
+
+    def __init__(self, jobs: Iterable[Tuple[str, str]], transfer: Callable[[str, str], int], lock_for: Callable[[str, str], object],
+                 workers: Optional[int] = None, progress: Optional[Callable[[TransferProgress], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> None:
+        self.jobs = list(jobs)
+        self.transfer = transfer
+        self.lock_for = lock_for
+        self.workers = workers if workers is not None else min(8, (os.cpu_count() or 1) + 4)
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.report = TransferReport()
+        self._report_lock = threading.Lock()
+        self._completed = 0
+        self._bytes_total = sum(self._size_of(source) for source, _ in self.jobs)
+
+    @staticmethod
+    def _size_of(path: str) -> int:
+        try:
+            return os.path.getsize(path) if os.path.isfile(path) else 0
+        except OSError:
+            return 0
+
+    def run(self) -> TransferReport:
+        if not self.jobs:
+            return self.report
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(self.jobs)), thread_name_prefix="FileOpsTransfer") as executor:
+            for source, destination in self.jobs:
+                executor.submit(self._run_job, source, destination)
+        return self.report
+
+    def _run_job(self, source: str, destination: str) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return
+        size, error = 0, None
+        try:
+            with self.lock_for(source, destination):
+                parent = os.path.dirname(destination)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+                size = self.transfer(source, destination)
+        except Exception as e:
+            error = e
+        with self._report_lock:
+            self._completed += 1
+            if error is None:
+                self.report.succeeded.append((source, destination))
+                self.report.bytes_done += size
+            else:
+                self.report.failed[source] = error
+            if self.progress is not None:
+                self.progress(TransferProgress(self._completed, len(self.jobs), self.report.bytes_done, self._bytes_total, source, destination, error))
@@ -0,0 +1,139 @@
+# GuiFramework/utilities/file_ops/internal/_content_cache.py
+# ATTENTION: This module is for internal use only
+
+import os
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class ContentCacheStats:
+    """Counters of the content cache, parsed_hits count lookups answered without parsing."""
+    hits: int
+    misses: int
+    parsed_hits: int
+    evictions: int
+    entries: int
+    bytes: int
+    byte_budget: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of reads answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _ContentEntry:
+    __slots__ = ("size", "mtime_ns", "data", "parsed", "cost")
+
+    def __init__(self, file_stat: os.stat_result, data: bytes) -> None:
+        self.size = file_stat.st_size
+        self.mtime_ns = file_stat.st_mtime_ns
+        self.data = data
+        self.parsed: Dict[Hashable, Any] = {}
+        self.cost = len(data)
+
+
+class _ContentCache:
+    """LRU cache of file contents keyed by path and validated against (size, mtime_ns) on every read.
+
+    Besides the raw bytes an entry holds parsed forms of them (decoded text, JSON, ...) under a parser
+    key. Parsed objects are shared between callers and must be treated as read-only. Each parsed form
+    is charged the raw size against the byte budget as an estimate of its memory, and files larger than
+    a quarter of the budget are never cached.
+    """
+
+    def __init__(self, byte_budget: int = 16 * 1024 * 1024) -> None:
+        self.byte_budget = byte_budget
+        self._entries: "OrderedDict[str, _ContentEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._parsed_hits = self._evictions = 0
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def read(self, path: str) -> bytes:
+        """Return the bytes of a file, from the cache if it has not changed on disk."""
+        return self._get_entry(path).data
+
+    def get_parsed(self, path: str, parser_key: Hashable, parse: Callable[[bytes], Any]) -> Any:
+        """Return parse(bytes of the file), reusing the parsed object while the file is unchanged."""
+        entry = self._get_entry(path)
+        with self._lock:
+            if parser_key in entry.parsed:
+                self._parsed_hits += 1
+                return entry.parsed[parser_key]
+        parsed = parse(entry.data)
+        with self._lock:
+            if parser_key not in entry.parsed and self._entries.get(self.normalize(path)) is entry:
+                entry.parsed[parser_key] = parsed
+                entry.cost += entry.size
+                self._bytes += entry.size
+                self._evict()
+        return parsed
+
+    def _get_entry(self, path: str) -> _ContentEntry:
+        key = self.normalize(path)
+        file_stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.size == file_stat.st_size and entry.mtime_ns == file_stat.st_mtime_ns:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        with open(path, "rb") as file:
+            data = file.read()
+            # The entry is keyed by the state of the file that was actually read
+            entry = _ContentEntry(os.fstat(file.fileno()), data)
+        with self._lock:
+            self._discard(key)
+            if entry.cost <= self.byte_budget // 4:
+                self._entries[key] = entry
+                self._bytes += entry.cost
+                self._evict()
+        return entry
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.cost
+
+    def _evict(self) -> None:
+        while self._bytes > self.byte_budget and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.cost
+            self._evictions += 1
+
+    def invalidate(self, *paths: str, recursive: bool = False) -> None:
+        """Drop the entries of paths, with recursive=True also of everything below them."""
+        if not self._entries:
+            return
+        with self._lock:
+            for path in paths:
+                key = self.normalize(path)
+                self._discard(key)
+                if recursive:
+                    prefix = key.rstrip(os.sep) + os.sep
+                    for stale in [stale for stale in self._entries if stale.startswith(prefix)]:
+                        self._discard(stale)
+
+    def resize(self, byte_budget: int) -> None:
+        with self._lock:
+            self.byte_budget = byte_budget
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> ContentCacheStats:
+        with self._lock:
+            return ContentCacheStats(self._hits, self._misses, self._parsed_hits, self._evictions, len(self._entries), self._bytes, self.byte_budget)
@@ -0,0 +1,97 @@
+# GuiFramework/utilities/file_ops/internal/_content_hasher.py
+# ATTENTION: This module is for internal use only
+
+import os
+import hashlib
+import threading
+
+from typing import Dict, List, Optional, Tuple
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_FingerprintKey = Tuple[str, int, int, int, int]  # (algorithm, st_dev, st_ino, st_size, st_mtime_ns)
+
+
+def fingerprint_key(algorithm: str, file_stat: os.stat_result) -> _FingerprintKey:
+    """Return the key a digest is cached under, a file with the same key is treated as unchanged."""
+    return (algorithm, file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def hash_open_file(file, algorithm: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Hash a binary file object from its current position into one reused buffer."""
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        read = file.readinto(buffer)
+        if not read:
+            return digest.hexdigest()
+        digest.update(view[:read])
+
+
+def hash_path(path: str, algorithm: str, chunk_size: int = HASH_CHUNK_SIZE) -> Tuple[str, Optional[os.stat_result]]:
+    """Hash a file and return its digest and stat, the stat is None if the file changed while it was read."""
+    with open(path, "rb", buffering=0) as file:
+        before = os.fstat(file.fileno())
+        # Small files are read in one call instead of zeroing a full chunk sized buffer for them
+        digest = hash_open_file(file, algorithm, max(1, min(chunk_size, before.st_size + 1)))
+        after = os.fstat(file.fileno())
+    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+        return digest, None
+    return digest, after
+
+
+class _FingerprintCache:
+    """Digests keyed by (algorithm, device, inode, size, mtime_ns) so unchanged files are never read twice.
+
+    Entries are kept in insertion order and the oldest are evicted beyond max_entries. to_json and
+    load_json convert the table to and from a JSON-compatible list for persisting it between runs.
+    """
+
+    def __init__(self, max_entries: int = 200000) -> None:
+        self.max_entries = max_entries
+        self.path: Optional[str] = None  # Where FileOps persists the cache, None keeps it in memory
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[_FingerprintKey, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _FingerprintKey) -> Optional[str]:
+        with self._lock:
+            digest = self._entries.get(key)
+            if digest is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return digest
+
+    def put(self, key: _FingerprintKey, digest: str) -> None:
+        with self._lock:
+            if self._entries.get(key) == digest:
+                return
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = digest
+            self.dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_json(self) -> List[list]:
+        with self._lock:
+            self.dirty = False
+            return [[*key, digest] for key, digest in self._entries.items()]
+
+    def load_json(self, data: Optional[List[list]]) -> None:
+        """Merge persisted entries, skipping malformed ones."""
+        with self._lock:
+            for item in data or ():
+                if isinstance(item, list) and len(item) == 6 and isinstance(item[0], str):
+                    self._entries[tuple(item[:5])] = item[5]
@@ -0,0 +1,132 @@
+# GuiFramework/utilities/file_ops/internal/_directory_sync.py
+# ATTENTION: This module is for internal use only
+
+import os
+import shutil
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from ._path_matcher import PathMatcher
+from ._tree_scanner import ScanEntry, _TreeScanner
+
+
+@dataclass
+class SyncReport:
+    """Difference between two trees found by a sync and what was done about it, paths are '/'-separated
+    and relative to the synced directories."""
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    failed: Dict[str, Exception] = field(default_factory=dict)
+    bytes_copied: int = 0
+    dry_run: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """Return True if the destination differed from the source."""
+        return bool(self.created or self.updated or self.deleted)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if nothing failed."""
+        return not self.failed
+
+
+class _DirectorySync:
+    """Compares a source and destination tree and lists what a one-way sync has to copy and delete.
+
+    Files count as unchanged when size and mtime match, which holds after a sync because copies keep
+    the source mtime. With compare="hash" files of the same size are compared by content instead.
+    """
+
+    def __init__(self, source: str, destination: str, compare: str = "metadata", delete_extraneous: bool = False,
+                 matcher: Optional[PathMatcher] = None, workers: Optional[int] = None,
+                 hash_file: Optional[Callable[[str], str]] = None) -> None:
+        if compare not in ("metadata", "hash"):
+            raise ValueError(f"Unknown compare mode: {compare}")
+        self.source = source
+        self.destination = destination
+        self.compare = compare
+        self.delete_extraneous = delete_extraneous
+        self.matcher = matcher
+        self.workers = workers
+        self.hash_file = hash_file
+        self.report = SyncReport()
+        self.directories_to_create: List[str] = []
+        self.copies: List[tuple] = []
+        self.deletions: List[str] = []
+
+    def _scan(self, root: str) -> Dict[str, ScanEntry]:
+        if not os.path.isdir(root):
+            return {}
+        scanner = _TreeScanner(root, workers=self.workers, matcher=self.matcher, on_error=self._on_scan_error)
+        return {entry.relative_path: entry for entry in scanner}
+
+    def _on_scan_error(self, error: OSError) -> None:
+        self.report.failed[error.filename or str(error)] = error
+
+    def plan(self) -> SyncReport:
+        """Scan both trees and fill the report and the copy, create and delete lists."""
+        source_entries = self._scan(self.source)
+        destination_entries = self._scan(self.destination)
+
+        for relative_path, entry in source_entries.items():
+            target = destination_entries.get(relative_path)
+            destination_path = os.path.join(self.destination, *relative_path.split("/"))
+            if entry.is_dir:
+                if target is None or not target.is_dir:
+                    if target is not None:
+                        self.deletions.append(relative_path)
+                    self.directories_to_create.append(destination_path)
+                continue
+            if not entry.is_file:
+                continue
+            if target is None:
+                self.report.created.append(relative_path)
+            elif target.is_dir or not self._is_same(entry, target):
+                if target.is_dir:
+                    self.deletions.append(relative_path)
+                self.report.updated.append(relative_path)
+            else:
+                self.report.unchanged += 1
+                continue
+            self.copies.append((entry.path, destination_path))
+
+        if self.delete_extraneous:
+            # Only the topmost extraneous path is deleted, removing a directory takes its subtree along
+            extraneous = sorted((path for path in destination_entries if path not in source_entries), key=lambda path: path.split("/"))
+            previous = None
+            for relative_path in extraneous:
+                if previous is not None and relative_path.startswith(previous + "/"):
+                    continue
+                self.deletions.append(relative_path)
+                self.report.deleted.append(relative_path)
+                previous = relative_path
+        return self.report
+
+    def _is_same(self, entry: ScanEntry, target: ScanEntry) -> bool:
+        try:
+            source_stat, destination_stat = entry.stat(), target.stat()
+        except OSError:
+            return False
+        if source_stat.st_size != destination_stat.st_size:
+            return False
+        if self.compare == "hash":
+            digest = self.hash_file(entry.path)
+            return bool(digest) and digest == self.hash_file(target.path)
+        return source_stat.st_mtime_ns == destination_stat.st_mtime_ns
+
+    def delete(self, relative_path: str) -> None:
+        """Remove a file or directory from the destination tree, recording failures in the report."""
+        path = os.path.join(self.destination, *relative_path.split("/"))
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.report.failed[path] = e
@@ -0,0 +1,121 @@
+# GuiFramework/utilities/file_ops/internal/_json_codec.py
+# ATTENTION: This module is for internal use only
+
+import json
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+class JsonBackend:
+    """Encoder and decoder used by FileOps for JSON, the default uses the standard library.
+
+    Faster third-party backends override dumps and loads; dumps returns None for options the backend
+    cannot reproduce exactly, and FileOps then falls back to the standard library for that call.
+    """
+    name = "json"
+
+    def dumps(self, data: Any, indent: Optional[int], sort_keys: bool, ensure_ascii: bool) -> Optional[Union[str, bytes]]:
+        return None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class _OrjsonBackend(JsonBackend):
+    """orjson, which only writes UTF-8 and indents by two spaces."""
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, data: Any, indent: Optional[int], sort_keys: bool, ensure_ascii: bool) -> Optional[bytes]:
+        if ensure_ascii or indent not in (None, 2):
+            return None
+        options = (self._orjson.OPT_INDENT_2 if indent else 0) | (self._orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return self._orjson.dumps(data, option=options)
+        except TypeError:
+            return None  # Types orjson does not know, such as subclasses of str keys or sets
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class _UjsonBackend(JsonBackend):
+    """ujson, which matches the standard library formatting for any indent."""
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, data: Any, indent: Optional[int], sort_keys: bool, ensure_ascii: bool) -> Optional[str]:
+        if indent:
+            return None  # ujson puts no space after ':' when indenting
+        try:
+            return self._ujson.dumps(data, sort_keys=sort_keys, ensure_ascii=ensure_ascii, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._ujson.loads(data)
+
+
+_BACKENDS: Dict[str, type] = {"json": JsonBackend, "orjson": _OrjsonBackend, "ujson": _UjsonBackend}
+
+
+def create_backend(name: str) -> JsonBackend:
+    """Return a backend by name, raising ImportError if its package is not installed."""
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    return _BACKENDS[name]()
+
+
+def encode(backend: JsonBackend, data: Any, indent: Optional[int], sort_keys: bool, ensure_ascii: bool) -> Union[str, Iterable[str]]:
+    """Encode data as one string, or as a stream of chunks when only the pure Python encoder can produce it.
+
+    The C accelerated standard library encoder only runs for compact output and builds the whole
+    string; indented output goes through the pure Python encoder either way, so it is streamed.
+    """
+    encoded = backend.dumps(data, indent, sort_keys, ensure_ascii)
+    if encoded is not None:
+        return encoded.decode("utf-8") if isinstance(encoded, bytes) else encoded
+    if indent is None:
+        return json.dumps(data, separators=COMPACT_SEPARATORS, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+    return json.JSONEncoder(indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii).iterencode(data)
+
+
+def encode_lines(backend: JsonBackend, records: Iterable[Any], sort_keys: bool, ensure_ascii: bool) -> Iterator[str]:
+    """Encode each record as one compact JSON line."""
+    for record in records:
+        yield encode(backend, record, None, sort_keys, ensure_ascii) + "\n"
+
+
+class TrackedChunks:
+    """Iterates encoded chunks and keeps the exception that stopped them, which write_file only prints."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self.chunks = chunks
+        self.error: Optional[Exception] = None
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            yield from self.chunks
+        except Exception as e:
+            self.error = e
+            raise
+
+
+def iter_decoded_lines(backend: JsonBackend, lines: Iterable[bytes]) -> Iterator[Tuple[int, Any, Optional[Exception]]]:
+    """Decode JSON lines, yielding (line number, record, error) and skipping blank lines."""
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, backend.loads(line), None
+        except ValueError as e:
+            yield line_number, None, e
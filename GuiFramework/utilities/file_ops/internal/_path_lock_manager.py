@@ -0,0 +1,207 @@
+# GuiFramework/utilities/file_ops/internal/_path_lock_manager.py
+# ATTENTION: This module is for internal use only
+
+import os
+import threading
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SHARED = 0
+EXCLUSIVE = 1
+
+
+class _ReadWriteLock:
+    """Reader/writer lock with writer preference and per-thread reentrancy."""
+    __slots__ = ("_mutex", "_condition", "_readers", "_writer", "_writer_depth", "_waiting_writers")
+
+    def __init__(self) -> None:
+        self._mutex = threading.Lock()
+        self._condition: Optional[threading.Condition] = None  # Created on first contention
+        self._readers: Dict[int, int] = {}
+        self._writer: int = 0
+        self._writer_depth: int = 0
+        self._waiting_writers: int = 0
+
+    def _wait(self) -> None:
+        """Wait for a state change, must be called with the mutex held."""
+        if self._condition is None:
+            self._condition = threading.Condition(self._mutex)
+        self._condition.wait()
+
+    def _notify(self) -> None:
+        """Wake up all waiting threads, must be called with the mutex held."""
+        if self._condition is not None:
+            self._condition.notify_all()
+
+    def is_idle(self) -> bool:
+        """Return True if nobody holds or waits for the lock."""
+        with self._mutex:
+            return not (self._writer or self._readers or self._waiting_writers)
+
+    def acquire_shared(self) -> None:
+        """Acquire the lock in shared mode."""
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            count = self._readers.get(me)
+            if count is not None:
+                self._readers[me] = count + 1
+                return
+            while self._writer or self._waiting_writers:
+                self._wait()
+            self._readers[me] = 1
+
+    def acquire_exclusive(self) -> None:
+        """Acquire the lock in exclusive mode."""
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Cannot upgrade a shared path lock to an exclusive one.")
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release(self) -> None:
+        """Release one level of the lock held by the current thread."""
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = 0
+                    self._notify()
+                return
+            count = self._readers.get(me)
+            if count is None:
+                raise RuntimeError("Cannot release a path lock that is not held.")
+            if count > 1:
+                self._readers[me] = count - 1
+            else:
+                del self._readers[me]
+                if not self._readers:
+                    self._notify()
+
+
+class _PathLockGuard:
+    """Context manager holding a sorted set of path locks."""
+    __slots__ = ("_manager", "_requests", "_acquired")
+
+    def __init__(self, manager: "_PathLockManager", requests: List[Tuple[str, int]]) -> None:
+        self._manager = manager
+        self._requests = requests
+        self._acquired: List[_ReadWriteLock] = []
+
+    def __enter__(self) -> "_PathLockGuard":
+        manager = self._manager
+        acquired = self._acquired
+        try:
+            for key, mode in self._requests:
+                acquired.append(manager._acquire(key, mode))
+        except BaseException:
+            self._release_all()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._release_all()
+
+    def _release_all(self) -> None:
+        acquired = self._acquired
+        while acquired:
+            acquired.pop().release()
+
+
+class _PathLockManager:
+    """Hands out reader/writer locks keyed by normalized absolute path.
+
+    Locking a path also takes shared locks on all of its ancestor directories, so an
+    exclusive lock on a directory waits for, and blocks, every operation inside its subtree.
+    Locks are acquired in sorted path order to stay deadlock free.
+    """
+
+    def __init__(self, shard_count: int = 64, prune_threshold: int = 256) -> None:
+        self._shard_count = shard_count
+        self._prune_threshold = prune_threshold
+        self._shards: List[Tuple[threading.Lock, Dict[str, _ReadWriteLock]]] = [(threading.Lock(), {}) for _ in range(shard_count)]
+
+    @staticmethod
+    def normalize(path) -> str:
+        """Return the normalized absolute form of a path used as lock key."""
+        return os.path.normcase(os.path.abspath(path))
+
+    def shared(self, *paths) -> _PathLockGuard:
+        """Return a context manager holding shared locks on the given paths."""
+        return _PathLockGuard(self, self._build_requests(paths, ()))
+
+    def exclusive(self, *paths) -> _PathLockGuard:
+        """Return a context manager holding exclusive locks on the given paths, including their subtrees."""
+        return _PathLockGuard(self, self._build_requests((), paths))
+
+    def locked(self, shared: Iterable = (), exclusive: Iterable = ()) -> _PathLockGuard:
+        """Return a context manager holding shared and exclusive locks on the given paths."""
+        return _PathLockGuard(self, self._build_requests(shared, exclusive))
+
+    def active_lock_count(self) -> int:
+        """Return the number of paths that currently have a lock entry, idle ones included."""
+        count = 0
+        for mutex, table in self._shards:
+            with mutex:
+                count += len(table)
+        return count
+
+    def _build_requests(self, shared: Iterable, exclusive: Iterable) -> List[Tuple[str, int]]:
+        """Merge requested paths and their ancestors into a sorted list of (key, mode)."""
+        modes: Dict[str, int] = {}
+        dirname = os.path.dirname
+        for mode, paths in ((SHARED, shared), (EXCLUSIVE, exclusive)):
+            for path in paths:
+                if not path:
+                    continue
+                key = self.normalize(path)
+                if modes.get(key, -1) < mode:
+                    modes[key] = mode
+                parent = dirname(key)
+                while parent not in modes:
+                    modes[parent] = SHARED
+                    grandparent = dirname(parent)
+                    if grandparent == parent:
+                        break
+                    parent = grandparent
+        return sorted(modes.items())
+
+    def _acquire(self, key: str, mode: int) -> _ReadWriteLock:
+        """Acquire and return the lock for key in the given mode."""
+        mutex, table = self._shards[hash(key) % self._shard_count]
+        while True:
+            lock = table.get(key)
+            if lock is None:
+                with mutex:
+                    lock = table.get(key)
+                    if lock is None:
+                        if len(table) >= self._prune_threshold:
+                            self._prune(table)
+                        lock = table[key] = _ReadWriteLock()
+            if mode == EXCLUSIVE:
+                lock.acquire_exclusive()
+            else:
+                lock.acquire_shared()
+            # The entry may have been pruned between lookup and acquisition
+            if table.get(key) is lock:
+                return lock
+            lock.release()
+
+    @staticmethod
+    def _prune(table: Dict[str, _ReadWriteLock]) -> None:
+        """Forget idle locks of a shard, must be called with the shard mutex held."""
+        for key in [key for key, lock in table.items() if lock.is_idle()]:
+            del table[key]
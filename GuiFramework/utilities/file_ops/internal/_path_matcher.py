@@ -0,0 +1,144 @@
+# GuiFramework/utilities/file_ops/internal/_path_matcher.py
+# ATTENTION: This module is for internal use only
+
+import os
+import re
+
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Tuple, Union
+
+CASE_SENSITIVE = os.path.normcase("A") == "A"
+
+
+def _translate(pattern: str) -> Tuple[str, bool]:
+    """Translate a gitignore-style glob into a regex body, return it and whether it only matches directories.
+
+    Patterns without a slash match the name at any depth, patterns with one are anchored to the scan root.
+    '*' and '?' stay within one path segment, '**' spans any number of segments.
+    """
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    parts: List[str] = []
+    index, length = 0, len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "*":
+            if pattern.startswith("**", index):
+                index += 2
+                if index < length and pattern[index] == "/":
+                    parts.append("(?:.*/)?")
+                    index += 1
+                else:
+                    parts.append(".*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            start = index + 1
+            if start < length and pattern[start] in "!^":
+                start += 1
+            if start < length and pattern[start] == "]":
+                start += 1
+            end = pattern.find("]", start)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                content = pattern[index + 1:end]
+                if content[0] in "!^":
+                    content = "^" + content[1:]
+                parts.append("[" + content.replace("\\", "\\\\") + "]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    body = "".join(parts)
+    return (body if anchored else "(?:.*/)?" + body), directory_only
+
+
+class _RuleRun:
+    """Consecutive exclude rules of the same polarity, compiled into one regex each for files and directories."""
+    __slots__ = ("negated", "files", "directories")
+
+    def __init__(self, negated: bool, translated: List[Tuple[str, bool]], flags: int) -> None:
+        self.negated = negated
+        file_bodies = [body for body, directory_only in translated if not directory_only]
+        self.files: Optional[Pattern] = _compile_alternation(file_bodies, flags)
+        self.directories: Optional[Pattern] = _compile_alternation([body for body, _ in translated], flags)
+
+
+def _compile_alternation(bodies: List[str], flags: int) -> Optional[Pattern]:
+    if not bodies:
+        return None
+    return re.compile("(?:" + "|".join(bodies) + ")", flags)
+
+
+class PathMatcher:
+    """Include and exclude globs compiled once for matching relative paths during a directory walk.
+
+    A path is matched when it matches any include pattern (or no includes are given) and is not
+    excluded. Exclude patterns follow gitignore rules: they are evaluated in order, the last
+    matching one wins and a leading '!' re-includes what an earlier pattern excluded.
+    Excluded directories are pruned, so nothing below them can be re-included.
+    """
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = (), case_sensitive: bool = CASE_SENSITIVE) -> None:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        translated_includes = [_translate(pattern) for pattern in include if pattern]
+        self._includes_files = _compile_alternation([body for body, directory_only in translated_includes if not directory_only], flags)
+        self._includes_directories = _compile_alternation([body for body, _ in translated_includes], flags)
+        self._has_includes = bool(translated_includes)
+
+        self._runs: List[_RuleRun] = []
+        current_negated, current = None, []
+        for pattern in exclude:
+            if not pattern or pattern.startswith("#"):
+                continue
+            negated = pattern.startswith("!")
+            if negated:
+                pattern = pattern[1:]
+            if negated != current_negated and current:
+                self._runs.append(_RuleRun(current_negated, current, flags))
+                current = []
+            current_negated = negated
+            current.append(_translate(pattern))
+        if current:
+            self._runs.append(_RuleRun(current_negated, current, flags))
+        self._runs.reverse()  # Evaluated from the last rule backwards
+
+    def is_excluded(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Return True if the exclude rules reject the '/'-separated relative path."""
+        for run in self._runs:
+            regex = run.directories if is_dir else run.files
+            if regex is not None and regex.fullmatch(relative_path):
+                return not run.negated
+        return False
+
+    def is_included(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Return True if the include patterns accept the '/'-separated relative path."""
+        if not self._has_includes:
+            return True
+        regex = self._includes_directories if is_dir else self._includes_files
+        return regex is not None and regex.fullmatch(relative_path) is not None
+
+    def matches(self, relative_path: str, is_dir: bool = False) -> bool:
+        """Return True if the path is included and not excluded."""
+        return self.is_included(relative_path, is_dir) and not self.is_excluded(relative_path, is_dir)
+
+
+@lru_cache(maxsize=128)
+def _get_path_matcher(include: Tuple[str, ...], exclude: Tuple[str, ...]) -> PathMatcher:
+    return PathMatcher(include, exclude)
+
+
+def compile_patterns(include: Union[str, Iterable[str], None] = None, exclude: Union[str, Iterable[str], None] = None) -> Optional[PathMatcher]:
+    """Return a cached PathMatcher for the given patterns, or None if there is nothing to match."""
+    include = (include,) if isinstance(include, str) else tuple(include or ())
+    exclude = (exclude,) if isinstance(exclude, str) else tuple(exclude or ())
+    if not any(include) and not any(exclude):
+        return None
+    return _get_path_matcher(include, exclude)
@@ -0,0 +1,158 @@
+# GuiFramework/utilities/file_ops/internal/_stat_cache.py
+# ATTENTION: This module is for internal use only
+
+import os
+import time
+import threading
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+_MISSING = None  # Cached result for paths that do not exist
+
+
+@dataclass
+class StatCacheStats:
+    """Counters of a stat cache, hits and misses count lookups while the cache is enabled."""
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _StatCache:
+    """Opt-in cache of os.stat results keyed by normalized path.
+
+    Entries expire after ttl seconds (never if ttl is None) and are dropped by explicit invalidation,
+    by FileOps' own write operations and, for watched directories, by watchdog file system events.
+    Nonexistent paths are cached as well so repeated existence checks stay cheap.
+    """
+
+    def __init__(self, max_entries: int = 100000) -> None:
+        self.enabled = False
+        self.ttl: Optional[float] = 1.0
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[Optional[os.stat_result], float]] = {}
+        self._lock = threading.Lock()
+        self._observers: Dict[str, object] = {}
+        self._hits = self._misses = self._invalidations = 0
+        self._generation = 0  # Bumped by every invalidation so a stat that raced one is not stored
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def enable(self, ttl: Optional[float] = 1.0) -> None:
+        with self._lock:
+            self.ttl = ttl
+            self.enabled = True
+
+    def disable(self) -> None:
+        self.unwatch_all()
+        with self._lock:
+            self.enabled = False
+            self._entries.clear()
+
+    def stat(self, path: str, loader: Optional[Callable[[str], Optional[os.stat_result]]] = None) -> Optional[os.stat_result]:
+        """Return the stat result of path, or None if it does not exist; loader replaces os.stat on a miss."""
+        loader = loader or self._stat
+        if not self.enabled:
+            return loader(path)
+        key = self.normalize(path)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and (cached[1] is None or cached[1] > now):
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+            generation = self._generation
+        result = loader(path)
+        expires_at = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            if self.enabled and generation == self._generation:
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = (result, expires_at)
+        return result
+
+    @staticmethod
+    def _stat(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return _MISSING
+
+    def invalidate(self, *paths: str, recursive: bool = False) -> None:
+        """Drop the entries of paths and their parent directories, with recursive=True also everything below them."""
+        if not self.enabled:
+            return
+        keys: List[str] = []
+        for path in paths:
+            key = self.normalize(path)
+            keys.append(key)
+            keys.append(os.path.dirname(key))
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+            if recursive:
+                prefixes = tuple(self.normalize(path).rstrip(os.sep) + os.sep for path in paths)
+                stale = [key for key in self._entries if key.startswith(prefixes)]
+                for key in stale:
+                    del self._entries[key]
+                self._invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def get_stats(self) -> StatCacheStats:
+        with self._lock:
+            return StatCacheStats(self._hits, self._misses, self._invalidations, len(self._entries))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._invalidations = 0
+
+    def watch(self, directory: str) -> bool:
+        """Invalidate entries below directory on file system events, return False if watchdog is unavailable."""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            print("Stat cache invalidation by file system events requires the watchdog package")
+            return False
+
+        cache = self
+
+        class _InvalidationHandler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                paths = [event.src_path] + ([event.dest_path] if getattr(event, "dest_path", "") else [])
+                cache.invalidate(*paths, recursive=event.is_directory)
+
+        key = self.normalize(directory)
+        if key in self._observers:
+            return True
+        observer = Observer()
+        observer.schedule(_InvalidationHandler(), directory, recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observers[key] = observer
+        return True
+
+    def unwatch_all(self) -> None:
+        observers, self._observers = self._observers, {}
+        for observer in observers.values():
+            observer.stop()
+        for observer in observers.values():
+            observer.join()
@@ -0,0 +1,176 @@
+# GuiFramework/utilities/file_ops/internal/_tombstone_remover.py
+# ATTENTION: This module is for internal use only
+
+import os
+import sys
+import uuid
+import shutil
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+TOMBSTONE_PREFIX = ".fileops-tombstone-"
+
+
+def is_tombstone(name: str) -> bool:
+    return name.startswith(TOMBSTONE_PREFIX)
+
+
+def new_tombstone_path(path: str) -> str:
+    """Return an unused sibling path for path, the rename to it stays on the same file system."""
+    path = os.path.abspath(path)
+    return os.path.join(os.path.dirname(path), f"{TOMBSTONE_PREFIX}{os.path.basename(path)}-{uuid.uuid4().hex}")
+
+
+class _Removal:
+    """Tracks the parallel removal of one tombstone and resolves its future when the last part is gone."""
+
+    def __init__(self, tombstone: str) -> None:
+        self.tombstone = tombstone
+        self.future: Future = Future()
+        self.errors: List[OSError] = []
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self._pending += count
+
+    def part_done(self, error: Optional[OSError] = None) -> None:
+        with self._lock:
+            if error is not None:
+                self.errors.append(error)
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self._finish()
+
+    def _finish(self) -> None:
+        try:
+            os.rmdir(self.tombstone)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.errors.append(e)
+        if self.errors:
+            self.future.set_exception(self.errors[0])
+        else:
+            self.future.set_result(self.tombstone)
+
+
+class _TombstoneRemover:
+    """Deletes directories by renaming them to a tombstone and removing it on a background thread pool.
+
+    The rename is atomic, so the original path is free as soon as bury returns. The subdirectories of
+    a tombstone are removed in parallel. Tombstones left behind by an earlier run that was killed are
+    removed the first time a directory next to them is buried, or with remove_stale.
+    """
+
+    def __init__(self, workers: int = 4) -> None:
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._checked_parents = set()
+        self._live = set()  # Tombstones of this process, remove_stale leaves them to their own removal
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="FileOpsTombstone")
+            return self._executor
+
+    def bury(self, path: str) -> Future:
+        """Rename the directory at path to a tombstone and return a future for its removal."""
+        tombstone = self._new_tombstone(path)
+        try:
+            os.rename(path, tombstone)
+        except OSError:
+            self._discard(tombstone)
+            raise
+        self._remove_stale_once(os.path.dirname(tombstone))
+        return self.remove(tombstone)
+
+    def bury_contents(self, directory: str) -> Future:
+        """Move the entries of directory into a tombstone, leaving the directory itself in place and empty."""
+        tombstone = self._new_tombstone(directory)
+        try:
+            os.mkdir(tombstone)
+        except OSError:
+            self._discard(tombstone)
+            raise
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    os.rename(entry.path, os.path.join(tombstone, entry.name))
+        finally:
+            self._remove_stale_once(os.path.dirname(tombstone))
+            future = self.remove(tombstone)
+        return future
+
+    def remove(self, tombstone: str) -> Future:
+        """Remove a tombstone in the background and return a future that resolves once it is gone."""
+        removal = _Removal(tombstone)
+        removal.add(1)
+        removal.future.add_done_callback(lambda _: self._discard(tombstone))
+        self._get_executor().submit(self._remove_top_level, removal)
+        return removal.future
+
+    def _new_tombstone(self, path: str) -> str:
+        tombstone = new_tombstone_path(path)
+        with self._lock:
+            self._live.add(tombstone)
+        return tombstone
+
+    def _discard(self, tombstone: str) -> None:
+        with self._lock:
+            self._live.discard(tombstone)
+
+    def remove_stale(self, directory: str) -> List[Future]:
+        """Remove the tombstones found directly in directory."""
+        try:
+            with os.scandir(directory) as iterator:
+                found = [os.path.abspath(entry.path) for entry in iterator if is_tombstone(entry.name)]
+        except OSError:
+            return []
+        with self._lock:
+            stale = [tombstone for tombstone in found if tombstone not in self._live]
+            self._live.update(stale)
+        return [self.remove(tombstone) for tombstone in stale]
+
+    def _remove_stale_once(self, parent: str) -> None:
+        with self._lock:
+            if parent in self._checked_parents:
+                return
+            self._checked_parents.add(parent)
+        self.remove_stale(parent)
+
+    def _remove_top_level(self, removal: _Removal) -> None:
+        """Delete the files of the tombstone and hand each subdirectory to its own worker."""
+        error = None
+        try:
+            subdirectories = []
+            with os.scandir(removal.tombstone) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    else:
+                        os.remove(entry.path)
+            removal.add(len(subdirectories))
+            executor = self._get_executor()
+            for subdirectory in subdirectories:
+                executor.submit(self._remove_subtree, removal, subdirectory)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            error = e
+        removal.part_done(error)
+
+    @staticmethod
+    def _remove_subtree(removal: _Removal, path: str) -> None:
+        errors: List[OSError] = []
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=lambda function, failed_path, error: errors.append(error))
+        else:  # onerror is deprecated since 3.12
+            shutil.rmtree(path, onerror=lambda function, failed_path, exc_info: errors.append(exc_info[1]))
+        removal.part_done(errors[0] if errors else None)
@@ -0,0 +1,167 @@
+# GuiFramework/utilities/file_ops/internal/_tree_scanner.py
+# ATTENTION: This module is for internal use only
+
+import os
+import queue
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+
+from ._path_matcher import PathMatcher
+from ._tombstone_remover import is_tombstone
+
+_DONE = object()
+
+
+class ScanEntry:
+    """Lightweight record for a scanned file or directory.
+
+    The file type comes from the directory listing and stat() reuses the result cached by os.DirEntry,
+    so neither costs an extra system call on platforms that report them while listing.
+    """
+    __slots__ = ("path", "name", "relative_path", "depth", "is_dir", "is_file", "is_symlink", "_entry")
+
+    def __init__(self, entry: os.DirEntry, relative_path: str, depth: int) -> None:
+        self.path: str = entry.path
+        self.name: str = entry.name
+        self.relative_path: str = relative_path  # Relative to the scan root, '/'-separated
+        self.depth: int = depth
+        self.is_symlink: bool = entry.is_symlink()
+        try:
+            self.is_dir: bool = entry.is_dir()
+            self.is_file: bool = entry.is_file()
+        except OSError:
+            self.is_dir = self.is_file = False
+        self._entry = entry
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        """Return the cached stat result of the entry."""
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def __repr__(self) -> str:
+        return f"ScanEntry({self.path!r}, depth={self.depth}, is_dir={self.is_dir})"
+
+
+class _TreeScanner:
+    """Recursive os.scandir walker with depth limits, pruning and optional parallel fan-out."""
+
+    def __init__(self, root: str, max_depth: Optional[int] = None, prune: Optional[Callable[[ScanEntry], bool]] = None,
+                 follow_symlinks: bool = False, workers: Optional[int] = None, on_error: Optional[Callable[[OSError], None]] = None,
+                 matcher: Optional[PathMatcher] = None) -> None:
+        self.root = root
+        self.max_depth = max_depth
+        self.prune = prune
+        self.follow_symlinks = follow_symlinks
+        self.workers = workers if workers is not None else min(32, (os.cpu_count() or 1) + 4)
+        self.on_error = on_error
+        self.matcher = matcher
+
+    def __iter__(self) -> Iterator[ScanEntry]:
+        # Errors on the root surface to the caller, errors below it go to on_error like os.walk
+        root_entries, subdirectories = self._scan_directory(self.root, "", 0)
+        if self.workers <= 1 or not subdirectories:
+            return self._iter_sequential(root_entries, subdirectories)
+        return self._iter_parallel(root_entries, subdirectories)
+
+    def _should_descend(self, entry: ScanEntry) -> bool:
+        """Return True if the scanner should recurse into entry."""
+        if not entry.is_dir or (entry.is_symlink and not self.follow_symlinks):
+            return False
+        if self.max_depth is not None and entry.depth >= self.max_depth:
+            return False
+        return not (self.prune and self.prune(entry))
+
+    def _scan_directory(self, path: str, relative_path: str, depth: int):
+        """List one directory, return the entries to yield and the subdirectories to descend into.
+
+        Directories rejected by the matcher's exclude rules are dropped together with their subtree,
+        entries the include patterns reject are still descended into but not yielded. Tombstones of
+        background deletions are skipped, their content counts as deleted already.
+        """
+        entries: List[ScanEntry] = []
+        subdirectories: List[ScanEntry] = []
+        matcher = self.matcher
+        prefix = relative_path + "/" if relative_path else ""
+        with os.scandir(path) as iterator:
+            for dir_entry in iterator:
+                if is_tombstone(dir_entry.name):
+                    continue
+                entry = ScanEntry(dir_entry, prefix + dir_entry.name, depth)
+                if matcher is None:
+                    entries.append(entry)
+                elif matcher.is_excluded(entry.relative_path, entry.is_dir):
+                    continue
+                elif matcher.is_included(entry.relative_path, entry.is_dir):
+                    entries.append(entry)
+                if self._should_descend(entry):
+                    subdirectories.append(entry)
+        return entries, subdirectories
+
+    def _handle_error(self, error: OSError) -> None:
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _iter_sequential(self, root_entries: List[ScanEntry], subdirectories: List[ScanEntry]) -> Iterator[ScanEntry]:
+        """Depth-first walk in the calling thread."""
+        yield from root_entries
+        stack = list(reversed(subdirectories))
+        while stack:
+            directory = stack.pop()
+            try:
+                entries, children = self._scan_directory(directory.path, directory.relative_path, directory.depth + 1)
+            except OSError as e:
+                self._handle_error(e)
+                continue
+            yield from entries
+            stack.extend(reversed(children))
+
+    def _iter_parallel(self, root_entries: List[ScanEntry], subdirectories: List[ScanEntry]) -> Iterator[ScanEntry]:
+        """Scan subdirectories on a thread pool and yield their entries as they arrive."""
+        results: "queue.SimpleQueue" = queue.SimpleQueue()
+        stop = threading.Event()
+        pending_lock = threading.Lock()
+        pending = [len(subdirectories)]
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="FileOpsScan")
+
+        def scan(directory: ScanEntry) -> None:
+            try:
+                if stop.is_set():
+                    return
+                try:
+                    entries, children = self._scan_directory(directory.path, directory.relative_path, directory.depth + 1)
+                except Exception as e:
+                    results.put(e)
+                    return
+                with pending_lock:
+                    pending[0] += len(children)
+                try:
+                    for child in children:
+                        executor.submit(scan, child)
+                except RuntimeError:
+                    return  # The consumer stopped and shut the pool down
+                results.put(entries)
+            finally:
+                with pending_lock:
+                    pending[0] -= 1
+                    finished = pending[0] == 0
+                if finished:
+                    results.put(_DONE)
+
+        try:
+            for directory in subdirectories:
+                executor.submit(scan, directory)
+            yield from root_entries
+            while True:
+                batch = results.get()
+                if batch is _DONE:
+                    break
+                if isinstance(batch, OSError):
+                    self._handle_error(batch)
+                    continue
+                if isinstance(batch, Exception):
+                    raise batch
+                yield from batch
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -5,6 +5,7 @@ import shutil
 import zipfile
 
 from GuiFramework.utilities.logging import Logger
+from GuiFramework.utilities.file_ops import FileOps
 
 
 class CopyType:
@@ -24,27 +25,51 @@ class ProjectArchiver:
         self.logger = Logger.get_logger("GuiFramework")
 
     def move_files_to_temp_folder(self):
-        """Move files and folders to a temporary folder."""
+        """Move files and folders to a temporary folder.
+
+        The temporary folder is synced instead of rebuilt, so repeated runs only copy what changed.
+        """
         os.makedirs(self.temp_folder, exist_ok=True)
-        for root, dirs, files in os.walk(self.temp_folder, topdown=False):
-            for file in files:
-                os.remove(os.path.join(root, file))
-            for dir in dirs:
-                shutil.rmtree(os.path.join(root, dir))
+        dest_names = {os.path.basename(file_folder) for file_folder in self.files_folders}
+        for entry in os.scandir(self.temp_folder):
+            if entry.name not in dest_names:
+                self._remove_path(entry.path)
         for file_folder, copy_type in self.files_folders.items():
             dest_path = os.path.join(self.temp_folder, os.path.basename(file_folder))
             if os.path.isdir(file_folder):
                 if copy_type == CopyType.ROOT_FOLDER:
-                    os.makedirs(dest_path, exist_ok=True)
+                    self._reset_directory(dest_path)
                 elif copy_type == CopyType.FOLDERS_ONLY:
+                    self._reset_directory(dest_path)
                     for root, dirs, _ in os.walk(file_folder):
                         for dir in dirs:
                             os.makedirs(os.path.join(dest_path, dir), exist_ok=True)
                 elif copy_type == CopyType.ALL:
-                    shutil.copytree(file_folder, dest_path, dirs_exist_ok=True)
+                    if os.path.isfile(dest_path):
+                        os.remove(dest_path)
+                    report = FileOps.sync_directory(file_folder, dest_path, delete_extraneous=True)
+                    for path, error in report.failed.items():
+                        self.logger.log_error(f"Failed to copy {path}: {error}", "ProjectArchiver")
             elif os.path.isfile(file_folder) and copy_type == CopyType.FILE:
+                if os.path.isdir(dest_path):
+                    shutil.rmtree(dest_path)
                 shutil.copy(file_folder, dest_path)
 
+    @staticmethod
+    def _remove_path(path):
+        """Remove a file or a directory tree."""
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+    @staticmethod
+    def _reset_directory(path):
+        """Make path an empty directory."""
+        if os.path.lexists(path):
+            ProjectArchiver._remove_path(path)
+        os.makedirs(path)
+
     def create_zip_archive(self):
         """Create a zip archive of the files and folders in the temporary folder."""
         zip_path = os.path.join(self.output_dir, f"{self.zip_name}.zip")